@@ -29,15 +29,17 @@
 __all__ = [
     '__version__',
     'Configuration', 'Category', 'Parameter', 'configuration', 'category',
-    'BOOL', 'Array', 'ARRAY', 'PType',
-    'Configurable', 'applyconfiguration',
-    'ConfDriver'
+    'BOOL', 'Array', 'ARRAY', 'PType', 'NumArray',
+    'Configurable', 'applyconfiguration', 'ConfCache', 'preload',
+    'ConfDriver', 'Provenance', 'Projection'
 ]
 
 from .version import __version__
-from .configurable import Configurable, applyconfiguration
+from .configurable import (
+    Configurable, applyconfiguration, ConfCache, preload
+)
 from .model import (
     Configuration, Category, Parameter, configuration, category, BOOL,
-    Array, ARRAY, PType
+    Array, ARRAY, PType, NumArray
 )
-from .driver import ConfDriver
+from .driver import ConfDriver, Provenance, Projection
@@ -25,6 +25,8 @@
 # --------------------------------------------------------------------
 
 
-__all__ = ['Configurable', 'applyconfiguration']
+__all__ = ['Configurable', 'applyconfiguration', 'ConfCache', 'preload']
 
 from .core import Configurable, applyconfiguration
+from .cache import ConfCache
+from .preload import preload
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Persistent cache of resolved configurations.
+
+A configuration cache stores a resolved configuration in one file, with a key
+calculated from the library version, resource paths and their stat
+signatures, and the base configuration. At start, the key is calculated
+again (without reading resources) and if it matches, the resolved
+configuration is loaded with one read and unpickling.
+
+Cached values and parameter properties (ptype, parser, serializer and scope)
+must be picklable. Otherwise, the configuration is not cached.
+
+Resolved values which depend on a variable execution context (environment
+variables, date, etc.) are not detected by the cache key.
+
+.. warning::
+
+    Loading a cache executes code, since it is unpickled. Anyone who can write
+    the cache file can execute code in processes which load it. Therefore, a
+    cache file is written only readable and writable by its owner, and it is
+    ignored if it is not owned by the current user (or root) or if it is
+    writable by other users. Do not put caches in directories where other
+    users can replace files.
+"""
+
+__all__ = ['ConfCache']
+
+from hashlib import sha1
+
+from os import stat, remove
+from os.path import exists
+from stat import S_IWGRP, S_IWOTH
+
+try:
+    from os import getuid
+
+except ImportError:  # windows
+    getuid = None
+
+from six import text_type
+from six.moves.cPickle import dumps, loads, HIGHEST_PROTOCOL
+
+from traceback import format_exc
+
+from ..model.conf import Configuration
+from ..model.cat import Category
+from ..model.param import Parameter
+from ..driver.file.base import atomicopen
+from ..version import __version__
+
+
+def _digestconf(conf, digest):
+    """Update a digest with a stable representation of a configuration.
+
+    Values are represented with repr, therefore values without a stable
+    representation produce different digests from a process to another."""
+
+    for category in conf.values():
+
+        digest.update(_encode(repr((category.name, category.local))))
+
+        for param in category.values():
+
+            name = getattr(param.name, 'pattern', param.name)
+            svalue = param._svalue
+            value = repr(param._value) if svalue is None else None
+
+            digest.update(_encode(repr((name, svalue, value, param.local))))
+
+
+def _encode(value):
+    """Encode a text value to bytes."""
+
+    if isinstance(value, text_type):
+        value = value.encode('utf-8')
+
+    return value
+
+
+class ConfCache(object):
+    """Persistent cache of a resolved configuration in one file."""
+
+    FORMAT = 2  #: cache encoding format version.
+
+    PERMS = 0o600  #: cache file permissions.
+
+    def __init__(self, path, protocol=HIGHEST_PROTOCOL, *args, **kwargs):
+        """
+        :param str path: cache file path.
+        :param int protocol: pickle protocol. Default is the highest one.
+        """
+
+        super(ConfCache, self).__init__(*args, **kwargs)
+
+        self.path = path
+        self.protocol = protocol
+
+    def key(self, paths, drivers, confs=(), *args):
+        """Calculate a cache key.
+
+        :param list paths: configuration paths.
+        :param list drivers: configuration drivers.
+        :param list confs: base configurations.
+        :param tuple args: additional values which change resolved values
+            (scope, safe, etc.).
+        :rtype: str"""
+
+        digest = sha1()
+
+        digest.update(_encode(repr((__version__, ConfCache.FORMAT))))
+
+        for path in paths:
+
+            for driver in drivers:
+
+                digest.update(_encode(repr((path, type(driver).__name__))))
+
+                for rscpath in driver.rscpaths(path):
+
+                    try:
+                        stats = stat(rscpath)
+
+                    except (OSError, IOError, TypeError, ValueError):
+                        # not a file path (content, etc.)
+                        signature = rscpath
+
+                    else:
+                        signature = (
+                            rscpath, stats.st_mtime, stats.st_size,
+                            stats.st_ino
+                        )
+
+                    digest.update(_encode(repr(signature)))
+
+        for conf in confs:
+            if conf is not None:
+                _digestconf(conf, digest)
+
+        digest.update(_encode(repr(args)))
+
+        return digest.hexdigest()
+
+    def get(self, key, logger=None):
+        """Get the cached configuration if it matches input key.
+
+        :param str key: cache key (see the method key).
+        :param Logger logger: logger to use.
+        :return: resolved configuration or None if there is no valid cache.
+        :rtype: Configuration"""
+
+        result = None
+
+        if exists(self.path):
+
+            try:
+                self._checkowner()
+
+                with open(self.path, 'rb') as handle:
+                    content = handle.read()
+
+                ckey, data = loads(content)
+
+                if ckey == key:
+                    result = self._decode(data)
+
+            except Exception:
+                if logger is not None:
+                    logger.warning(
+                        'Error while loading cache {0}: {1}'.format(
+                            self.path, format_exc()
+                        )
+                    )
+
+        return result
+
+    def set(self, key, conf, logger=None):
+        """Cache a resolved configuration.
+
+        :param str key: cache key (see the method key).
+        :param Configuration conf: resolved configuration.
+        :param Logger logger: logger to use.
+        :return: True iif the configuration has been cached.
+        :rtype: bool"""
+
+        result = False
+
+        try:
+            content = dumps((key, self._encode(conf)), self.protocol)
+
+        except Exception:
+            if logger is not None:
+                logger.warning(
+                    'Impossible to cache {0}: {1}'.format(conf, format_exc())
+                )
+
+        else:
+            try:  # concurrent writers replace the file atomically
+                with atomicopen(self.path, 'wb', perms=self.PERMS) as handle:
+                    handle.write(content)
+
+            except (OSError, IOError):
+                if logger is not None:
+                    logger.warning(
+                        'Error while writing cache {0}: {1}'.format(
+                            self.path, format_exc()
+                        )
+                    )
+
+            else:
+                result = True
+
+        return result
+
+    def _checkowner(self):
+        """Check that the cache file can not be written by another user.
+
+        :raises: IOError if the file is not owned by the current user (or
+            root) or if it is writable by other users."""
+
+        if getuid is not None:
+
+            stats = stat(self.path)
+
+            if stats.st_uid not in (getuid(), 0):
+                raise IOError(
+                    '{0} is owned by another user.'.format(self.path)
+                )
+
+            if stats.st_mode & (S_IWGRP | S_IWOTH):
+                raise IOError(
+                    '{0} is writable by other users.'.format(self.path)
+                )
+
+    def clear(self):
+        """Remove the cache file."""
+
+        if exists(self.path):
+            remove(self.path)
+
+    @staticmethod
+    def _encode(conf):
+        """Encode a resolved configuration to a tuple of builtin values.
+
+        :rtype: tuple"""
+
+        categories = []
+
+        for category in conf.values():
+
+            params = []
+
+            for param in category.values():
+
+                error = param.error
+
+                params.append(
+                    (
+                        param.name, param._svalue, param._value, param.local,
+                        None if error is None else str(error), param.ptype,
+                        param.parser, param.serializer, param.scope,
+                        param.safe, param.besteffort
+                    )
+                )
+
+            categories.append((category.name, category.local, params))
+
+        return conf.safe, conf.besteffort, categories
+
+    @staticmethod
+    def _decode(data):
+        """Decode a configuration encoded with the method _encode.
+
+        :rtype: Configuration"""
+
+        safe, besteffort, categories = data
+
+        result = Configuration(safe=safe, besteffort=besteffort)
+
+        for cname, clocal, params in categories:
+
+            category = Category(name=cname, local=clocal)
+
+            for (
+                    name, svalue, value, local, error, ptype, parser,
+                    serializer, scope, safe, besteffort
+            ) in params:
+
+                if error is not None:
+                    error = Parameter.Error(error)
+
+                category[name] = Parameter(
+                    name=name, svalue=svalue, value=value, local=local,
+                    error=error, ptype=ptype, parser=parser,
+                    serializer=serializer, scope=scope, safe=safe,
+                    besteffort=besteffort
+                )
+
+            result[cname] = category
+
+        return result
@@ -42,10 +42,13 @@ from b3j0f.annotation import PrivateInterceptor, Annotation
 from ..model.conf import Configuration, configuration
 from ..model.cat import Category, category
 from ..model.param import Parameter, Array
+from ..model.base import _hash
 from ..driver.base import ConfDriver
+from ..driver.projection import Projection
 from ..driver.file.json import JSONFileConfDriver
 from ..driver.file.ini import INIFileConfDriver
 from ..driver.file.xml import XMLFileConfDriver
+from .cache import ConfCache
 from ..parser.resolver.core import (
     DEFAULT_SAFE, DEFAULT_SCOPE, DEFAULT_BESTEFFORT
 )
@@ -54,6 +57,10 @@ from random import random
 
 from types import ModuleType
 
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from itertools import count
+
 
 class Configurable(PrivateInterceptor):
     """Handle object configuration from configuration resources such as files.
@@ -133,6 +140,8 @@ class Configurable(PrivateInterceptor):
     CALLPARAMS = 'callparams'  #: call params attribute name.
     KEEPSTATE = 'keepstate'  #: reconfiguration keepstate level attribute name.
     DECOSUB = 'decosub'  #: decorate sub elment attribute name
+    INCREMENTAL = 'incremental'  #: incremental attribute name.
+    CACHE = 'cache'  #: cache attribute name.
 
     LOADED_MODULES = '_loadedmodules'  #: attribute for loaded modules.
 
@@ -155,9 +164,14 @@ class Configurable(PrivateInterceptor):
     DEFAULT_CONF = None  #: default conf value.
     DEFAULT_TARGETS = None  #: default targets value.
     DEFAULT_DECOSUB = True  #: default decosub value.
+    DEFAULT_INCREMENTAL = False  #: default incremental value.
+    DEFAULT_CACHE = None  #: default cache value.
 
     SUB_CONF_PREFIX = ':'  #: sub conf prefix.
 
+    _INSTANCES = WeakValueDictionary()  #: living configurables by creation id.
+    _COUNTER = count()  #: creation id generator.
+
     def __init__(
             self,
             conf=DEFAULT_CONF, paths=DEFAULT_PATHS, drivers=DEFAULT_DRIVERS,
@@ -167,6 +181,7 @@ class Configurable(PrivateInterceptor):
             besteffort=DEFAULT_BESTEFFORT,
             modules=DEFAULT_MODULES, rel=DEFAULT_RELOAD,
             callparams=DEFAULT_CALLPARAMS, decosub=DEFAULT_DECOSUB, logger=None,
+            incremental=DEFAULT_INCREMENTAL, cache=DEFAULT_CACHE,
             *args, **kwargs
     ):
         """
@@ -197,7 +212,14 @@ class Configurable(PrivateInterceptor):
             configured callable function.
         :param bool decosub: if True (default), decorate elements created by
             decorated types.
-        :param Logger logger: this logger."""
+        :param Logger logger: this logger.
+        :param bool incremental: if True (False by default), do not configure
+            targets if the configuration fingerprint did not change since
+            their last configuration, and configure only changed parameters
+            otherwise. Such configuration should not depend on a variable
+            execution context (environment variables, etc.).
+        :param ConfCache cache: persistent cache of resolved configurations
+            used by the method applyconfiguration. Default is None."""
 
         super(Configurable, self).__init__(*args, **kwargs)
 
@@ -207,6 +229,8 @@ class Configurable(PrivateInterceptor):
         self._targets = []
         self._modules = [] if modules is None else modules
         self._loadedmodules = set()
+        # last (conf fingerprint, resolved state, resolution context) by target
+        self._configured = WeakKeyDictionary()
 
         # init public attributes
 
@@ -226,12 +250,30 @@ class Configurable(PrivateInterceptor):
         self.logger = logger
         self.decosub = decosub
         self.rel = rel
+        self.incremental = incremental
+        self.cache = cache
 
         # generate an execution context name
         self.exec_ctx = '{0}{1}'.format(Configurable.EXEC_CTX, random())
 
         self.autoconf = autoconf  # end of dirty hack
 
+        Configurable._INSTANCES[next(Configurable._COUNTER)] = self
+
+    @staticmethod
+    def instances():
+        """Get living configurables in creation order.
+
+        :rtype: list"""
+
+        instances = Configurable._INSTANCES
+
+        return [
+            instance for instance in (
+                instances.get(key) for key in sorted(list(instances.keys()))
+            ) if instance is not None
+        ]
+
     def _interception(self, joinpoint):
 
         target = joinpoint.target
@@ -558,28 +600,77 @@ class Configurable(PrivateInterceptor):
         if keepstate is None:
             keepstate = self.keepstate
 
-        # get conf from drivers and paths
-        conf = self.getconf(
-            conf=conf, paths=paths, logger=logger, drivers=drivers,
-            modules=modules
-        )
-        if conf is not None:
-            # resolve all values
-            conf.resolve(
-                configurable=self, scope=scope, safe=safe, besteffort=besteffort
+        cache = self.cache
+        resolved = False  # True if conf is already resolved
+
+        if cache is not None:  # try to get a resolved conf from the cache
+
+            cachepaths = self.paths if paths is None else paths
+
+            if isinstance(cachepaths, string_types):
+                cachepaths = [cachepaths]
+
+            cachekey = cache.key(
+                cachepaths, self.drivers if drivers is None else drivers,
+                (self.conf, self._toconf(conf)), scope, safe, besteffort,
+                self.foreigns
             )
-            # configure resolved configuration
-            configured = self.configure(
-                conf=conf, targets=targets, callconf=callconf,
-                keepstate=keepstate, modules=modules
+            cachedconf = cache.get(key=cachekey, logger=logger)
+
+            if cachedconf is not None:
+                conf, resolved = cachedconf, True
+
+        if not resolved:
+            # get conf from drivers and paths
+            conf = self.getconf(
+                conf=conf, paths=paths, logger=logger, drivers=drivers,
+                modules=modules
             )
 
+        if conf is not None:
+
+            configured = None
+
+            # resolution context of incremental configurations
+            context = _hash((scope, safe, besteffort, self.foreigns))
+
+            if self.incremental and not callconf:
+                # skip resolution if targets are already configured with the
+                # same configuration and resolution context
+                fingerprint = conf.fingerprint()
+
+                if all(
+                        self._getconfigured(target)[0::2] ==
+                        (fingerprint, context)
+                        for target in targets
+                ):
+                    configured = list(targets)
+
+            if configured is None:
+
+                if not resolved:
+                    # resolve all values
+                    conf.resolve(
+                        configurable=self, scope=scope, safe=safe,
+                        besteffort=besteffort
+                    )
+
+                    if cache is not None:
+                        cache.set(key=cachekey, conf=conf, logger=logger)
+
+                # configure resolved configuration
+                configured = self.configure(
+                    conf=conf, targets=targets, callconf=callconf,
+                    keepstate=keepstate, modules=modules, context=context
+                )
+
             result += configured
 
         return result
 
     def getconf(
-            self, conf=None, paths=None, drivers=None, logger=None, modules=None
+            self, conf=None, paths=None, drivers=None, logger=None, modules=None,
+            provenance=None, lazy=False
     ):
         """Get a configuration from paths.
 
@@ -589,7 +680,14 @@ class Configurable(PrivateInterceptor):
         :param Logger logger: logger to use for logging info/error messages.
         :param list drivers: ConfDriver to use. Default this drivers.
         :param list modules: modules to reload before.
-        :return: not resolved configuration.
+        :param Provenance provenance: provenance to fill with resource
+            configurations. Its base is set to the conf to update if not given.
+        :param bool lazy: if True (False by default), parameters of
+            categories which are not in the conf to update are materialized
+            when they are accessed.
+        :return: not resolved configuration. If this foreigns is False,
+            drivers get only categories and parameters of the conf to update,
+            and sub configurable categories.
         :rtype: Configuration
         """
 
@@ -621,6 +719,24 @@ class Configurable(PrivateInterceptor):
         if logger is None:
             logger = self.logger
 
+        kwargs = {}
+
+        if lazy:
+            kwargs['lazy'] = lazy
+
+        if not self.foreigns:  # get only parameters of conf
+            kwargs['projection'] = Projection.fromconf(
+                conf, prefixes=(Configurable.SUB_CONF_PREFIX,)
+            )
+
+        if provenance is not None:
+            kwargs['provenance'] = provenance
+
+            if provenance.base is None:
+                provenance.base = conf.copy()
+
+            provenance.projection = kwargs.get('projection')
+
         # iterate on all paths
         for path in paths:
 
@@ -628,7 +744,9 @@ class Configurable(PrivateInterceptor):
 
             for driver in drivers:  # find the best driver
 
-                rscconf = driver.getconf(path=path, conf=conf, logger=logger)
+                rscconf = driver.getconf(
+                    path=path, conf=conf, logger=logger, **kwargs
+                )
 
                 if rscconf is None:
                     continue
@@ -650,7 +768,7 @@ class Configurable(PrivateInterceptor):
 
     def configure(
             self, conf=None, targets=None, logger=None, callconf=False,
-            keepstate=None, modules=None
+            keepstate=None, modules=None, context=None
     ):
         """Apply input conf on targets objects.
 
@@ -665,6 +783,9 @@ class Configurable(PrivateInterceptor):
         :param bool keepstate: if True (default), do not instanciate sub objects
             if they already exist.
         :param list modules: modules to reload before.
+        :param int context: hash of the conf resolution context (scope, safe,
+            etc.). In incremental mode, targets are fully reconfigured if it
+            changes. Default is the last context of each target.
         :return: configured targets.
         :rtype: list
         :raises: Parameter.Error for any raised exception.
@@ -689,12 +810,38 @@ class Configurable(PrivateInterceptor):
         if keepstate is None:
             keepstate = self.keepstate
 
+        incremental = self.incremental and not callconf
+
+        if incremental:
+            fingerprint = conf.fingerprint()
+            # resolved values for next diffs
+            state = self._resolvedstate(conf)
+
         for target in targets:
 
+            changed = None  # names of parameters to configure
+
+            if incremental:
+
+                lastfingerprint, laststate, lastcontext = self._getconfigured(
+                    target
+                )
+
+                samecontext = context is None or context == lastcontext
+
+                if lastfingerprint == fingerprint and samecontext:
+                    result.append(target)
+                    continue
+
+                elif laststate is not None and samecontext:
+                    changed = self._changednames(
+                        self._statediff(state, laststate)
+                    )
+
             try:
                 configured = self._configure(
                     conf=conf, logger=logger, target=target, callconf=callconf,
-                    keepstate=keepstate, modules=modules
+                    keepstate=keepstate, modules=modules, changed=changed
                 )
 
             except Exception:
@@ -708,11 +855,131 @@ class Configurable(PrivateInterceptor):
             else:
                 result.append(configured)
 
+                if incremental:
+                    self._setconfigured(
+                        target, fingerprint, state,
+                        lastcontext if context is None else context
+                    )
+
+        return result
+
+    def _getconfigured(self, target):
+        """Get the last configuration fingerprint of input target, its
+        resolved state (see _resolvedstate) and its resolution context.
+
+        :return: last configuration fingerprint, state and context, or
+            (None, None, None) if target has not been configured or if it can
+            not be weak referenced.
+        :rtype: tuple"""
+
+        try:
+            result = self._configured.get(target, (None, None, None))
+
+        except TypeError:  # target is not weak referenceable
+            result = None, None, None
+
+        return result
+
+    def _setconfigured(self, target, fingerprint, state, context=None):
+        """Set the last configuration of input target.
+
+        :param target: configured target.
+        :param int fingerprint: configuration fingerprint.
+        :param dict state: configuration resolved state (see _resolvedstate).
+        :param int context: configuration resolution context."""
+
+        try:
+            self._configured[target] = fingerprint, state, context
+
+        except TypeError:  # target is not weak referenceable
+            pass
+
+    @staticmethod
+    def _resolvedstate(conf):
+        """Get fingerprints of resolved parameter values of input conf.
+
+        Contrary to parameter fingerprints, they change when a parameter
+        expression depends on a changed parameter or scope.
+
+        :return: value fingerprints by parameter name by category name.
+        :rtype: dict"""
+
+        return dict(
+            (
+                category.name,
+                dict(
+                    (pname, (type(param.value), _hash(param.value)))
+                    for pname, param in category.items()
+                )
+            )
+            for category in conf.values()
+        )
+
+    @staticmethod
+    def _statediff(state, laststate):
+        """Get differences between two resolved states.
+
+        :return: differences such as returned by Configuration.diff.
+        :rtype: dict"""
+
+        result = {}
+
+        for cname, params in state.items():
+
+            lastparams = laststate.get(cname, {})
+
+            added = [pname for pname in params if pname not in lastparams]
+            removed = [pname for pname in lastparams if pname not in params]
+            changed = [
+                pname for pname in params
+                if pname in lastparams and params[pname] != lastparams[pname]
+            ]
+
+            if added or removed or changed:
+                result[cname] = {
+                    Configuration.ADDED: added,
+                    Configuration.REMOVED: removed,
+                    Configuration.CHANGED: changed
+                }
+
+        for cname, lastparams in laststate.items():
+
+            if cname not in state and lastparams:
+                result[cname] = {
+                    Configuration.ADDED: [],
+                    Configuration.REMOVED: list(lastparams),
+                    Configuration.CHANGED: []
+                }
+
+        return result
+
+    @staticmethod
+    def _changednames(diff):
+        """Get names of parameters to configure from a configuration diff.
+
+        :param dict diff: configuration diff (see Configuration.diff).
+        :return: added and changed parameter names, and names of sub
+            configurables with a changed configuration.
+        :rtype: set"""
+
+        result = set()
+
+        sub_conf_prefix = Configurable.SUB_CONF_PREFIX
+
+        for cname, cdiff in diff.items():
+
+            if cname.startswith(sub_conf_prefix):
+                result.add(cname.split(sub_conf_prefix)[1])
+
+            else:
+                result.update(cdiff[Configuration.ADDED])
+                result.update(cdiff[Configuration.CHANGED])
+
         return result
 
     def _configure(
             self, target, conf=None, logger=None, callconf=None, keepstate=None,
-            modules=None
+            modules=None, changed=None
     ):
         """Configure this class with input conf only if auto_conf or
         configure is true.
@@ -727,6 +994,9 @@ class Configurable(PrivateInterceptor):
         :param bool keepstate: if True recreate sub objects if they already
             exist.
         :param list modules: modules to reload before.
+        :param set changed: names of parameters to configure. Default all.
+            Sub configurable objects are reconfigured only if their names are
+            given.
         :return: configured target.
         """
 
@@ -787,6 +1057,9 @@ class Configurable(PrivateInterceptor):
 
         for param in params:
 
+            if changed is not None and param.name not in changed:
+                continue
+
             value, pname = param.value, param.name
 
             if pname in subcats:  # if sub param
@@ -961,6 +1234,14 @@ _CONF = configuration(
         Parameter(
             name=Configurable.KEEPSTATE, ptype=bool,
             value=Configurable.DEFAULT_KEEPSTATE
+        ),
+        Parameter(
+            name=Configurable.INCREMENTAL, ptype=bool,
+            value=Configurable.DEFAULT_INCREMENTAL
+        ),
+        Parameter(
+            name=Configurable.CACHE, ptype=ConfCache,
+            value=Configurable.DEFAULT_CACHE
         )
     )
 )
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+
+"""Configuration preloading for preforking processes.
+
+A preforking server loads and resolves configurations once in its master
+process before forking workers. Workers share the master memory pages
+copy-on-write until they write in them, and reading a python object writes
+its reference count or its garbage collector header.
+
+The function ``preload`` loads, resolves and applies configurations of all
+living configurables, interns their strings, and moves all tracked objects
+into the permanent garbage collector generation (``gc.freeze``, python 3.7+)
+in order to avoid collections to touch shared pages in workers.
+
+.. code-block:: python
+
+    from b3j0f.conf.configurable.preload import preload
+
+    preload()
+
+    for _ in range(workers):
+        if os.fork() == 0:
+            serve()
+"""
+
+__all__ = ['preload', 'compact']
+
+from gc import collect
+
+try:
+    from gc import freeze as _freeze
+
+except ImportError:  # python < 3.7
+    _freeze = None
+
+from six import text_type
+from six.moves import intern
+
+from .core import Configurable
+
+
+def _intern(value, strings):
+    """Intern input value if it is a string.
+
+    Python 2 can not intern unicode strings, therefore they are shared by
+    the strings dictionary instead.
+
+    :param value: value to intern.
+    :param dict strings: unicode strings by value.
+    :return: interned value."""
+
+    valuetype = type(value)
+
+    if valuetype is str:
+        value = intern(value)
+
+    elif valuetype is text_type:  # python 2 unicode
+        value = strings.setdefault(value, value)
+
+    return value
+
+
+def compact(conf):
+    """Compact a configuration in order to share it between processes.
+
+    Lazy categories are materialized, and category names, serialized values
+    and string values are interned (parameter names are already shared).
+    Python 2 unicode strings can not be interned and equal ones are only
+    shared inside conf.
+
+    :param Configuration conf: configuration to compact.
+    :return: conf.
+    :rtype: Configuration"""
+
+    strings = {}
+
+    for category in conf.values():
+
+        category.name = _intern(category.name, strings)
+
+        for param in category.values():  # materialize lazy parameters
+
+            # set slots in order to keep dirty flags
+            param._svalue = _intern(param._svalue, strings)
+            param._value = _intern(param._value, strings)
+
+    return conf
+
+
+def preload(configurables=None, freeze=True, logger=None):
+    """Load, resolve and apply configurations before forking processes.
+
+    :param list configurables: configurables to preload. Default are all
+        living configurables (see Configurable.instances).
+    :param bool freeze: if True (default), freeze garbage collector tracked
+        objects after a collection (only from python 3.7).
+    :param Logger logger: logger to use.
+    :return: configured targets.
+    :rtype: list"""
+
+    result = []
+
+    if configurables is None:
+        configurables = Configurable.instances()
+
+    for configurable in configurables:
+
+        conf = configurable.getconf(logger=logger)
+
+        conf.resolve(
+            configurable=configurable, scope=configurable.scope,
+            safe=configurable.safe, besteffort=configurable.besteffort
+        )
+
+        compact(conf)
+
+        result += configurable.configure(conf=conf, logger=logger)
+
+    collect()  # avoid to free unreachable objects in forked processes
+
+    if freeze and _freeze is not None:
+        _freeze()
+
+    return result
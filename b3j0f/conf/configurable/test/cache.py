@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Configuration cache UTs."""
+
+from unittest import main
+
+from b3j0f.utils.ut import UTCase
+
+from ..cache import ConfCache
+from ..core import Configurable
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter, Array, BOOL
+from ...driver.file.json import JSONFileConfDriver
+
+from json import dump
+
+from os import chmod, stat, listdir
+from os.path import exists, join
+from stat import S_IMODE
+
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+
+class ConfCacheTest(UTCase):
+    """Test the ConfCache class."""
+
+    def setUp(self):
+
+        self.dirpath = mkdtemp()
+        self.path = join(self.dirpath, 'test.json')
+        self.cache = ConfCache(join(self.dirpath, 'test.cache'))
+
+        self.driver = JSONFileConfDriver()
+        self.reads = []
+
+        pathresource = self.driver._pathresource
+
+        def _pathresource(rscpath):
+            self.reads.append(rscpath)
+            return pathresource(rscpath)
+
+        self.driver._pathresource = _pathresource
+
+        self._write({'A': {'a': '=1 + 1', 'b': 'b'}})
+
+        self.conf = configuration(category('A', Parameter('a', ptype=int)))
+
+    def tearDown(self):
+
+        rmtree(self.dirpath)
+
+    def _write(self, resource):
+        """Write a json resource."""
+
+        with open(self.path, 'w') as handle:
+            dump(resource, handle)
+
+    def _configurable(self):
+        """Get a new configurable which uses the cache."""
+
+        return Configurable(
+            conf=self.conf, paths=[self.path], drivers=[self.driver],
+            cache=self.cache, autoconf=False
+        )
+
+    def _apply(self):
+        """Apply a new configurable configuration on a new object."""
+
+        class Test(object):
+            pass
+
+        test = Test()
+
+        self._configurable().applyconfiguration(targets=[test])
+
+        return test
+
+    def test_cache(self):
+        """Test to get a configuration from the cache."""
+
+        test = self._apply()
+
+        self.assertEqual(test.a, 2)
+        self.assertEqual(test.b, 'b')
+        self.assertTrue(self.reads)
+        self.assertTrue(exists(self.cache.path))
+
+        del self.reads[:]
+
+        test = self._apply()
+
+        self.assertEqual(test.a, 2)
+        self.assertEqual(test.b, 'b')
+        self.assertFalse(self.reads)
+
+    def test_invalidation(self):
+        """Test to invalidate the cache when a resource changes."""
+
+        self._apply()
+
+        self._write({'A': {'a': '=2 + 20'}})
+
+        del self.reads[:]
+
+        test = self._apply()
+
+        self.assertTrue(self.reads)
+        self.assertEqual(test.a, 22)
+
+    def test_conf_invalidation(self):
+        """Test to invalidate the cache when the base conf changes."""
+
+        self._apply()
+
+        self.conf['A'] += Parameter('c', value=3)
+
+        test = self._apply()
+
+        self.assertEqual(test.c, 3)
+
+    def test_key(self):
+        """Test the method key."""
+
+        key = self.cache.key([self.path], [self.driver], [self.conf])
+
+        self.assertEqual(
+            key, self.cache.key([self.path], [self.driver], [self.conf])
+        )
+        self.assertNotEqual(
+            key, self.cache.key([self.path], [self.driver], [self.conf], True)
+        )
+
+    def test_unpicklable(self):
+        """Test to not cache unpicklable values."""
+
+        conf = configuration(category('A', Parameter('a', value=lambda: 1)))
+
+        self.assertFalse(self.cache.set(key='key', conf=conf))
+        self.assertFalse(exists(self.cache.path))
+
+    def test_corrupted(self):
+        """Test to ignore a corrupted cache."""
+
+        with open(self.cache.path, 'wb') as handle:
+            handle.write(b'corrupted')
+
+        self.assertIsNone(self.cache.get(key='key'))
+
+        self.cache.clear()
+
+        self.assertFalse(exists(self.cache.path))
+
+    def test_permissions(self):
+        """Test to write an owner only cache and to ignore a cache writable
+        by other users."""
+
+        conf = configuration(category('A', Parameter('a', value=1)))
+
+        self.assertTrue(self.cache.set(key='key', conf=conf))
+
+        self.assertEqual(S_IMODE(stat(self.cache.path).st_mode), 0o600)
+        self.assertEqual(  # no temporary file
+            sorted(listdir(self.dirpath)), ['test.cache', 'test.json']
+        )
+        self.assertIsNotNone(self.cache.get(key='key'))
+
+        chmod(self.cache.path, 0o666)
+
+        self.assertIsNone(self.cache.get(key='key'))
+
+    def test_decode(self):
+        """Test to keep parameter properties in the cache."""
+
+        scope = {'b': 1}
+
+        conf = configuration(
+            category(
+                'A',
+                Parameter('a', value=1, ptype=int, scope=scope, safe=False)
+            )
+        )
+
+        self.cache.set(key='key', conf=conf)
+
+        param = self.cache.get(key='key')['A']['a']
+
+        self.assertIs(param.ptype, int)
+        self.assertEqual(param.scope, scope)
+        self.assertFalse(param.safe)
+        self.assertIs(param.parser, conf['A']['a'].parser)
+        self.assertEqual(param.value, 1)
+
+    def test_ptypes(self):
+        """Test to cache parameters with compiled ptypes."""
+
+        conf = configuration(
+            category(
+                'A', Parameter('a', svalue='true', ptype=BOOL),
+                Parameter('b', svalue='1, 2', ptype=Array(int))
+            )
+        )
+
+        self.assertTrue(conf['A']['a'].value)  # compile converters
+        self.assertEqual(conf['A']['b'].value, [1, 2])
+
+        self.assertTrue(self.cache.set(key='key', conf=conf))
+
+        cached = self.cache.get(key='key')['A']
+
+        self.assertTrue(cached['a'].value)
+        self.assertEqual(cached['b'].value, [1, 2])
+
+        cached['b'].svalue = '3'
+        self.assertEqual(cached['b'].value, [3])
+
+
+if __name__ == '__main__':
+    main()
@@ -282,6 +282,168 @@ class ConfigurableTest(UTCase):
 
         self.assertTrue(test.test)
 
+    def test_incremental(self):
+        """Test to skip configurations which did not change."""
+
+        configurable = Configurable(
+            conf=configuration(category('', Parameter('test', value=True))),
+            incremental=True
+        )
+
+        class Test(object):
+            pass
+
+        test = Test()
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertTrue(test.test)
+
+        test.test = False
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertFalse(test.test)
+
+        configurable.conf = configuration(
+            category('', Parameter('test', value=2))
+        )
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertEqual(test.test, 2)
+
+        test.test = False
+
+        configurable.configure(targets=[test])
+
+        self.assertFalse(test.test)
+
+    def test_incremental_changes(self):
+        """Test to configure only changed parameters and sub configurables."""
+
+        class Test(object):
+            pass
+
+        conf = configuration(
+            category(
+                'test',
+                Parameter('a', value=1),
+                Parameter('b', value=2),
+                Parameter('sub1', value=Test),
+                Parameter('sub2', value=Test)
+            ),
+            category(':sub1', Parameter('attr', value=1)),
+            category(':sub2', Parameter('attr', value=2))
+        )
+
+        configurable = Configurable(
+            conf=conf, incremental=True, keepstate=False
+        )
+
+        test = Test()
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertEqual(test.a, 1)
+        self.assertEqual(test.b, 2)
+        self.assertEqual(test.sub1.attr, 1)
+        self.assertEqual(test.sub2.attr, 2)
+
+        sub1, sub2 = test.sub1, test.sub2
+        test.a = None
+
+        conf['test']['b'].value = 3
+        conf[':sub2']['attr'].value = 3
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertIsNone(test.a)
+        self.assertEqual(test.b, 3)
+        self.assertIs(test.sub1, sub1)
+        self.assertIsNot(test.sub2, sub2)
+        self.assertEqual(test.sub2.attr, 3)
+
+    def test_incremental_dependencies(self):
+        """Test to reconfigure parameters which depend on changed parameters.
+        """
+
+        class Test(object):
+            pass
+
+        conf = configuration(
+            category(
+                'test', Parameter('a', value=1), Parameter('b', svalue='=@a')
+            )
+        )
+
+        configurable = Configurable(conf=conf, incremental=True)
+
+        test = Test()
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertEqual(test.b, 1)
+
+        conf['test']['a'].value = 2
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertEqual(test.a, 2)
+        self.assertEqual(test.b, 2)
+
+    def test_incremental_context(self):
+        """Test to reconfigure targets when values or the resolution scope
+        change with the same hash."""
+
+        class Test(object):
+            pass
+
+        conf = configuration(
+            category(
+                'test', Parameter('a', value=1), Parameter('b', svalue='=x')
+            )
+        )
+
+        configurable = Configurable(conf=conf, incremental=True)
+
+        test = Test()
+
+        configurable.applyconfiguration(targets=[test], scope={'x': 1})
+
+        self.assertEqual(test.b, 1)
+
+        conf['test']['a'].value = True  # hash(1) == hash(True)
+
+        configurable.applyconfiguration(targets=[test], scope={'x': 1})
+
+        self.assertIs(test.a, True)
+
+        configurable.applyconfiguration(targets=[test], scope={'x': 2})
+
+        self.assertEqual(test.b, 2)
+
+    def test_not_incremental(self):
+        """Test to configure targets even if the configuration did not change.
+        """
+
+        configurable = Configurable(
+            conf=configuration(category('', Parameter('test', value=True)))
+        )
+
+        class Test(object):
+            pass
+
+        test = Test()
+
+        configurable.applyconfiguration(targets=[test])
+
+        test.test = False
+
+        configurable.applyconfiguration(targets=[test])
+
+        self.assertTrue(test.test)
+
     def test_annotation(self):
         """Test to use a configurable instancec such as a decodator."""
 
@@ -362,6 +524,39 @@ class ConfigurableTest(UTCase):
         self.assertEqual(configurable.test2, '01')
         self.assertEqual(configurable.test3, 3)
 
+    def test_foreigns(self):
+        """Test to get only conf parameters without foreigns."""
+
+        driver = TestConfDriver()
+
+        driver.confbypath['test'] = configuration(
+            category(
+                'test',
+                Parameter('test', value='test'),
+                Parameter('foreign', value='foreign')
+            ),
+            category('foreign', Parameter('foreign', value='foreign')),
+            category(':sub', Parameter('sub', value='sub'))
+        )
+
+        conf = configuration(category('test', Parameter('test')))
+
+        configurable = Configurable(
+            conf=conf, drivers=[driver], foreigns=False, autoconf=False
+        )
+
+        conf = configurable.getconf(paths='test')
+
+        self.assertEqual(sorted(conf), [':sub', 'test'])
+        self.assertEqual(list(conf['test']), ['test'])
+        self.assertEqual(conf['test']['test'].value, 'test')
+
+        configurable.foreigns = True
+
+        conf = configurable.getconf(paths='test')
+
+        self.assertEqual(sorted(conf), [':sub', 'foreign', 'test'])
+
     def test_safe(self):
         """Test to configurate a configurable in a safe context."""
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Configuration preloading UTs."""
+
+from unittest import main, skipIf
+
+from b3j0f.utils.ut import UTCase
+
+from ..core import Configurable
+from ..preload import preload, compact
+from ...model.conf import configuration
+from ...model.cat import category, LazyCategory
+from ...model.param import Parameter
+from ...driver.file.json import JSONFileConfDriver
+
+from json import dump
+
+from os import fork, pipe, read, write, close, waitpid, remove, _exit
+from os.path import exists
+from tempfile import NamedTemporaryFile
+
+from six import b
+
+_SMAPS = '/proc/self/smaps'  #: linux process memory mappings.
+
+
+def _privatekb():
+    """Get private dirty memory size of the current process in kB."""
+
+    result = 0
+
+    with open(_SMAPS) as smaps:
+        for line in smaps:
+            if line.startswith('Private_Dirty:'):
+                result += int(line.split()[1])
+
+    return result
+
+
+class Target(object):
+    """Configured target."""
+
+
+class PreloadTest(UTCase):
+
+    def setUp(self):
+
+        self.count = 2000
+
+        with NamedTemporaryFile(
+                mode='w', suffix='.json', delete=False
+        ) as fpw:
+            dump(
+                {
+                    'preload': dict(
+                        ('p{0}'.format(index), 'value{0}'.format(index))
+                        for index in range(self.count)
+                    )
+                },
+                fpw
+            )
+
+        self.path = fpw.name
+
+        self.target = Target()
+
+        self.configurable = Configurable(
+            paths=self.path, drivers=[JSONFileConfDriver()],
+            targets=[self.target], autoconf=False
+        )
+
+    def tearDown(self):
+
+        remove(self.path)
+
+    def test_instances(self):
+
+        self.assertIn(self.configurable, Configurable.instances())
+
+    def test_preload(self):
+
+        targets = preload(configurables=[self.configurable])
+
+        self.assertEqual(targets, [self.target])
+        self.assertEqual(self.target.p1, 'value1')
+        self.assertEqual(getattr(self.target, 'p1999'), 'value1999')
+
+    def test_compact(self):
+
+        value = ''.join(['val', 'ue'])
+
+        conf = configuration(
+            LazyCategory(
+                'cat', items=[('a', value)],
+                loader=lambda item: Parameter('a', svalue=item)
+            ),
+            category('test', Parameter('b', value=''.join(['val', 'ue'])))
+        )
+        conf['test']['b'].dirty = False
+
+        compact(conf)
+
+        self.assertFalse(conf['cat']._pending)
+        self.assertIs(conf['cat']['a'].svalue, conf['test']['b'].value)
+        self.assertFalse(conf['test']['b'].dirty)
+
+    def test_compact_text(self):
+
+        value = u''.join([u'val', u'ue'])  # unicode on python 2
+
+        conf = configuration(
+            category(u''.join([u'c', u'at']), Parameter('a', svalue=value)),
+            category(
+                'test', Parameter('b', value=u''.join([u'val', u'ue'])),
+                Parameter('c', value=u''.join([u'c', u'at']))
+            )
+        )
+
+        compact(conf)
+
+        self.assertIs(conf['cat']['a'].svalue, conf['test']['b'].value)
+        self.assertIs(conf['cat'].name, conf['test']['c'].value)
+
+    def _childkb(self, preloaded):
+        """Get private memory growth in kB of a forked child which reads
+        all target parameters."""
+
+        rfd, wfd = pipe()
+
+        pid = fork()
+
+        if pid == 0:  # child process
+
+            close(rfd)
+
+            try:
+                start = _privatekb()
+
+                if not preloaded:
+                    self.configurable.applyconfiguration()
+
+                for index in range(self.count):
+                    getattr(self.target, 'p{0}'.format(index))
+
+                write(wfd, b(str(_privatekb() - start)))
+
+            finally:
+                _exit(0)
+
+        close(wfd)
+
+        try:
+            result = int(read(rfd, 64))
+
+        finally:
+            close(rfd)
+            waitpid(pid, 0)
+
+        return result
+
+    @skipIf(not exists(_SMAPS), 'linux smaps are required')
+    def test_fork(self):
+
+        coldkb = self._childkb(preloaded=False)
+
+        preload(configurables=[self.configurable])
+
+        preloadedkb = self._childkb(preloaded=True)
+
+        self.assertLess(preloadedkb, coldkb)
+
+
+if __name__ == '__main__':
+    main()
@@ -26,8 +26,18 @@
 
 """Conf driver package with the ConfDriver definition."""
 
-__all__ = ['ConfDriver', 'JSONConfDriver', 'XMLConfDriver']
+__all__ = [
+    'ConfDriver', 'DelegateConfDriver', 'JSONConfDriver', 'INIConfDriver',
+    'XMLConfDriver', 'BINConfDriver', 'Provenance', 'PYConfDriver',
+    'compileconf', 'Projection', 'HTTPConfDriver'
+]
 
-from .base import ConfDriver
+from .base import ConfDriver, DelegateConfDriver
 from .json import JSONConfDriver
+from .ini import INIConfDriver
 from .xml import XMLConfDriver
+from .bin import BINConfDriver
+from .provenance import Provenance
+from .projection import Projection
+from .py import PYConfDriver, compileconf
+from .http import HTTPConfDriver
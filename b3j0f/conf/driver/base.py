@@ -39,14 +39,18 @@ In order to implement your self drivers, you have to implement those methods:
 - _setconf(rscpath, logger): put one configuration from one resource path.
 """
 
-__all__ = ['ConfDriver']
+__all__ = ['ConfDriver', 'DelegateConfDriver']
 
 from ..model.conf import Configuration
-from ..model.cat import Category
+from ..model.cat import Category, LazyCategory
+from ..parser.converter import getconverter
 
 from traceback import format_exc
 
-from six import reraise
+from six import reraise, string_types
+
+from b3j0f.utils.path import lookup
+from b3j0f.utils.version import OrderedDict
 
 
 class ConfDriver(object):
@@ -102,7 +106,10 @@ class ConfDriver(object):
 
         return result
 
-    def getconf(self, path, conf=None, logger=None):
+    def getconf(
+            self, path, conf=None, logger=None, provenance=None,
+            projection=None, lazy=False
+    ):
         """Parse a configuration path with input conf and returns
         parameters by param name.
 
@@ -111,6 +118,12 @@ class ConfDriver(object):
             conf param names.
         :param Logger logger: logger to use in order to trace
             information/error.
+        :param Provenance provenance: provenance to fill with resource
+            configurations.
+        :param Projection projection: categories and parameters to get.
+            Default all.
+        :param bool lazy: if True (False by default), parameters are
+            materialized when they are accessed (see LazyCategory).
         :rtype: Configuration
         """
 
@@ -122,28 +135,44 @@ class ConfDriver(object):
 
         for rscpath in rscpaths:
 
-            pathconf = self._getconf(rscpath=rscpath, logger=logger, conf=conf)
+            pathconf = self._getconf(
+                rscpath=rscpath, logger=logger, conf=conf,
+                projection=projection, lazy=lazy
+            )
 
             if pathconf is not None:
 
+                if provenance is not None:
+                    provenance.add(rscpath=rscpath, driver=self, conf=pathconf)
+
                 if result is None:
-                    result = pathconf
+                    # avoid to modify the provenance layer
+                    result = pathconf if provenance is None else pathconf.copy()
 
                 else:
                     result.update(pathconf)
 
         return result
 
-    def setconf(self, conf, rscpath, logger=None):
+    def setconf(self, conf, rscpath, logger=None, dirty=False):
         """Set input conf in input path.
 
+        Written parameters are marked such as not dirty.
+
         :param Configuration conf: conf to write to path.
         :param str rscpath: specific resource path to use.
         :param Logger logger: used to log info/errors.
-        :param bool error: raise catched errors.
+        :param bool dirty: if True (False by default), write only dirty
+            parameters (see Parameter.dirty).
         :raises: ConfDriver.Error in case of error and input error.
         """
 
+        if dirty:
+            conf = self._dirtyconf(conf)
+
+            if conf is None:  # nothing to write
+                return
+
         resource = self.pathresource(rscpath=rscpath, logger=logger)
 
         if resource is None:
@@ -159,11 +188,51 @@ class ConfDriver(object):
                 logger.error(full_msg)
                 reraise(self.Error, self.Error(msg))
 
-    def _getconf(self, rscpath, logger=None, conf=None):
+        else:
+            self._clean(conf)
+
+    @staticmethod
+    def _dirtyconf(conf):
+        """Get a configuration with dirty parameters of input conf.
+
+        :return: configuration which shares dirty parameters with conf, or None
+            if there are no dirty parameters.
+        :rtype: Configuration"""
+
+        result = None
+
+        for category in conf.values():
+
+            params = category.dirtyparams()
+
+            if params:
+
+                if result is None:
+                    result = Configuration()
+
+                result += Category(category.name, melts=params)
+
+        return result
+
+    @staticmethod
+    def _clean(conf):
+        """Mark parameters of input conf such as not dirty."""
+
+        for category in conf.values():
+            for param in category.dirtyparams():
+                param.dirty = False
+
+    def _getconf(
+            self, rscpath, logger=None, conf=None, projection=None, lazy=False
+    ):
         """Get specific conf from one driver path.
 
         :param str rscpath: resource path.
         :param Logger logger: logger to use.
+        :param Configuration conf: conf which gives parameter models.
+        :param Projection projection: categories and parameters to get.
+        :param bool lazy: materialize parameters when they are accessed if
+            the driver implements the methods _pitems and _param.
         """
 
         result = None
@@ -172,36 +241,161 @@ class ConfDriver(object):
 
         if resource is not None:
 
-            for cname in self._cnames(resource=resource):
+            lazyresource = False  # True if lazy categories use the resource
 
-                category = Category(name=cname)
+            try:
+                result, lazyresource = self._getresourceconf(
+                    resource=resource, conf=conf, projection=projection,
+                    lazy=lazy
+                )
 
-                if result is None:
-                    result = Configuration()
+            finally:
+                if not lazyresource:
+                    self._closeresource(resource)
+
+        return result
+
+    def _getresourceconf(self, resource, conf, projection, lazy):
+        """Get a conf from a resource.
+
+        :return: conf and True if lazy categories use the resource.
+        :rtype: tuple"""
+
+        result, lazyresource = None, False
+
+        for cname in self._cnames(resource=resource):
+
+            if projection is not None and not projection.category(cname):
+                continue
+
+            if result is None:
+                result = Configuration()
+
+            items = None
+
+            if lazy:
+                items = self._pitems(resource=resource, cname=cname)
+
+            if items is not None:
+
+                if projection is not None:
+                    items = [
+                        item for item in items
+                        if projection.param(cname, item[0])
+                    ]
+
+                result += LazyCategory(
+                    name=cname, items=items,
+                    loader=self._loader(resource, cname, conf)
+                )
+                lazyresource = True
+                continue
+
+            category = Category(name=cname)
+
+            result += category
+
+            if projection is None:
+                params = self._params(resource=resource, cname=cname)
+
+            else:
+                params = self._projectparams(
+                    resource=resource, cname=cname, projection=projection
+                )
+
+            for param in params:
+
+                if conf is not None:
+                    self._updateparam(param=param, cname=cname, conf=conf)
+
+                param.dirty = False
+
+                category += param
+
+        return result, lazyresource
+
+    def _closeresource(self, resource):
+        """Release a resource which is not used anymore by a conf.
+
+        Resources used by lazy categories are released when they are garbage
+        collected.
+
+        :param resource: resource to release."""
+
+    def _loader(self, resource, cname, conf):
+        """Get a function which materializes a raw parameter given by the
+        method _pitems.
+
+        :rtype: callable"""
+
+        def loader(item):
+            """Materialize a raw parameter."""
+
+            result = self._param(resource=resource, cname=cname, item=item)
+
+            if conf is not None:
+                self._updateparam(param=result, cname=cname, conf=conf)
+
+            result.dirty = False
 
-                result += category
+            return result
 
-                for param in self._params(resource=resource, cname=cname):
+        return loader
 
-                    if conf is not None:
-                        confparam = None
+    @staticmethod
+    def _updateparam(param, cname, conf):
+        """Update a resource parameter with its model from a conf.
 
-                        if cname in conf and param.name in conf[cname]:
-                            confparam = conf[cname][param.name]
+        :param Parameter param: resource parameter to update.
+        :param str cname: parameter category name.
+        :param Configuration conf: conf which gives parameter models."""
 
-                        else:
-                            confparam = conf.param(pname=param.name)
+        confparam = None
 
-                        if confparam is not None:
-                            svalue = param.svalue
+        if cname in conf and param.name in conf[cname]:
+            confparam = conf[cname][param.name]
 
-                            param.update(confparam)
+        else:
+            confparam = conf.param(pname=param.name)
 
-                            if svalue is not None:
-                                param.svalue = svalue
-                                param.resolve()
+        if confparam is not None:
+            svalue, value = param._svalue, param._value
 
-                    category += param
+            param.update(confparam)
+
+            if svalue is not None:
+                param.svalue = svalue
+                param.resolve()
+
+            elif value is not None:
+                # convert the value instead of parsing it
+                converter = getconverter(param.ptype)
+                param._value = converter(value)
+                param._svalue = param._error = None
+
+    def _projectparams(self, resource, cname, projection):
+        """Get category parameters kept by a projection.
+
+        Parameters are materialized only if they are kept when the driver
+        implements the methods _pitems and _param.
+
+        :rtype: list"""
+
+        items = self._pitems(resource=resource, cname=cname)
+
+        if items is None:  # filter materialized parameters
+            result = [
+                param
+                for param in self._params(resource=resource, cname=cname)
+                if projection.param(cname, param.name)
+            ]
+
+        else:
+            result = [
+                self._param(resource=resource, cname=cname, item=item)
+                for pname, item in items
+                if projection.param(cname, pname)
+            ]
 
         return result
 
@@ -241,6 +435,29 @@ class ConfDriver(object):
 
         raise NotImplementedError()
 
+    def _pitems(self, resource, cname):
+        """Get raw category parameters, before their materialization.
+
+        :param resource: resource from where get parameters.
+        :param str cname: related category name.
+        :return: list of (parameter name, raw parameter), or None if not
+            supported.
+        :rtype: list
+        """
+
+        return None
+
+    def _param(self, resource, cname, item):
+        """Materialize a raw parameter given by the method _pitems.
+
+        :param resource: resource from where get the parameter.
+        :param str cname: related category name.
+        :param item: raw parameter.
+        :rtype: Parameter
+        """
+
+        raise NotImplementedError()
+
     def _params(self, resource, cname):
         """Get list of category parameters.
 
@@ -252,3 +469,80 @@ class ConfDriver(object):
         """
 
         raise NotImplementedError()
+
+
+class DelegateConfDriver(ConfDriver):
+    """Driver which parses resources with drivers chosen by resource suffix.
+
+    Resources are (driver, driver resource), and resource methods are
+    delegated to the driver which parsed the resource."""
+
+    #: default (suffix, driver class or class path). Suffixes of a same class
+    #: share one driver.
+    DRIVERS = (
+        ('.json', 'b3j0f.conf.driver.json.JSONConfDriver'),
+        ('.ini', 'b3j0f.conf.driver.ini.INIConfDriver'),
+        ('.conf', 'b3j0f.conf.driver.ini.INIConfDriver'),
+        ('.xml', 'b3j0f.conf.driver.xml.XMLConfDriver'),
+        ('.bin', 'b3j0f.conf.driver.bin.BINConfDriver')
+    )
+
+    @classmethod
+    def defaultdrivers(cls):
+        """Get default drivers by resource suffix (see DRIVERS).
+
+        :rtype: OrderedDict"""
+
+        result = OrderedDict()
+        drivers = {}  # drivers by class
+
+        for suffix, dclass in cls.DRIVERS:
+
+            if isinstance(dclass, string_types):
+                dclass = lookup(dclass)
+
+            if dclass not in drivers:
+                drivers[dclass] = dclass()
+
+            result[suffix] = drivers[dclass]
+
+        return result
+
+    def _suffixdrivers(self, suffix):
+        """Get drivers able to parse a resource with input suffix.
+
+        :param str suffix: resource suffix.
+        :return: the driver of suffix, or all drivers if suffix is unknown.
+        :rtype: list"""
+
+        if suffix in self.drivers:
+            result = [self.drivers[suffix]]
+
+        else:
+            result = list(OrderedDict.fromkeys(self.drivers.values()))
+
+        return result
+
+    def _cnames(self, resource):
+
+        driver, resource = resource
+
+        return driver._cnames(resource)
+
+    def _pitems(self, resource, cname):
+
+        driver, resource = resource
+
+        return driver._pitems(resource, cname)
+
+    def _param(self, resource, cname, item):
+
+        driver, resource = resource
+
+        return driver._param(resource, cname, item)
+
+    def _params(self, resource, cname):
+
+        driver, resource = resource
+
+        return driver._params(resource, cname)
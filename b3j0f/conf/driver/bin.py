@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Binary configuration driver.
+
+The binary format is a compact and indexed representation of a configuration
+which does not need to be parsed entirely before use. All integers are little
+endian unsigned integers of 4 bytes (``I``), unless specified.
+
+.. code-block:: text
+
+    header:      magic ('B3CF'), version (B), 3 pad bytes,
+                 string count (I), category count (I), categories offset (I)
+    strings:     string count * string offset (I)
+                 string count * (length (I), utf-8 bytes)
+    categories:  category count * (name string index (I),
+                                   parameters offset (I), parameter count (I))
+    parameters:  per category, parameter count * (
+                     name string index (I), flags (B), kind (B), 2 pad bytes,
+                     value string index (I))
+
+Parameter flags are a combination of ``REGEX`` (the name is a regex) and
+``NOTLOCAL`` (the parameter is not local).
+
+Parameter kinds are:
+
+- ``NONE``: no value.
+- ``SVALUE``: a serialized value, parsed when the parameter is resolved.
+- ``VALUE``: a python value serialized with marshal (version 2). Only values
+  which are decoded with the same types by python 2 and 3 are marshaled
+  (None, booleans, numbers, text strings and builtin containers of them).
+
+Categories and strings are decoded on demand, therefore a resource with
+numerous categories costs only the decoding of used categories.
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['BINConfDriver', 'BINResource', 'export']
+
+from marshal import dumps as mdumps, loads as mloads
+
+from re import compile as re_compile
+
+from struct import Struct
+
+from six import string_types, text_type, binary_type, integer_types
+
+from .base import ConfDriver
+from ..model.conf import Configuration
+from ..model.cat import Category
+from ..model.param import Parameter
+
+MAGIC = b'B3CF'  #: binary format magic number.
+VERSION = 2  #: binary format version.
+MARSHAL_VERSION = 2  #: marshal version compatible with python 2 and 3.
+
+NONE = 0  #: no value kind.
+SVALUE = 1  #: serialized value kind.
+VALUE = 2  #: marshaled value kind.
+
+REGEX = 1  #: regex name flag.
+NOTLOCAL = 2  #: not local parameter flag.
+
+NOINDEX = 0xFFFFFFFF  #: string index of no value.
+
+_HEADER = Struct('<4sB3xIII')  #: header structure.
+_UINT = Struct('<I')  #: unsigned integer structure.
+_CATEGORY = Struct('<III')  #: category structure.
+_PARAM = Struct('<IBB2xI')  #: parameter structure.
+
+#: types of values which are marshaled with the same types in python 2 and 3.
+_MARSHALABLES = (bool, float, complex, type(None), text_type) + integer_types
+
+_CONTAINERS = (list, tuple, set, frozenset)  #: marshalable containers.
+
+
+def _marshalable(value):
+    """True iif input value is marshaled and unmarshaled with the same types
+    in python 2 and 3 (python 2 str are python 3 bytes)."""
+
+    if isinstance(value, _CONTAINERS):
+        result = all(_marshalable(item) for item in value)
+
+    elif isinstance(value, dict):
+        result = all(
+            _marshalable(key) and _marshalable(item)
+            for key, item in value.items()
+        )
+
+    else:
+        result = type(value) in _MARSHALABLES
+
+    return result
+
+
+def export(conf):
+    """Export a configuration to the binary format.
+
+    :param Configuration conf: configuration to export.
+    :rtype: bytes"""
+
+    strings = []
+    indexes = {}
+
+    def _index(value):
+        """Get the index of a string (or bytes) in the string table."""
+
+        result = indexes.get(value)
+
+        if result is None:
+            result = indexes[value] = len(strings)
+            strings.append(value)
+
+        return result
+
+    categories = []
+
+    for category in conf.values():
+
+        params = []
+
+        for param in category.values():
+
+            flags = 0 if param.local else NOTLOCAL
+
+            name = param.name
+
+            if not isinstance(name, string_types):
+                flags |= REGEX
+                name = name.pattern
+
+            svalue = param._svalue
+            kind = NONE if svalue is None else SVALUE
+
+            if svalue is None and param._value is not None:
+
+                value = param._value
+
+                if _marshalable(value):
+                    svalue = mdumps(value, MARSHAL_VERSION)
+                    kind = VALUE
+
+                else:
+                    svalue = param.serializer(value)
+
+                    if svalue is not None:
+                        kind = SVALUE
+
+            params.append(
+                (
+                    _index(name), flags, kind,
+                    NOINDEX if svalue is None else _index(svalue)
+                )
+            )
+
+        categories.append((_index(category.name), params))
+
+    # encode strings
+    encodeds = [
+        value.encode('utf-8') if isinstance(value, text_type) else value
+        for value in strings
+    ]
+
+    offset = _HEADER.size + _UINT.size * len(strings)
+    offsets = []
+
+    for encoded in encodeds:
+        offsets.append(_UINT.pack(offset))
+        offset += _UINT.size + len(encoded)
+
+    result = [
+        _HEADER.pack(MAGIC, VERSION, len(strings), len(categories), offset)
+    ]
+    result += offsets
+
+    for encoded in encodeds:
+        result.append(_UINT.pack(len(encoded)))
+        result.append(encoded)
+
+    offset += _CATEGORY.size * len(categories)
+
+    for name, params in categories:
+        result.append(_CATEGORY.pack(name, offset, len(params)))
+        offset += _PARAM.size * len(params)
+
+    for _, params in categories:
+        for param in params:
+            result.append(_PARAM.pack(*param))
+
+    return b''.join(result)
+
+
+class BINResource(object):
+    """Binary configuration resource which decodes categories on demand."""
+
+    def __init__(self, buffer, *args, **kwargs):
+        """
+        :param buffer: binary content (bytes, mmap, etc.).
+        :raises: ValueError if buffer is not in the binary format.
+        """
+
+        super(BINResource, self).__init__(*args, **kwargs)
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError('Wrong binary configuration size.')
+
+        magic, version, strcount, catcount, catoffset = _HEADER.unpack_from(
+            buffer, 0
+        )
+
+        if magic != MAGIC:
+            raise ValueError('Wrong binary configuration magic number.')
+
+        if version != VERSION:
+            raise ValueError(
+                'Unsupported binary configuration version {0}.'.format(version)
+            )
+
+        self.buffer = buffer
+        self.strcount = strcount
+        self.catcount = catcount
+        self.catoffset = catoffset
+
+        self._strings = {}  # decoded strings by index
+        self._categories = None  # (offset, count) by category name
+        self._cnames = None  # category names
+
+    def close(self):
+        """Release the buffer if it can be closed (mmap for example)."""
+
+        close = getattr(self.buffer, 'close', None)
+
+        if close is not None:
+            close()
+
+    def string(self, index, decode=True):
+        """Get a string from the string table.
+
+        :param int index: string index.
+        :param bool decode: if True (default), decode utf-8 bytes.
+        :rtype: str"""
+
+        key = index, decode
+
+        try:
+            result = self._strings[key]
+
+        except KeyError:
+
+            if index >= self.strcount:
+                raise ValueError('Wrong string index {0}.'.format(index))
+
+            buffer = self.buffer
+
+            offset, = _UINT.unpack_from(
+                buffer, _HEADER.size + _UINT.size * index
+            )
+            length, = _UINT.unpack_from(buffer, offset)
+            start = offset + _UINT.size
+
+            result = binary_type(buffer[start: start + length])
+
+            if decode:
+                result = result.decode('utf-8')
+
+            self._strings[key] = result
+
+        return result
+
+    def categories(self):
+        """Get (offset, count) of parameters by category name.
+
+        :rtype: dict"""
+
+        result = self._categories
+
+        if result is None:
+
+            result = self._categories = {}
+            self._cnames = []
+
+            offset = self.catoffset
+
+            for _ in range(self.catcount):
+
+                name, poffset, count = _CATEGORY.unpack_from(
+                    self.buffer, offset
+                )
+                cname = self.string(name)
+                result[cname] = poffset, count
+                self._cnames.append(cname)
+                offset += _CATEGORY.size
+
+        return result
+
+    def cnames(self):
+        """Get category names in the resource order.
+
+        :rtype: list"""
+
+        self.categories()
+
+        return list(self._cnames)
+
+    def pitems(self, cname):
+        """Get parameter names of one category with their offsets, without
+        decoding parameter values.
+
+        :param str cname: category name.
+        :return: list of (name, offset).
+        :rtype: list"""
+
+        result = []
+
+        offset, count = self.categories()[cname]
+
+        for _ in range(count):
+
+            name, = _UINT.unpack_from(self.buffer, offset)
+            result.append((self.string(name), offset))
+            offset += _PARAM.size
+
+        return result
+
+    def param(self, offset):
+        """Decode the parameter at input offset.
+
+        :param int offset: parameter offset.
+        :rtype: Parameter"""
+
+        name, flags, kind, value = _PARAM.unpack_from(self.buffer, offset)
+
+        name = self.string(name)
+
+        kwargs = {'local': not flags & NOTLOCAL}
+
+        if kind == VALUE:
+            kwargs['value'] = mloads(self.string(value, decode=False))
+
+        elif kind == SVALUE:
+            kwargs['svalue'] = self.string(value)
+
+        result = Parameter(name=name, **kwargs)
+
+        # compile regex names which look like simple names
+        if flags & REGEX and isinstance(result.name, string_types):
+            result.name = re_compile(name)
+
+        return result
+
+    def params(self, cname):
+        """Decode parameters of one category.
+
+        :param str cname: category name.
+        :rtype: list"""
+
+        return [self.param(offset) for _, offset in self.pitems(cname)]
+
+
+class BINConfDriver(ConfDriver):
+    """Manage binary resource configuration where resource paths are binary
+    contents."""
+
+    def rscpaths(self, path):
+
+        return [path]
+
+    def resource(self):
+
+        return None
+
+    def _pathresource(self, rscpath):
+
+        return BINResource(rscpath)
+
+    def _cnames(self, resource):
+
+        return resource.cnames()
+
+    def _pitems(self, resource, cname):
+
+        return resource.pitems(cname)
+
+    def _param(self, resource, cname, item):
+
+        return resource.param(item)
+
+    def _params(self, resource, cname):
+
+        return resource.params(cname)
+
+    def _setconf(self, conf, resource, rscpath):
+
+        if resource is not None:  # update resource content with conf
+            rscconf = Configuration()
+
+            for cname in resource.cnames():
+                rscconf += Category(cname, melts=resource.params(cname))
+
+            rscconf.update(conf)
+            conf = rscconf
+
+        return export(conf)
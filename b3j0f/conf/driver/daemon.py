@@ -0,0 +1,764 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Configuration daemon module.
+
+A configuration daemon (ConfDaemon) loads configuration paths once per host
+and serves their categories such as binary snapshots (see the bin driver) on
+a Unix domain socket. Clients (DaemonConfDriver) get snapshots instead of
+parsing resources, and the daemon notifies them of changed categories, so
+that they get again only changed categories.
+
+.. code-block:: python
+
+    # daemon process
+    ConfDaemon(
+        socketpath='/run/myapp/conf.sock', paths=['myapp.json']
+    ).serve()
+
+    # worker processes
+    driver = DaemonConfDriver(socketpath='/run/myapp/conf.sock')
+    configurable = Configurable(drivers=[driver])
+
+The daemon serves only configuration paths given at its construction. It can
+also be run with ``python -m b3j0f.conf.driver.daemon socketpath path...``.
+This module needs Unix domain sockets, therefore it is not imported by the
+driver package.
+
+Messages are frames of a length (I, little endian) followed by a payload.
+Requests are json objects:
+
+- ``{"op": "get", "path": path, "cnames": cnames}``: get snapshots of
+  categories (all if cnames is null) of a configuration path. The response is
+  a json object ``{"cnames": all cnames or null, "sent": sent cnames}`` and
+  one snapshot frame per sent category. The response is ``{"error": message}``
+  if the path is not served.
+- ``{"op": "watch"}``: the connection receives json notices
+  ``{"path": path, "cnames": all cnames or null, "changed": changed cnames}``.
+
+Request frames are limited to MAX_REQUEST bytes and response frames to
+MAX_FRAME bytes.
+
+Changes are detected with the signatures (mtime, size, inode) of resource
+files, checked every ``interval`` seconds. Notices are sent with a timeout,
+and watchers which do not receive them in time are disconnected.
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['ConfDaemon', 'DaemonConfDriver']
+
+try:
+    from json import loads, dumps
+
+except ImportError:
+    from simplejson import loads, dumps
+
+from os import stat, remove
+from os.path import exists
+from socket import (
+    socket, error as socket_error, timeout as socket_timeout, AF_UNIX,
+    SOCK_STREAM, SHUT_RDWR
+)
+from struct import Struct
+from threading import Thread, Lock, RLock, Event
+from time import sleep
+
+from six.moves.socketserver import (
+    ThreadingMixIn, UnixStreamServer, StreamRequestHandler
+)
+
+from b3j0f.utils.version import OrderedDict
+
+from .bin import BINConfDriver, BINResource, export
+from .file.json import JSONFileConfDriver
+from .file.ini import INIFileConfDriver
+from .file.xml import XMLFileConfDriver
+from ..model.conf import configuration
+
+_LENGTH = Struct('<I')  #: frame length.
+
+MAX_FRAME = 1 << 28  #: maximal frame length.
+MAX_REQUEST = 1 << 16  #: maximal request frame length.
+
+
+def _send(sock, payload):
+    """Send a frame.
+
+    :param bytes payload: frame payload."""
+
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _recvall(sock, size):
+    """Receive exactly size bytes.
+
+    :raises: EOFError if the connection is closed."""
+
+    chunks = []
+
+    while size:
+
+        chunk = sock.recv(min(size, 1 << 16))
+
+        if not chunk:
+            raise EOFError('Connection closed.')
+
+        chunks.append(chunk)
+        size -= len(chunk)
+
+    return b''.join(chunks)
+
+
+def _recv(sock, maxlength=MAX_FRAME):
+    """Receive a frame payload.
+
+    :param int maxlength: maximal payload length.
+    :rtype: bytes
+    :raises: ValueError if the payload is longer than maxlength."""
+
+    length, = _LENGTH.unpack(_recvall(sock, _LENGTH.size))
+
+    if length > maxlength:
+        raise ValueError('Frame length {0} is too long.'.format(length))
+
+    return _recvall(sock, length)
+
+
+def _sendjson(sock, obj):
+
+    _send(sock, dumps(obj).encode('utf-8'))
+
+
+def _recvjson(sock, maxlength=MAX_FRAME):
+
+    return loads(_recv(sock, maxlength).decode('utf-8'))
+
+
+class _Snapshot(object):
+    """Binary snapshot of a configuration path."""
+
+    __slots__ = ('signature', 'categories')
+
+    def __init__(self, signature, categories):
+        """
+        :param tuple signature: resource file signatures.
+        :param OrderedDict categories: category snapshots by name, or None if
+            the path does not have configuration.
+        """
+
+        super(_Snapshot, self).__init__()
+
+        self.signature = signature
+        self.categories = categories
+
+
+class _Handler(StreamRequestHandler):
+    """Daemon request handler."""
+
+    def handle(self):
+
+        daemon = self.server.daemon
+        sock = self.request
+
+        while True:
+
+            try:
+                request = _recvjson(sock, MAX_REQUEST)
+
+            except (EOFError, socket_error, ValueError):
+                break
+
+            if request.get('op') == 'watch':
+                daemon._watch(sock)
+
+                try:  # wait for the client to close the connection
+                    while True:
+
+                        try:
+                            if not sock.recv(1 << 10):
+                                break
+
+                        except socket_timeout:  # notice send timeout
+                            continue
+
+                except socket_error:
+                    pass
+
+                finally:
+                    daemon._unwatch(sock)
+
+                break
+
+            path = request.get('path')
+
+            if path not in daemon.paths:
+
+                try:
+                    _sendjson(
+                        sock, {'error': '{0} is not served.'.format(path)}
+                    )
+
+                except socket_error:
+                    break
+
+                continue
+
+            categories = daemon.snapshot(path).categories
+            cnames = request.get('cnames')
+
+            if categories is None:
+                sent = []
+
+            elif cnames is None:
+                sent = list(categories)
+
+            else:
+                sent = [cname for cname in cnames if cname in categories]
+
+            try:
+                _sendjson(
+                    sock, {
+                        'cnames': None if categories is None
+                        else list(categories),
+                        'sent': sent
+                    }
+                )
+
+                for cname in sent:
+                    _send(sock, categories[cname])
+
+            except socket_error:
+                break
+
+
+class _Server(ThreadingMixIn, UnixStreamServer):
+    """Threaded Unix stream server."""
+
+    daemon_threads = True
+
+
+class ConfDaemon(object):
+    """Configuration daemon which serves binary snapshots of configuration
+    paths on a Unix domain socket."""
+
+    DEFAULT_INTERVAL = 1  #: default interval of change checks in seconds.
+    DEFAULT_TIMEOUT = 5  #: default notice send timeout in seconds.
+
+    def __init__(
+            self, socketpath, paths=(), drivers=None,
+            interval=DEFAULT_INTERVAL, timeout=DEFAULT_TIMEOUT, logger=None,
+            *args, **kwargs
+    ):
+        """
+        :param str socketpath: Unix domain socket path.
+        :param list paths: configuration paths which can be requested by
+            clients.
+        :param list drivers: drivers used to load configuration paths.
+            Default the Configurable default drivers.
+        :param float interval: interval of change checks in seconds.
+        :param float timeout: notice send timeout in seconds.
+        :param Logger logger: logger to use.
+        """
+
+        super(ConfDaemon, self).__init__(*args, **kwargs)
+
+        self.socketpath = socketpath
+        self.paths = frozenset(paths)
+        self.drivers = (
+            [JSONFileConfDriver(), INIFileConfDriver(), XMLFileConfDriver()]
+            if drivers is None else drivers
+        )
+        self.interval = interval
+        self.timeout = timeout
+        self.logger = logger
+
+        self._snapshots = {}  # snapshots by path
+        self._watchers = []  # watch sockets
+        self._lock = RLock()
+        self._notifylock = Lock()  # notification lock
+        self._server = None
+        self._stopped = Event()
+
+    def _signature(self, path):
+        """Get resource file signatures of a configuration path.
+
+        :rtype: tuple"""
+
+        result = []
+
+        for driver in self.drivers:
+
+            for rscpath in driver.rscpaths(path):
+
+                try:
+                    rscstat = stat(rscpath)
+
+                except (OSError, TypeError):  # not a file
+                    result.append((rscpath,))
+
+                else:
+                    result.append(
+                        (
+                            rscpath, rscstat.st_mtime, rscstat.st_size,
+                            rscstat.st_ino
+                        )
+                    )
+
+        return tuple(result)
+
+    def _load(self, path, signature):
+        """Load a configuration path.
+
+        :rtype: _Snapshot"""
+
+        conf = None
+
+        for driver in self.drivers:
+            conf = driver.getconf(path=path, conf=conf, logger=self.logger)
+
+        categories = None
+
+        if conf is not None:
+            categories = OrderedDict(
+                (category.name, export(configuration(category)))
+                for category in conf.values()
+            )
+
+        return _Snapshot(signature=signature, categories=categories)
+
+    def snapshot(self, path):
+        """Get the snapshot of a configuration path, loaded at the first call.
+
+        :rtype: _Snapshot"""
+
+        with self._lock:
+
+            result = self._snapshots.get(path)
+
+            if result is None:
+                result = self._snapshots[path] = self._load(
+                    path, self._signature(path)
+                )
+
+        return result
+
+    def refresh(self):
+        """Load again changed configuration paths and notify watchers of
+        changed categories.
+
+        :return: changed category names by path.
+        :rtype: dict"""
+
+        result = {}
+        notices = []
+
+        with self._notifylock:  # keep notices in the refresh order
+
+            with self._lock:
+
+                for path, snapshot in list(self._snapshots.items()):
+
+                    signature = self._signature(path)
+
+                    if signature == snapshot.signature:
+                        continue
+
+                    newsnapshot = self._snapshots[path] = self._load(
+                        path, signature
+                    )
+
+                    old = snapshot.categories or {}
+                    new = newsnapshot.categories or {}
+
+                    changed = [
+                        cname for cname in new if old.get(cname) != new[cname]
+                    ]
+                    removed = [cname for cname in old if cname not in new]
+
+                    cnames = (
+                        None if newsnapshot.categories is None else list(new)
+                    )
+
+                    if changed or removed or (
+                            (snapshot.categories is None) != (cnames is None)
+                    ):
+                        result[path] = changed
+                        notices.append(
+                            {'path': path, 'changed': changed, 'cnames': cnames}
+                        )
+
+                watchers = list(self._watchers)
+
+            for notice in notices:  # without blocking snapshots
+                self._notify(notice, watchers)
+
+        return result
+
+    def _watch(self, sock):
+        """Register a watch socket."""
+
+        sock.settimeout(self.timeout)  # slow watchers do not block notices
+
+        with self._lock:
+            self._watchers.append(sock)
+
+    def _unwatch(self, sock):
+        """Unregister a watch socket."""
+
+        with self._lock:
+            if sock in self._watchers:
+                self._watchers.remove(sock)
+
+    def _notify(self, notice, watchers):
+        """Send a notice to watchers.
+
+        Watchers which do not receive the notice in time are disconnected."""
+
+        for sock in watchers:
+
+            try:
+                _sendjson(sock, notice)
+
+            except socket_error:  # closed by the client or too slow
+                self._unwatch(sock)
+
+                try:
+                    sock.shutdown(SHUT_RDWR)
+
+                except socket_error:
+                    pass
+
+    def start(self):
+        """Listen to the socket and check changes in background threads.
+
+        :return: self."""
+
+        if exists(self.socketpath):  # stale socket
+            remove(self.socketpath)
+
+        self._stopped.clear()
+
+        self._server = _Server(self.socketpath, _Handler)
+        self._server.daemon = self
+
+        for target, kwargs in (
+                (self._server.serve_forever, {'poll_interval': 0.1}),
+                (self._refreshloop, {})
+        ):
+            thread = Thread(target=target, kwargs=kwargs)
+            thread.daemon = True
+            thread.start()
+
+        return self
+
+    def _refreshloop(self):
+        """Check changes every interval."""
+
+        while not self._stopped.wait(self.interval):
+
+            try:
+                self.refresh()
+
+            except Exception as ex:
+                if self.logger is not None:
+                    self.logger.error('Error while refreshing: {0}'.format(ex))
+
+    def stop(self):
+        """Stop serving and close watch sockets."""
+
+        self._stopped.set()
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        with self._lock:
+            watchers, self._watchers = self._watchers, []
+
+        for sock in watchers:  # wake up watch handlers
+
+            try:
+                sock.shutdown(SHUT_RDWR)
+
+            except socket_error:
+                pass
+
+        if exists(self.socketpath):
+            remove(self.socketpath)
+
+    def serve(self):
+        """Serve until a KeyboardInterrupt."""
+
+        self.start()
+
+        try:
+            while not self._stopped.is_set():
+                sleep(self.interval)
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            self.stop()
+
+
+class DaemonConfDriver(BINConfDriver):
+    """Get configuration paths from a ConfDaemon.
+
+    Categories are cached and only changed categories are requested again
+    while the daemon notifies changes. Resources are read-only."""
+
+    DEFAULT_TIMEOUT = 5  #: default socket timeout in seconds.
+
+    def __init__(
+            self, socketpath, timeout=DEFAULT_TIMEOUT, watch=True,
+            *args, **kwargs
+    ):
+        """
+        :param str socketpath: daemon socket path.
+        :param float timeout: socket timeout in seconds.
+        :param bool watch: if True (default), cache categories and get
+            change notices from the daemon.
+        """
+
+        super(DaemonConfDriver, self).__init__(*args, **kwargs)
+
+        self.socketpath = socketpath
+        self.timeout = timeout
+        self.watch = watch
+
+        self._sock = None  # request socket
+        self._lock = Lock()  # request socket lock
+        self._cache = {}  # BINResource by cname by path
+        self._changed = {}  # changed cnames by path
+        self._watcher = None  # watch socket
+        self._cachelock = Lock()
+
+    def _connect(self, timeout):
+
+        result = socket(AF_UNIX, SOCK_STREAM)
+        result.settimeout(timeout)
+        result.connect(self.socketpath)
+
+        return result
+
+    def _startwatch(self):
+        """Connect the watch socket and receive notices in a thread.
+
+        Must be called with the cache lock."""
+
+        sock = self._connect(timeout=None)
+        _sendjson(sock, {'op': 'watch'})
+
+        self._watcher = sock
+
+        thread = Thread(target=self._watchloop, args=(sock,))
+        thread.daemon = True
+        thread.start()
+
+    def _watchloop(self, sock):
+        """Receive change notices until the watch socket is closed."""
+
+        try:
+            while True:
+
+                notice = _recvjson(sock)
+
+                with self._cachelock:
+
+                    path = notice['path']
+
+                    if path in self._cache:
+                        self._changed.setdefault(path, set()).update(
+                            notice['changed']
+                        )
+
+                        cnames = notice['cnames'] or []
+
+                        categories = self._cache[path]
+
+                        for cname in list(categories):  # removed categories
+                            if cname not in cnames:
+                                del categories[cname]
+
+        except (EOFError, socket_error, ValueError):
+            pass
+
+        with self._cachelock:
+
+            if self._watcher is sock:  # notices are lost, forget the cache
+                self._cache.clear()
+                self._changed.clear()
+                self._watcher = None
+
+        sock.close()
+
+    def close(self):
+        """Close daemon connections."""
+
+        with self._lock:
+
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
+        with self._cachelock:  # notices will be lost
+            watcher, self._watcher = self._watcher, None
+            self._cache.clear()
+            self._changed.clear()
+
+        if watcher is not None:
+            watcher.close()
+
+    def _request(self, path, cnames=None):
+        """Get category snapshots of a configuration path.
+
+        :return: all category names (or None) and snapshots by category name.
+        :rtype: tuple"""
+
+        request = {'op': 'get', 'path': path, 'cnames': cnames}
+
+        with self._lock:
+
+            for attempt in (0, 1):
+
+                new = self._sock is None
+
+                if new:
+                    self._sock = self._connect(timeout=self.timeout)
+
+                try:
+                    _sendjson(self._sock, request)
+                    response = _recvjson(self._sock)
+
+                    if 'error' in response:
+                        raise self.Error(response['error'])
+
+                    snapshots = OrderedDict(
+                        (cname, _recv(self._sock))
+                        for cname in response['sent']
+                    )
+
+                except (EOFError, socket_error, ValueError):
+                    self._sock.close()
+                    self._sock = None
+
+                    if new or attempt:
+                        raise
+
+                else:
+                    break
+
+        return response['cnames'], snapshots
+
+    def rscpaths(self, path):
+
+        return [path]
+
+    def _pathresource(self, rscpath):
+
+        watching = self.watch
+
+        if watching:
+
+            with self._cachelock:  # only one watcher
+
+                if self._watcher is None:
+                    self._startwatch()
+
+        categories = None
+
+        if watching:
+
+            with self._cachelock:
+
+                categories = self._cache.get(rscpath)
+                changed = self._changed.pop(rscpath, set())
+
+            if categories is not None and not changed:
+                return categories
+
+        try:
+            cnames, snapshots = self._request(
+                rscpath, None if categories is None else sorted(changed)
+            )
+
+        except Exception:
+            if watching:  # changes are lost
+                with self._cachelock:
+                    self._cache.pop(rscpath, None)
+            raise
+
+        if cnames is None:
+            result = None
+
+        else:
+            result = OrderedDict()
+
+            for cname in cnames:
+
+                snapshot = snapshots.get(cname)
+
+                if snapshot is not None:
+                    result[cname] = BINResource(snapshot)
+
+                else:  # unchanged category
+                    result[cname] = categories[cname]
+
+        if watching:
+            with self._cachelock:
+                self._cache[rscpath] = result
+
+        return result
+
+    def _cnames(self, resource):
+
+        return list(resource)
+
+    def _pitems(self, resource, cname):
+
+        return resource[cname].pitems(cname)
+
+    def _param(self, resource, cname, item):
+
+        return resource[cname].param(item)
+
+    def _params(self, resource, cname):
+
+        return resource[cname].params(cname)
+
+    def _setconf(self, conf, resource, rscpath):
+
+        raise self.Error('Daemon resources are read-only.')
+
+
+if __name__ == '__main__':
+
+    from sys import argv
+
+    ConfDaemon(socketpath=argv[1], paths=argv[2:]).serve()
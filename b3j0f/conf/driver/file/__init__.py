@@ -24,9 +24,20 @@
 # SOFTWARE.
 # --------------------------------------------------------------------
 
-__all__ = ['FileConfDriver', 'INIFileConfDriver', 'JSONFileConfDriver']
+__all__ = [
+    'FileConfDriver', 'INIFileConfDriver', 'JSONFileConfDriver',
+    'BINFileConfDriver', 'JSONStreamFileConfDriver', 'BundleConfDriver',
+    'DirFileConfDriver', 'SQLiteFileConfDriver', 'SnapshotFileConfDriver',
+    'atomicopen'
+]
 
 
-from .base import FileConfDriver
+from .base import FileConfDriver, atomicopen
 from .ini import INIFileConfDriver
 from .json import JSONFileConfDriver
+from .bin import BINFileConfDriver
+from .jsonstream import JSONStreamFileConfDriver
+from .bundle import BundleConfDriver
+from .directory import DirFileConfDriver
+from .sqlite import SQLiteFileConfDriver
+from .snapshot import SnapshotFileConfDriver
@@ -24,18 +24,65 @@
 # SOFTWARE.
 # --------------------------------------------------------------------
 
-__all__ = ['FileConfDriver']
+from __future__ import absolute_import
+
+__all__ = ['FileConfDriver', 'atomicopen', 'rscopen', 'COMPRESSIONS']
 
 """This module specifies file drivers.
 
 They work relatively to system/user conf directories and an optional conf
 directory given by the environment variable ``B3J0F_CONF_DIR``.
+
+File drivers can journal writes of dirty parameters (see ConfDriver.setconf)
+in a JSON lines file next to the resource (``<rscpath>.journal``), instead of
+rewriting the whole resource. The journal is applied when the resource is read
+and compacted into the resource when it reaches a number of entries.
+
+Resources can be compressed with gzip, bzip2 or xz (see COMPRESSIONS): a
+resource path ``conf.json`` is resolved to ``conf.json``, ``conf.json.gz``,
+``conf.json.bz2`` or ``conf.json.xz`` in this order of precedence in each
+configuration directory. Compressed resources are decompressed while they are
+parsed (see rscopen) and written compressed.
+
+Resources are written atomically (see atomicopen). File drivers can also delay
+writes (write-behind) in order to coalesce several setconf calls on a same
+resource in one write.
 """
 
-from os import environ, getenv
-from os.path import exists, join, expanduser, sep, abspath
+try:
+    from json import loads, dumps
+
+except ImportError:
+    from simplejson import loads, dumps
+
+from os import (
+    environ, getenv, remove, rename, fdopen, fsync, chmod, stat,
+    open as os_open, close, name as os_name, O_RDONLY, O_WRONLY, O_CREAT,
+    O_EXCL, SEEK_END
+)
+from os.path import (
+    exists, join, expanduser, sep, abspath, getsize, dirname, basename
+)
+from stat import S_IMODE
+from uuid import uuid4
+from errno import EEXIST
+from contextlib import contextmanager
+from threading import Lock, RLock, Timer
+from weakref import WeakKeyDictionary
+from atexit import register as atexit_register
+from traceback import format_exc
+from gzip import open as gzip_open
+from zlib import compressobj, DEFLATED, MAX_WBITS
+from bz2 import BZ2File, BZ2Compressor
+
+from six import string_types, text_type, PY3, reraise
+
+from b3j0f.utils.version import OrderedDict
 
 from ..base import ConfDriver
+from ...model.conf import Configuration
+from ...model.cat import Category
+from ...model.param import Parameter
 
 from sys import prefix
 
@@ -91,23 +138,714 @@ if B3J0F_CONF_DIR in environ:  # add b3j0F_CONF_DIR if necessary
     CONF_DIRS.append(environ[B3J0F_CONF_DIR])  #: conf dir environment variable
 
 
+JOURNAL_SUFFIX = '.journal'  #: journal file suffix.
+
+COMPRESSIONS = OrderedDict()
+"""(decompressed file opener, compressor factory) by resource suffix, in the
+order of precedence of compressed resources."""
+
+COMPRESSIONS['.gz'] = (
+    gzip_open, lambda: compressobj(9, DEFLATED, MAX_WBITS | 16)  # gzip format
+)
+COMPRESSIONS['.bz2'] = (BZ2File, BZ2Compressor)
+
+try:
+    from lzma import open as lzma_open, LZMACompressor
+
+except ImportError:  # python < 3.3
+    try:
+        from backports.lzma import open as lzma_open, LZMACompressor
+
+    except ImportError:
+        lzma_open = None
+
+if lzma_open is not None:
+    COMPRESSIONS['.xz'] = (lzma_open, LZMACompressor)
+
+
+def _compression(path):
+    """Get the compression suffix of input path or None."""
+
+    for suffix in COMPRESSIONS:
+        if path.endswith(suffix):
+            return suffix
+
+
+def rscopen(path, mode='r'):
+    """Open a resource file for reading, and decompress it on the fly if its
+    suffix is in COMPRESSIONS.
+
+    :param str path: file path to read.
+    :param str mode: read mode ('r' or 'rb').
+    :return: file object."""
+
+    suffix = _compression(path)
+
+    if suffix is None:
+        result = open(path, mode)
+
+    else:
+        opener = COMPRESSIONS[suffix][0]
+
+        if PY3 and 'b' not in mode:
+            mode = 'rt'
+
+        else:  # python 2 str are bytes
+            mode = 'rb'
+
+        result = opener(path, mode)
+
+    return result
+
+
+class _CompressedFile(object):
+    """Write-only file object which compresses written data."""
+
+    __slots__ = ('handle', 'compressor')
+
+    def __init__(self, handle, compressor):
+
+        super(_CompressedFile, self).__init__()
+
+        self.handle = handle
+        self.compressor = compressor
+
+    def write(self, data):
+        """Compress and write input data."""
+
+        if isinstance(data, text_type):
+            data = data.encode('utf-8')
+
+        self.handle.write(self.compressor.compress(data))
+
+    def flush(self):
+        """Write the end of the compressed data."""
+
+        self.handle.write(self.compressor.flush())
+
+try:
+    from os import O_BINARY
+
+except ImportError:  # not windows
+    O_BINARY = 0
+
+_TMPFLAGS = O_WRONLY | O_CREAT | O_EXCL | O_BINARY  #: temporary file flags.
+
+
+def _mktemp(path, perms=None):
+    """Create a temporary file next to input path.
+
+    The file is created with input perms, or with the permissions of input
+    path if it exists. Otherwise, permissions are 0o666 minus the process
+    umask, applied by the system (the umask is never changed).
+
+    :return: file descriptor and temporary file path.
+    :rtype: tuple"""
+
+    dirpath = dirname(abspath(path))
+    prefix = '.{0}.'.format(basename(path))
+
+    mode = perms
+
+    if mode is None:
+        try:
+            mode = S_IMODE(stat(path).st_mode)
+
+        except OSError:
+            pass
+
+    while True:
+
+        tmppath = join(dirpath, '{0}{1}.tmp'.format(prefix, uuid4().hex))
+
+        try:
+            fd = os_open(tmppath, _TMPFLAGS, 0o666 if mode is None else mode)
+
+        except OSError as ex:
+            if ex.errno != EEXIST:
+                raise
+
+        else:
+            break
+
+    if mode is not None:  # the umask may have removed some permissions
+
+        try:
+            chmod(tmppath, mode)
+
+        except BaseException:
+            close(fd)
+            remove(tmppath)
+            raise
+
+    return fd, tmppath
+
+try:
+    from os import replace as _replace
+
+except ImportError:  # python < 3.3
+
+    def _replace(src, dst):
+        """Rename src to dst even if dst exists."""
+
+        if os_name == 'nt' and exists(dst):  # windows does not overwrite
+            remove(dst)
+
+        rename(src, dst)
+
+
+@contextmanager
+def atomicopen(path, mode='w', perms=None):
+    """Open a temporary file which replaces the file at input path when it
+    is closed without error.
+
+    The temporary file is written in the same directory, synchronized on the
+    disk and renamed, therefore readers never see a truncated file. File
+    permissions are preserved, and data is compressed if the path suffix is
+    in COMPRESSIONS.
+
+    .. code-block:: python
+
+        with atomicopen('conf.json') as handle:
+            handle.write(content)
+
+    :param str path: file path to write.
+    :param str mode: write mode ('w' or 'wb').
+    :param int perms: file permissions. Default are permissions of the
+        existing file, or 0o666 minus the process umask.
+    """
+
+    dirpath = dirname(abspath(path))
+
+    fd, tmppath = _mktemp(path, perms=perms)
+
+    suffix = _compression(path)
+
+    try:
+        handle = fdopen(fd, mode if suffix is None else 'wb')
+
+    except BaseException:  # no file object owns the descriptor
+        close(fd)
+        remove(tmppath)
+        raise
+
+    try:
+        with handle:
+
+            if suffix is None:
+                yield handle
+
+            else:
+                compressed = _CompressedFile(
+                    handle, COMPRESSIONS[suffix][1]()
+                )
+                yield compressed
+                compressed.flush()
+
+            handle.flush()
+            fsync(handle.fileno())
+
+        _replace(tmppath, path)
+
+    except BaseException:
+        if exists(tmppath):
+            remove(tmppath)
+        raise
+
+    if os_name != 'nt':  # synchronize the rename
+
+        try:
+            dirfd = os_open(dirpath, O_RDONLY)
+
+        except OSError:
+            pass
+
+        else:
+            try:
+                fsync(dirfd)
+
+            except OSError:
+                pass
+
+            finally:
+                close(dirfd)
+
+
+class _PendingWrite(object):
+    """Delayed write of a resource."""
+
+    __slots__ = ('conf', 'logger', 'dirty', 'timer')
+
+    def __init__(self, logger, timer):
+
+        super(_PendingWrite, self).__init__()
+
+        self.conf = Configuration()  # parameters to write
+        self.logger = logger
+        self.dirty = True  # True iif all coalesced writes are dirty writes
+        self.timer = timer
+
+    def add(self, conf):
+        """Coalesce parameters of input conf with parameters to write."""
+
+        for category in conf.values():
+
+            if category.name not in self.conf:
+                self.conf += Category(category.name)
+
+            pcategory = self.conf[category.name]
+
+            for param in category.values():
+                pcategory[param.name] = param
+
+
+_WRITEBEHINDS = WeakKeyDictionary()  #: drivers with pending writes.
+
+
+@atexit_register
+def _flushall():
+    """Flush pending writes of all drivers at exit."""
+
+    for driver in list(_WRITEBEHINDS):
+
+        try:
+            driver.flush()
+
+        except Exception:
+            pass
+
+
 class FileConfDriver(ConfDriver):
     """Conf Manager dedicated to files."""
 
+    DEFAULT_COMPACTION = 64  #: default number of journal entries to compact.
+
+    def __init__(
+            self, journal=False, compaction=DEFAULT_COMPACTION, delay=None,
+            *args, **kwargs
+    ):
+        """
+        :param bool journal: if True (False by default), dirty writes are
+            appended to a journal instead of rewriting the resource.
+        :param int compaction: number of journal entries written by this
+            driver which triggers the compaction of the journal into the
+            resource.
+        :param float delay: if not None (default), number of seconds during
+            which writes on a resource are coalesced before being written in
+            background (see flush and close).
+        """
+
+        super(FileConfDriver, self).__init__(*args, **kwargs)
+
+        self.journal = journal
+        self.compaction = compaction
+        self.delay = delay
+
+        self._pending = {}  # pending writes by resource path
+        self._lock = Lock()  # pending writes lock
+        self._wlock = RLock()  # resource writes lock
+        self._journals = {}  # journal entries written by journal path
+
     def rscpaths(self, path):
 
-        result = list(
-            join(conf_dir, path) for conf_dir in CONF_DIRS
-            if exists(join(conf_dir, path))
-        )
+        result = []
+
+        for conf_dir in CONF_DIRS:
+            rscpath = self._rscpath(join(conf_dir, path))
 
-        rel_path = expanduser(path)  # add relative path
-        if exists(rel_path):
+            if rscpath is not None:
+                result.append(rscpath)
+
+        rel_path = self._rscpath(expanduser(path))  # add relative path
+        if rel_path is not None:
             result.append(rel_path)
 
         else:
-            abs_path = abspath(path)  # add absolute path
-            if exists(abs_path):
+            abs_path = self._rscpath(abspath(path))  # add absolute path
+            if abs_path is not None:
                 result.append(abs_path)
 
+        # an absolute path is joined to all conf dirs
+        result = list(OrderedDict.fromkeys(result))
+
+        return result
+
+    @staticmethod
+    def _rscpath(path):
+        """Get the existing resource path of input path, or of its first
+        compressed variant (see COMPRESSIONS).
+
+        :rtype: str"""
+
+        result = None
+
+        if exists(path):
+            result = path
+
+        else:
+            for suffix in COMPRESSIONS:
+
+                if exists(path + suffix):
+                    result = path + suffix
+                    break
+
+        return result
+
+    def setconf(self, conf, rscpath, logger=None, dirty=False):
+
+        if self.delay is None:
+            with self._wlock:
+                self._writeconf(
+                    conf=conf, rscpath=rscpath, logger=logger, dirty=dirty
+                )
+
+        else:
+            self._delayconf(
+                conf=conf, rscpath=rscpath, logger=logger, dirty=dirty
+            )
+
+    def _delayconf(self, conf, rscpath, logger=None, dirty=False):
+        """Coalesce input conf with pending writes of input rscpath.
+
+        Parameters are shared with input conf, therefore their values at the
+        flush time are written."""
+
+        if dirty:
+            conf = self._dirtyconf(conf)
+
+            if conf is None:  # nothing to write
+                return
+
+        with self._lock:
+
+            pending = self._pending.get(rscpath)
+
+            if pending is None:
+                pending = self._pending[rscpath] = _PendingWrite(
+                    logger=logger, timer=self._timer(rscpath)
+                )
+                _WRITEBEHINDS[self] = True
+
+            elif pending.timer is None:  # after a failed write
+                pending.timer = self._timer(rscpath)
+
+            if logger is not None:
+                pending.logger = logger
+
+            pending.dirty = pending.dirty and dirty
+
+            pending.add(conf)
+
+    def _timer(self, rscpath):
+        """Start a timer which flushes pending writes of input rscpath."""
+
+        result = Timer(self.delay, self._flushdelayed, args=(rscpath,))
+        result.daemon = True
+        result.start()
+
+        return result
+
+    def _flushdelayed(self, rscpath):
+        """Flush pending writes of input rscpath from the delay timer.
+
+        Failed writes are kept for the next flush."""
+
+        try:
+            self.flush(rscpath=rscpath)
+
+        except ConfDriver.Error:  # logged by flush if a logger is given
+            pass
+
+    def flush(self, rscpath=None):
+        """Write pending writes.
+
+        Failed writes are kept pending for the next flush.
+
+        :param str rscpath: resource path to flush. Default all resources.
+        :raises: ConfDriver.Error in case of write error."""
+
+        with self._lock:
+
+            if rscpath is None:
+                pendings = self._pending
+                self._pending = {}
+
+            else:
+                pending = self._pending.pop(rscpath, None)
+                pendings = {} if pending is None else {rscpath: pending}
+
+        errors = []
+
+        with self._wlock:
+
+            for rscpath, pending in pendings.items():
+
+                if pending.timer is not None:
+                    pending.timer.cancel()
+
+                try:
+                    self._writeconf(
+                        conf=pending.conf, rscpath=rscpath,
+                        logger=pending.logger, dirty=pending.dirty, strict=True
+                    )
+
+                except Exception as ex:
+                    errors.append('{0}: {1}'.format(rscpath, ex))
+                    self._requeue(rscpath, pending)
+
+        if errors:
+            raise self.Error(
+                'Error while writing pending confs. {0}'.format(
+                    ', '.join(errors)
+                )
+            )
+
+    def _requeue(self, rscpath, pending):
+        """Restore a failed pending write before newer pending writes."""
+
+        with self._lock:
+
+            newpending = self._pending.get(rscpath)
+
+            pending.timer = None
+
+            if newpending is not None:  # newer parameters are written after
+                pending.add(newpending.conf)
+                pending.dirty = pending.dirty and newpending.dirty
+                pending.timer = newpending.timer
+
+                if newpending.logger is not None:
+                    pending.logger = newpending.logger
+
+            self._pending[rscpath] = pending
+            _WRITEBEHINDS[self] = True
+
+    def close(self):
+        """Flush pending writes before releasing this driver."""
+
+        self.flush()
+
+        _WRITEBEHINDS.pop(self, None)
+
+    def _writeconf(
+            self, conf, rscpath, logger=None, dirty=False, strict=False
+    ):
+        """Write input conf in input rscpath in the journal or in the
+        resource.
+
+        :param bool strict: if True (False by default), raise resource write
+            errors even without logger (see ConfDriver.setconf)."""
+
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        if self.journal and dirty and exists(rscpath):
+
+            dirtyconf = self._dirtyconf(conf)
+
+            if dirtyconf is not None:
+
+                try:
+                    self._journalize(dirtyconf, journalpath)
+
+                except Exception as ex:
+                    if logger is not None:
+                        logger.error(
+                            'Error while journaling conf to {0}: {1}'.format(
+                                journalpath, ex
+                            )
+                        )
+                    raise self.Error(ex)
+
+                self._clean(dirtyconf)
+
+                # entries are counted instead of reading the journal
+                count = self._journals.get(journalpath, 0) + 1
+                self._journals[journalpath] = count
+
+                if count >= self.compaction:
+                    self.compact(rscpath=rscpath, logger=logger)
+
+        else:
+            if exists(journalpath):  # journal entries are older than conf
+                self.compact(rscpath=rscpath, logger=logger)
+
+            if strict:
+                self._write(
+                    conf=conf, rscpath=rscpath, logger=logger, dirty=dirty
+                )
+
+            else:
+                super(FileConfDriver, self).setconf(
+                    conf=conf, rscpath=rscpath, logger=logger, dirty=dirty
+                )
+
+    def _write(self, conf, rscpath, logger=None, dirty=False):
+        """Write input conf in the resource of input rscpath.
+
+        Contrary to ConfDriver.setconf, errors are raised without logger.
+
+        :raises: ConfDriver.Error in case of write error."""
+
+        if dirty:
+            conf = self._dirtyconf(conf)
+
+            if conf is None:  # nothing to write
+                return
+
+        resource = self.pathresource(rscpath=rscpath, logger=logger)
+
+        if resource is None:
+            resource = self.resource()
+
+        try:
+            self._setconf(conf=conf, resource=resource, rscpath=rscpath)
+
+        except Exception as ex:
+            msg = 'Error while setting conf to {0}.'.format(rscpath)
+
+            if logger is not None:
+                logger.error('{0} {1}: {2}'.format(msg, ex, format_exc()))
+
+            reraise(self.Error, self.Error(msg))
+
+        self._clean(conf)
+
+    def compact(self, rscpath, logger=None):
+        """Compact the journal of a resource into the resource.
+
+        The journal is removed only if the resource has been rewritten.
+
+        :param str rscpath: resource path.
+        :param Logger logger: logger to use.
+        :raises: ConfDriver.Error if the resource can not be rewritten."""
+
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        if exists(journalpath):
+
+            conf = self._getconf(rscpath=rscpath, logger=logger)
+
+            if conf is None:
+                raise self.Error(
+                    'Error while reading {0} to compact {1}.'.format(
+                        rscpath, journalpath
+                    )
+                )
+
+            self._write(conf=conf, rscpath=rscpath, logger=logger)
+
+            remove(journalpath)
+
+        self._journals.pop(journalpath, None)
+
+    @staticmethod
+    def _journalize(conf, journalpath):
+        """Append a conf to a journal.
+
+        Only the last byte of the journal is read, in order to terminate a
+        truncated entry."""
+
+        entry = {}
+
+        for category in conf.values():
+
+            params = entry[category.name] = {}
+
+            for param in category.values():
+
+                pname = param.name
+
+                if not isinstance(pname, string_types):  # regex name
+                    pname = pname.pattern
+
+                params[pname] = param.svalue
+
+        line = '{0}\n'.format(dumps(entry))
+
+        if exists(journalpath) and getsize(journalpath):
+
+            with open(journalpath, 'rb') as handle:
+                handle.seek(-1, SEEK_END)
+
+                if handle.read(1) != b'\n':  # after a truncated entry
+                    line = '\n{0}'.format(line)
+
+        with open(journalpath, 'a') as handle:
+            handle.write(line)  # one write per entry
+
+    def _getconf(self, rscpath, logger=None, conf=None, *args, **kwargs):
+
+        if rscpath in self._pending:  # read its own writes
+
+            try:
+                self.flush(rscpath=rscpath)
+
+            except ConfDriver.Error:  # kept pending for the next flush
+                if logger is not None:
+                    logger.warning(
+                        'Pending writes of {0} are not read.'.format(rscpath)
+                    )
+
+        result = super(FileConfDriver, self)._getconf(
+            rscpath=rscpath, logger=logger, conf=conf, *args, **kwargs
+        )
+
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        if exists(journalpath):
+            result = self._applyjournal(
+                result, journalpath, conf=conf,
+                projection=kwargs.get('projection')
+            )
+
+        return result
+
+    def _applyjournal(self, result, journalpath, conf=None, projection=None):
+        """Apply journal entries on a resource conf.
+
+        A last truncated entry is ignored.
+
+        :param Configuration result: resource conf to update.
+        :rtype: Configuration"""
+
+        with open(journalpath, 'r') as handle:
+            lines = handle.readlines()
+
+        for line in lines:
+
+            try:
+                entry = loads(line)
+
+            except ValueError:  # truncated entry
+                continue
+
+            for cname, params in entry.items():
+
+                if projection is not None and not projection.category(cname):
+                    continue
+
+                if result is None:
+                    result = Configuration()
+
+                if cname not in result:
+                    result += Category(cname)
+
+                category = result[cname]
+
+                for pname, svalue in params.items():
+
+                    if projection is not None and not projection.param(
+                            cname, pname
+                    ):
+                        continue
+
+                    param = Parameter(name=pname, svalue=svalue)
+
+                    if conf is not None:
+                        self._updateparam(param=param, cname=cname, conf=conf)
+
+                    param.dirty = False
+
+                    category[param.name] = param
+
         return result
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Binary configuration file driver."""
+
+from __future__ import absolute_import
+
+__all__ = ['BINFileConfDriver']
+
+from mmap import mmap, ACCESS_READ
+
+from os import fstat
+
+from .base import FileConfDriver, atomicopen, rscopen, _compression
+from ..bin import BINConfDriver, BINResource
+
+
+class BINFileConfDriver(FileConfDriver, BINConfDriver):
+    """Manage binary resource configuration from file.
+
+    Files are read through mmap, therefore only used categories are read.
+    Compressed files are decompressed in memory."""
+
+    def _pathresource(self, rscpath):
+
+        result = None
+
+        if _compression(rscpath) is not None:  # mmap needs a plain file
+
+            with rscopen(rscpath, 'rb') as fpr:
+                content = fpr.read()
+
+            if content:
+                result = BINResource(content)
+
+        else:
+            with open(rscpath, 'rb') as fpr:
+
+                if fstat(fpr.fileno()).st_size:  # mmap can not map empty files
+                    result = BINResource(
+                        mmap(fpr.fileno(), 0, access=ACCESS_READ)
+                    )
+
+        return result
+
+    def _closeresource(self, resource):
+
+        resource.close()  # release the mapping
+
+    def _setconf(self, conf, resource, rscpath):
+
+        result = super(BINFileConfDriver, self)._setconf(
+            conf=conf, resource=resource, rscpath=rscpath
+        )
+
+        if resource is not None:
+            resource.close()  # release the mapping before writing
+
+        with atomicopen(rscpath, 'wb') as fpw:
+
+            fpw.write(result)
+
+        return result
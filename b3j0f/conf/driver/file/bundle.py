@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Zip archive configuration driver.
+
+A bundle is a zip archive which contains configuration resources (json, ini,
+xml, etc.). The central directory of the archive is read once and indexes
+resources, therefore getting all resources of a bundle needs only one file
+opening. Resources are parsed by the driver associated to their suffix.
+
+.. code-block:: python
+
+    driver = BundleConfDriver(archive='/etc/myapp/conf.zip')
+    conf = driver.getconf('myapp/db.json')
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['BundleConfDriver']
+
+from os import stat
+from os.path import expanduser, splitext
+from threading import RLock
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from .base import atomicopen
+from ..base import DelegateConfDriver
+
+
+class BundleConfDriver(DelegateConfDriver):
+    """Manage configuration resources from a zip archive.
+
+    Resource paths are the archive path joined to archive member names. The
+    archive is reopened if it changed since its last reading."""
+
+    def __init__(self, archive, drivers=None, *args, **kwargs):
+        """
+        :param str archive: archive path.
+        :param OrderedDict drivers: drivers by resource suffix. Resources
+            with an unknown suffix are parsed by the first driver which
+            succeeds. Default json, ini (.ini and .conf), xml and bin drivers.
+        """
+
+        super(BundleConfDriver, self).__init__(*args, **kwargs)
+
+        self.archive = expanduser(archive)
+        self.drivers = self.defaultdrivers() if drivers is None else drivers
+
+        self._zipfile = None  # opened archive
+        self._stat = None  # archive (mtime, size) when it was opened
+        self._lock = RLock()  # opened archive lock
+
+    def _getzipfile(self):
+        """Get the opened archive, or None if the archive does not exist.
+
+        :rtype: ZipFile"""
+
+        with self._lock:
+
+            try:
+                rscstat = stat(self.archive)
+
+            except OSError:
+                rscstat = None
+
+            else:
+                rscstat = (rscstat.st_mtime, rscstat.st_size)
+
+            if rscstat != self._stat:
+                self.close()
+
+                if rscstat is not None:
+                    self._zipfile = ZipFile(self.archive)
+
+                self._stat = rscstat
+
+            return self._zipfile
+
+    def close(self):
+        """Close the opened archive."""
+
+        with self._lock:
+
+            if self._zipfile is not None:
+                self._zipfile.close()
+
+            self._zipfile = None
+            self._stat = None
+
+    def names(self):
+        """Get archive member names.
+
+        :rtype: list"""
+
+        zipfile = self._getzipfile()
+
+        return [] if zipfile is None else zipfile.namelist()
+
+    def _member(self, rscpath):
+        """Get the archive member name of input resource path."""
+
+        prefix = '{0}/'.format(self.archive)
+
+        return rscpath[len(prefix):] if rscpath.startswith(prefix) else rscpath
+
+    def _drivers(self, member):
+        """Get drivers able to parse input archive member.
+
+        :rtype: list"""
+
+        return self._suffixdrivers(splitext(member)[1])
+
+    def rscpaths(self, path):
+
+        result = []
+
+        zipfile = self._getzipfile()
+
+        if zipfile is not None:
+
+            member = path.replace('\\', '/').lstrip('/')
+
+            try:
+                zipfile.getinfo(member)  # central directory lookup
+
+            except KeyError:
+                pass
+
+            else:
+                result.append('{0}/{1}'.format(self.archive, member))
+
+        return result
+
+    def resource(self):
+
+        return None
+
+    def _pathresource(self, rscpath):
+
+        result = None
+
+        member = self._member(rscpath)
+
+        with self._lock:
+
+            zipfile = self._getzipfile()
+
+            try:
+                content = zipfile.read(member)
+
+            except (KeyError, AttributeError):  # missing member or archive
+                return result
+
+        error = None
+
+        for driver in self._drivers(member):
+
+            try:
+                resource = driver._pathresource(content)
+
+            except Exception as ex:
+                error = ex
+
+            else:
+                if resource is not None:
+                    result = (driver, resource)
+                    break
+
+        else:
+            if error is not None:
+                raise error
+
+        return result
+
+    def _setconf(self, conf, resource, rscpath):
+
+        member = self._member(rscpath)
+
+        if resource is None:
+            driver = self._drivers(member)[0]
+            resource = driver.resource()
+
+        else:
+            driver, resource = resource
+
+        content = driver._setconf(conf=conf, resource=resource, rscpath=member)
+
+        with self._lock:
+
+            zipfile = self._getzipfile()
+
+            # zip members can not be replaced, therefore rewrite the archive
+            with atomicopen(self.archive, 'wb') as handle:
+
+                with ZipFile(handle, 'w', ZIP_DEFLATED) as newzipfile:
+
+                    if zipfile is not None:
+                        for info in zipfile.infolist():
+                            if info.filename != member:
+                                newzipfile.writestr(info, zipfile.read(info))
+
+                    newzipfile.writestr(member, content)
+
+            self.close()
+
+        return content
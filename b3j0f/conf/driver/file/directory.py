@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Configuration directory driver.
+
+A configuration directory (such as ``myapp.conf.d``) contains configuration
+fragments which are merged in the lexical order of their names: parameters of
+a fragment override parameters of previous fragments. Hidden files and files
+without a known suffix are ignored.
+
+Fragments are parsed by the file driver associated to their suffix, in
+parallel if several workers are given, and fragment resources are cached by
+file signature, therefore only changed fragments are parsed again.
+
+.. code-block:: python
+
+    driver = DirFileConfDriver()
+    conf = driver.getconf('myapp.conf.d')
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['DirFileConfDriver', 'DirResource']
+
+from os import listdir, stat
+from os.path import join, isdir
+from stat import S_ISREG
+from threading import Lock
+from multiprocessing.pool import ThreadPool
+
+from b3j0f.utils.version import OrderedDict
+
+from .base import FileConfDriver, _compression
+from ..base import DelegateConfDriver
+from .json import JSONFileConfDriver
+from .ini import INIFileConfDriver
+from .xml import XMLFileConfDriver
+from .bin import BINFileConfDriver
+
+
+class DirResource(object):
+    """Configuration directory resource which merges fragment resources."""
+
+    __slots__ = ('fragments',)
+
+    def __init__(self, fragments=None):
+        """
+        :param list fragments: (fragment path, driver, resource) in the merge
+            order.
+        """
+
+        super(DirResource, self).__init__()
+
+        self.fragments = [] if fragments is None else fragments
+
+    def cnames(self):
+        """Get category names in the merge order.
+
+        :rtype: list"""
+
+        result = OrderedDict()
+
+        for _, driver, resource in self.fragments:
+            for cname in driver._cnames(resource=resource):
+                result[cname] = None
+
+        return list(result)
+
+    def pitems(self, cname):
+        """Get raw parameters of a category such as (name, (driver, resource,
+        raw parameter)) where the last fragment wins, or None if a fragment
+        driver does not support raw parameters.
+
+        :rtype: list"""
+
+        result = OrderedDict()
+
+        for _, driver, resource in self.fragments:
+
+            if cname in driver._cnames(resource=resource):
+
+                items = driver._pitems(resource=resource, cname=cname)
+
+                if items is None:
+                    return None
+
+                for pname, item in items:
+                    result[pname] = (driver, resource, item)
+
+        return list(result.items())
+
+    def params(self, cname):
+        """Get parameters of a category where the last fragment wins.
+
+        :rtype: list"""
+
+        result = OrderedDict()
+
+        for _, driver, resource in self.fragments:
+
+            if cname in driver._cnames(resource=resource):
+
+                for param in driver._params(resource=resource, cname=cname):
+                    result[param.name] = param
+
+        return list(result.values())
+
+
+class DirFileConfDriver(FileConfDriver, DelegateConfDriver):
+    """Manage configuration directories of fragments.
+
+    Written parameters are written in the last fragment."""
+
+    #: default (fragment suffix, file driver class).
+    DRIVERS = (
+        ('.json', JSONFileConfDriver), ('.ini', INIFileConfDriver),
+        ('.conf', INIFileConfDriver), ('.xml', XMLFileConfDriver),
+        ('.bin', BINFileConfDriver)
+    )
+
+    #: default number of fragment parsing threads. Parsing is cpu bound and
+    #: threads are worth only when files are slow to read (network fs, etc.).
+    DEFAULT_WORKERS = 1
+
+    def __init__(
+            self, drivers=None, workers=DEFAULT_WORKERS, *args, **kwargs
+    ):
+        """
+        :param OrderedDict drivers: file drivers by fragment suffix. Default
+            json, ini (.ini and .conf), xml and bin file drivers.
+        :param int workers: maximal number of fragment parsing threads.
+        """
+
+        super(DirFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.drivers = self.defaultdrivers() if drivers is None else drivers
+        self.workers = workers
+
+        # (signature, driver, resource) by fragment path by directory path
+        self._cache = {}
+        self._cachelock = Lock()
+
+    def rscpaths(self, path):
+
+        return [
+            rscpath for rscpath in super(DirFileConfDriver, self).rscpaths(path)
+            if isdir(rscpath)
+        ]
+
+    def resource(self):
+
+        return DirResource()
+
+    def _driver(self, filename):
+        """Get the driver of a fragment name or None if it is ignored.
+
+        :rtype: FileConfDriver"""
+
+        result = None
+
+        if not filename.startswith('.'):  # hidden or temporary files
+
+            suffix = _compression(filename)
+
+            if suffix is not None:
+                filename = filename[:-len(suffix)]
+
+            for dsuffix in self.drivers:
+                if filename.endswith(dsuffix):
+                    result = self.drivers[dsuffix]
+                    break
+
+        return result
+
+    def _fragments(self, rscpath):
+        """Get (fragment path, signature, driver) of a directory in the lexical
+        order.
+
+        :rtype: list"""
+
+        result = []
+
+        for filename in sorted(listdir(rscpath)):
+
+            driver = self._driver(filename)
+
+            if driver is not None:
+
+                fragpath = join(rscpath, filename)
+
+                try:
+                    fstat = stat(fragpath)
+
+                except OSError:  # removed meanwhile
+                    continue
+
+                if S_ISREG(fstat.st_mode):
+                    signature = (fstat.st_ino, fstat.st_size, fstat.st_mtime)
+                    result.append((fragpath, signature, driver))
+
+        return result
+
+    def _pathresource(self, rscpath):
+
+        fragments = self._fragments(rscpath)
+
+        with self._cachelock:
+            cache = self._cache.get(rscpath, {})
+
+        entries = {}  # (signature, driver, resource) by fragment path
+        misses = []
+
+        for fragpath, signature, driver in fragments:
+
+            entry = cache.get(fragpath)
+
+            if entry is not None and entry[:2] == (signature, driver):
+                entries[fragpath] = entry
+
+            else:
+                misses.append((fragpath, signature, driver))
+
+        if misses:
+
+            if len(misses) == 1 or self.workers < 2:
+                resources = [
+                    driver._pathresource(fragpath)
+                    for fragpath, _, driver in misses
+                ]
+
+            else:
+                pool = ThreadPool(min(self.workers, len(misses)))
+
+                try:
+                    resources = pool.map(
+                        lambda miss: miss[2]._pathresource(miss[0]), misses
+                    )
+
+                finally:
+                    pool.close()
+                    pool.join()
+
+            for (fragpath, signature, driver), resource in zip(
+                    misses, resources
+            ):
+                entries[fragpath] = (signature, driver, resource)
+
+        with self._cachelock:  # forget removed fragments
+            self._cache[rscpath] = entries
+
+        result = DirResource(
+            [
+                (fragpath, driver, entries[fragpath][2])
+                for fragpath, _, driver in fragments
+                if entries[fragpath][2] is not None
+            ]
+        )
+
+        return result
+
+    def _cnames(self, resource):
+
+        return resource.cnames()
+
+    def _pitems(self, resource, cname):
+
+        return resource.pitems(cname)
+
+    def _param(self, resource, cname, item):
+
+        driver, fresource, item = item
+
+        return driver._param(resource=fresource, cname=cname, item=item)
+
+    def _params(self, resource, cname):
+
+        return resource.params(cname)
+
+    def _setconf(self, conf, resource, rscpath):
+
+        if not resource.fragments:
+            raise self.Error('No fragment in {0}.'.format(rscpath))
+
+        fragpath, driver, _ = resource.fragments[-1]
+
+        # merge conf in a new resource because the cached one has to match
+        # the fragment file if the write fails
+        fresource = driver._pathresource(fragpath)
+
+        if fresource is None:
+            fresource = driver.resource()
+
+        result = driver._setconf(
+            conf=conf, resource=fresource, rscpath=fragpath
+        )
+
+        return result
@@ -26,51 +26,32 @@
 
 """Ini configuration file driver."""
 
-__all__ = ['INIFileConfDriver']
-
-from six.moves.configparser import RawConfigParser
-
-from .base import FileConfDriver
-from ...model.param import Parameter
+from __future__ import absolute_import
 
+__all__ = ['INIFileConfDriver']
 
-class INIFileConfDriver(FileConfDriver):
-    """Manage ini resource configuration."""
+from .base import FileConfDriver, atomicopen, rscopen
+from ..ini import INIConfDriver
 
-    def resource(self):
 
-        return RawConfigParser()
+class INIFileConfDriver(FileConfDriver, INIConfDriver):
+    """Manage ini resource configuration from ini file."""
 
     def _pathresource(self, rscpath):
 
-        result = RawConfigParser()
+        with rscopen(rscpath) as fpr:
 
-        result.read(rscpath)
-
-        if not result.sections():
-            result = None
+            result = self._read(fpr, rscpath)
 
         return result
 
-    def _cnames(self, resource):
-
-        return resource.sections()
-
-    def _params(self, resource, cname):
-
-        return list(
-            Parameter(item[0], svalue=item[1]) for item in resource.items(cname)
-        )
-
     def _setconf(self, conf, resource, rscpath):
 
-        for category in conf.values():
-
-            if not resource.has_section(category.name):
-                resource.add_section(category.name)
+        result = super(INIFileConfDriver, self)._setconf(
+            conf=conf, resource=resource, rscpath=rscpath
+        )
 
-            for param in category.values():
-                resource.set(category.name, param.name, param.svalue)
+        with atomicopen(rscpath) as fps:
+            fps.write(result)
 
-        with open(rscpath, 'w') as fps:
-            resource.write(fps)
+        return result
@@ -36,7 +36,7 @@ try:
 except ImportError:
     from simplejson import load, dump
 
-from .base import FileConfDriver
+from .base import FileConfDriver, atomicopen, rscopen
 from ..json import JSONConfDriver
 
 
@@ -47,7 +47,7 @@ class JSONFileConfDriver(FileConfDriver, JSONConfDriver):
 
         result = None
 
-        with open(rscpath, 'r') as fpr:
+        with rscopen(rscpath) as fpr:
 
             result = load(fpr)
 
@@ -57,6 +57,6 @@ class JSONFileConfDriver(FileConfDriver, JSONConfDriver):
 
         super(JSONFileConfDriver, self)._setconf(conf, resource, rscpath)
 
-        with open(rscpath, 'w') as fpw:
+        with atomicopen(rscpath) as fpw:
 
             dump(resource, fpw)
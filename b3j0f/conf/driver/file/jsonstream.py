@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Streaming JSON configuration file driver.
+
+JSON files are read through mmap and indexed in one pass by category. Only
+category contents which are used are parsed, therefore the whole JSON object
+graph is never materialized.
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['JSONStreamFileConfDriver', 'JSONIndex']
+
+try:
+    from json import loads
+
+except ImportError:
+    from simplejson import loads
+
+from mmap import mmap, ACCESS_READ
+
+from os import fstat
+
+from re import compile as re_compile
+
+from .base import rscopen, _compression
+from .json import JSONFileConfDriver
+
+_WHITESPACES = re_compile(br'[ \t\n\r]*')  #: whitespaces to skip.
+_STRING = re_compile(br'"[^"\\]*(?:\\.[^"\\]*)*"')  #: string.
+#: skip strings and other characters until a bracket which changes the depth.
+_BRACKET = re_compile(
+    br'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*([{}\[\]])'
+)
+_SCALAR = re_compile(br'[^,}\] \t\n\r]+')  #: number, true, false or null.
+
+
+class JSONIndex(object):
+    """Index of category offsets in a JSON buffer.
+
+    Category contents are parsed when they are got by name. Duplicated
+    category names keep the last one such as ``json.load``."""
+
+    __slots__ = ('buffer', 'encoding', 'names', 'offsets')
+
+    def __init__(self, buffer, encoding='utf-8'):
+        """
+        :param buffer: buffer to index (bytes or mmap).
+        :param str encoding: buffer encoding.
+        :raises: ValueError if buffer is not a JSON object."""
+
+        super(JSONIndex, self).__init__()
+
+        self.buffer = buffer
+        self.encoding = encoding
+        self.names = []  # category names in order
+        self.offsets = {}  # category value (start, end) offsets by name
+
+        self._index()
+
+    def _index(self):
+        """Index category value offsets in one pass on this buffer."""
+
+        buffer = self.buffer
+
+        pos = _WHITESPACES.match(buffer, 0).end()
+
+        if buffer[pos: pos + 1] != b'{':
+            raise ValueError('JSON object expected at {0}.'.format(pos))
+
+        pos = _WHITESPACES.match(buffer, pos + 1).end()
+
+        if buffer[pos: pos + 1] == b'}':
+            pos += 1
+
+        else:
+
+            while True:
+
+                match = _STRING.match(buffer, pos)
+
+                if match is None:
+                    raise ValueError('JSON key expected at {0}.'.format(pos))
+
+                name = loads(match.group().decode(self.encoding))
+
+                pos = _WHITESPACES.match(buffer, match.end()).end()
+
+                if buffer[pos: pos + 1] != b':':
+                    raise ValueError('":" expected at {0}.'.format(pos))
+
+                start = _WHITESPACES.match(buffer, pos + 1).end()
+                pos = self._skip(buffer, start)
+
+                if name not in self.offsets:
+                    self.names.append(name)
+
+                self.offsets[name] = (start, pos)
+
+                pos = _WHITESPACES.match(buffer, pos).end()
+                char = buffer[pos: pos + 1]
+                pos = _WHITESPACES.match(buffer, pos + 1).end()
+
+                if char == b'}':
+                    break
+
+                elif char != b',':
+                    raise ValueError('"," expected at {0}.'.format(pos))
+
+        if _WHITESPACES.match(buffer, pos).end() != len(buffer):
+            raise ValueError('Extra data at {0}.'.format(pos))
+
+    @staticmethod
+    def _skip(buffer, pos):
+        """Get the end offset of the JSON value starting at input pos.
+
+        Nested values are skipped without being parsed.
+
+        :raises: ValueError if the value is not terminated."""
+
+        char = buffer[pos: pos + 1]
+
+        if char in (b'{', b'['):
+
+            depth = 0
+
+            while True:
+
+                match = _BRACKET.match(buffer, pos)
+
+                if match is None:
+                    raise ValueError('Unterminated value at {0}.'.format(pos))
+
+                pos = match.end()
+                depth += 1 if match.group(1) in (b'{', b'[') else -1
+
+                if depth == 0:
+                    break
+
+        else:
+            match = (_STRING if char == b'"' else _SCALAR).match(buffer, pos)
+
+            if match is None:
+                raise ValueError('JSON value expected at {0}.'.format(pos))
+
+            pos = match.end()
+
+        return pos
+
+    def keys(self):
+        """Get category names."""
+
+        return list(self.names)
+
+    def __iter__(self):
+
+        return iter(self.names)
+
+    def __len__(self):
+
+        return len(self.names)
+
+    def __contains__(self, cname):
+
+        return cname in self.offsets
+
+    def __getitem__(self, cname):
+        """Parse category content.
+
+        :raises: KeyError if cname is not indexed."""
+
+        start, end = self.offsets[cname]
+
+        return loads(self.buffer[start: end].decode(self.encoding))
+
+    def todict(self):
+        """Parse all categories.
+
+        :rtype: dict"""
+
+        return dict((cname, self[cname]) for cname in self.names)
+
+    def close(self):
+        """Close the indexed buffer if it is a mmap."""
+
+        if isinstance(self.buffer, mmap):
+            self.buffer.close()
+
+
+class JSONStreamFileConfDriver(JSONFileConfDriver):
+    """Manage json resource configuration from json file without loading the
+    whole file.
+
+    Files are read through mmap and category contents are parsed on demand.
+    Categories to read can be restricted with a projection (see Projection).
+    Compressed files are decompressed in memory."""
+
+    def _pathresource(self, rscpath):
+
+        result = None
+
+        if _compression(rscpath) is not None:  # mmap needs a plain file
+
+            with rscopen(rscpath, 'rb') as fpr:
+                content = fpr.read()
+
+            if content:
+                result = JSONIndex(content)
+
+        else:
+            with open(rscpath, 'rb') as fpr:
+
+                if fstat(fpr.fileno()).st_size:  # mmap can not map empty files
+                    result = JSONIndex(
+                        mmap(fpr.fileno(), 0, access=ACCESS_READ)
+                    )
+
+        return result
+
+    def _cnames(self, resource):
+
+        return resource.keys()
+
+    def _getresourceconf(self, resource, conf, projection, lazy):
+
+        result, _ = super(JSONStreamFileConfDriver, self)._getresourceconf(
+            resource=resource, conf=conf, projection=projection, lazy=lazy
+        )
+
+        # lazy categories get parsed contents (see _pitems), not the index
+        return result, False
+
+    def _closeresource(self, resource):
+
+        resource.close()  # release the mapping
+
+    def _setconf(self, conf, resource, rscpath):
+
+        if isinstance(resource, JSONIndex):
+            index, resource = resource, resource.todict()
+            index.close()  # release the mapping before writing
+
+        return super(JSONStreamFileConfDriver, self)._setconf(
+            conf=conf, resource=resource, rscpath=rscpath
+        )
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Shared configuration snapshot driver.
+
+A snapshot is a configuration exported in the binary format (see the bin
+driver), which is flat and indexed by offsets. Snapshots are published in a
+shared memory directory (``/dev/shm`` if it exists) and read through mmap,
+therefore processes of a host share the same memory pages, and parameters
+are decoded only when they are accessed.
+
+Publishing a new generation of a snapshot renames a new file over the
+previous one, which is an atomic pointer swap: views of the previous
+generation remain valid, and new views attach the new generation.
+
+.. code-block:: python
+
+    # publisher process
+    SnapshotFileConfDriver().publish(conf, 'myapp.b3cf')
+
+    # worker processes
+    conf = SnapshotFileConfDriver().view('myapp.b3cf')
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['SnapshotFileConfDriver', 'SHM_DIR']
+
+from mmap import mmap, ACCESS_READ
+
+from os import fstat
+from os.path import join, isdir, isabs, exists
+from threading import Lock
+
+from .base import atomicopen, _compression
+from .bin import BINFileConfDriver
+from ..bin import BINConfDriver, BINResource, export
+
+SHM_DIR = '/dev/shm' if isdir('/dev/shm') else None  #: shared memory dir.
+
+
+class SnapshotFileConfDriver(BINFileConfDriver):
+    """Publish and view configuration snapshots.
+
+    Snapshot files are mapped once per generation."""
+
+    def __init__(self, directory=SHM_DIR, *args, **kwargs):
+        """
+        :param str directory: directory of relative snapshot paths. Default
+            SHM_DIR.
+        """
+
+        super(SnapshotFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.directory = directory
+
+        self._generations = {}  # (signature, resource) by resource path
+        self._lock = Lock()
+
+    def _snapshotpath(self, path):
+        """Get the snapshot path of a relative or absolute path."""
+
+        if self.directory is not None and not isabs(path):
+            path = join(self.directory, path)
+
+        return path
+
+    def rscpaths(self, path):
+
+        result = super(SnapshotFileConfDriver, self).rscpaths(path)
+
+        rscpath = self._snapshotpath(path)
+
+        if exists(rscpath) and rscpath not in result:
+            result.append(rscpath)
+
+        return result
+
+    def publish(self, conf, path):
+        """Publish a new generation of a snapshot.
+
+        :param Configuration conf: configuration to publish.
+        :param str path: snapshot path, relative to this directory.
+        :return: snapshot path.
+        :rtype: str"""
+
+        result = self._snapshotpath(path)
+
+        content = export(conf)
+
+        with atomicopen(result, 'wb') as handle:
+            handle.write(content)
+
+        return result
+
+    def view(self, path, conf=None, logger=None):
+        """Get a read-only view of the last generation of a snapshot.
+
+        Parameters are decoded when they are accessed (see LazyCategory).
+
+        :param str path: snapshot path, relative to this directory.
+        :param Configuration conf: conf which gives parameter models.
+        :param Logger logger: logger to use.
+        :rtype: Configuration"""
+
+        return self.getconf(
+            path=self._snapshotpath(path), conf=conf, logger=logger,
+            lazy=True
+        )
+
+    def _pathresource(self, rscpath):
+
+        if _compression(rscpath) is not None:  # not mappable
+            return super(SnapshotFileConfDriver, self)._pathresource(rscpath)
+
+        with open(rscpath, 'rb') as fpr:
+
+            fst = fstat(fpr.fileno())
+            signature = (fst.st_ino, fst.st_size, fst.st_mtime)
+
+            with self._lock:
+                generation = self._generations.get(rscpath)
+
+            if generation is not None and generation[0] == signature:
+                return generation[1]
+
+            result = None
+
+            if fst.st_size:  # mmap can not map empty files
+                result = BINResource(mmap(fpr.fileno(), 0, access=ACCESS_READ))
+
+        with self._lock:  # views of previous generations keep their mapping
+            self._generations[rscpath] = (signature, result)
+
+        return result
+
+    def _closeresource(self, resource):
+
+        pass  # generation mappings are shared by views
+
+    def _setconf(self, conf, resource, rscpath):
+
+        # the mapping is not closed since views may use it
+        result = BINConfDriver._setconf(
+            self, conf=conf, resource=resource, rscpath=rscpath
+        )
+
+        with atomicopen(rscpath, 'wb') as fpw:
+            fpw.write(result)
+
+        return result
@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""SQLite configuration file driver.
+
+Categories and parameters are stored in a SQLite database in WAL mode, and
+parameters are indexed by (category, name). Therefore, several processes can
+share one configuration store, and only needed categories and parameters are
+read: projected parameters are selected by name, and lazy categories (see
+LazyCategory) select parameters one by one when they are accessed.
+
+Each thread uses its own connection to a database, and writes of a setconf
+are done in one transaction.
+
+Only SQLite databases are read, and databases are created in missing or
+empty files when a configuration is written. Other files are not changed.
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['SQLiteFileConfDriver']
+
+from os.path import getsize
+
+from re import compile as re_compile
+
+from sqlite3 import connect
+
+from threading import local
+
+from six import string_types
+
+from .base import FileConfDriver
+from ...model.param import Parameter
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS categories ('
+    'name TEXT PRIMARY KEY, position INTEGER NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS parameters ('
+    'category TEXT NOT NULL, name TEXT NOT NULL, position INTEGER NOT NULL, '
+    'regex INTEGER NOT NULL, svalue TEXT, PRIMARY KEY (category, name))'
+)  #: database schema where primary keys are indexes.
+
+_MAX_VARIABLES = 500  #: maximal number of variables in one statement.
+
+_HEADER = b'SQLite format 3\x00'  #: first bytes of a SQLite database.
+
+
+def _parameter(name, regex, svalue):
+    """Get a parameter from a stored row.
+
+    :param str name: parameter name or regex pattern.
+    :param int regex: 1 if name is a regex pattern.
+    :param str svalue: parameter serialized value.
+    :rtype: Parameter"""
+
+    result = Parameter(name=name, svalue=svalue)
+
+    # compile regex names which look like simple names
+    if regex and isinstance(result.name, string_types):
+        result.name = re_compile(name)
+
+    return result
+
+
+class SQLiteFileConfDriver(FileConfDriver):
+    """Manage configuration resources from SQLite databases."""
+
+    def __init__(self, timeout=5, *args, **kwargs):
+        """
+        :param float timeout: number of seconds to wait for a database lock.
+        """
+
+        super(SQLiteFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.timeout = timeout
+
+        self._local = local()  # connections by resource path per thread
+
+    def connection(self, rscpath, create=True):
+        """Get the connection of the current thread to a database.
+
+        :param str rscpath: database path.
+        :param bool create: create the database if the file is missing or
+            empty. Default True.
+        :return: connection or None if the database does not exist and
+            create is False.
+        :rtype: sqlite3.Connection
+        :raises: ConfDriver.Error if the file is not a SQLite database."""
+
+        connections = self._local.__dict__.setdefault('connections', {})
+
+        result = connections.get(rscpath)
+
+        if result is None:
+
+            if not self._isdatabase(rscpath) and not create:
+                return None
+
+            result = connect(rscpath, timeout=self.timeout)
+
+            result.execute('PRAGMA journal_mode=WAL')
+            result.execute('PRAGMA synchronous=NORMAL')  # safe in WAL mode
+
+            for statement in _SCHEMA:
+                result.execute(statement)
+
+            result.commit()
+
+            connections[rscpath] = result
+
+        return result
+
+    def _isdatabase(self, rscpath):
+        """Check if a file is a SQLite database.
+
+        :param str rscpath: database path.
+        :return: False if the file is missing or empty.
+        :rtype: bool
+        :raises: ConfDriver.Error if the file is not a SQLite database."""
+
+        try:
+            if not getsize(rscpath):
+                return False
+
+            with open(rscpath, 'rb') as handle:
+                header = handle.read(len(_HEADER))
+
+        except (IOError, OSError):  # missing file
+            return False
+
+        if header != _HEADER:
+            raise self.Error('{0} is not a SQLite database.'.format(rscpath))
+
+        return True
+
+    def close(self):
+        """Flush pending writes and close connections of the current thread.
+        """
+
+        super(SQLiteFileConfDriver, self).close()
+
+        connections = self._local.__dict__.pop('connections', {})
+
+        for connection in connections.values():
+            connection.close()
+
+    def resource(self):
+
+        return None
+
+    def _pathresource(self, rscpath):
+
+        return self.connection(rscpath, create=False)
+
+    def _cnames(self, resource):
+
+        return [
+            row[0] for row in resource.execute(
+                'SELECT name FROM categories ORDER BY position'
+            )
+        ]
+
+    def _pitems(self, resource, cname):
+
+        return [
+            (row[0], row) for row in resource.execute(
+                'SELECT name, regex FROM parameters WHERE category = ? '
+                'ORDER BY position', (cname,)
+            )
+        ]
+
+    def _param(self, resource, cname, item):
+
+        name, regex = item
+
+        row = resource.execute(
+            'SELECT svalue FROM parameters WHERE category = ? AND name = ?',
+            (cname, name)
+        ).fetchone()
+
+        return _parameter(name, regex, None if row is None else row[0])
+
+    def _params(self, resource, cname):
+
+        return [
+            _parameter(*row) for row in resource.execute(
+                'SELECT name, regex, svalue FROM parameters '
+                'WHERE category = ? ORDER BY position', (cname,)
+            )
+        ]
+
+    def _projectparams(self, resource, cname, projection):
+
+        projected = projection.categories.get(cname)
+
+        if projected is None or projected[1]:  # all parameters or regexes
+            params = self._params(resource=resource, cname=cname)
+
+        else:  # select projected names and regex names
+            names = list(projected[0])
+            rows = []
+
+            for index in range(0, max(len(names), 1), _MAX_VARIABLES):
+
+                chunk = names[index: index + _MAX_VARIABLES]
+
+                rows += resource.execute(
+                    'SELECT position, name, regex, svalue FROM parameters '
+                    'WHERE category = ? AND (regex = 1 OR name IN ({0}))'
+                    .format(', '.join('?' * len(chunk))),
+                    [cname] + chunk
+                ).fetchall()
+
+            rows = sorted(set(rows))
+
+            params = [_parameter(*row[1:]) for row in rows]
+
+        return [
+            param for param in params if projection.param(cname, param.name)
+        ]
+
+    def _setconf(self, conf, resource, rscpath):
+
+        if resource is None:
+            resource = self.connection(rscpath)
+
+        with resource:  # one transaction
+
+            cposition, = resource.execute(
+                'SELECT COALESCE(MAX(position), -1) FROM categories'
+            ).fetchone()
+
+            for category in conf.values():
+
+                cposition += 1
+
+                resource.execute(
+                    'INSERT OR IGNORE INTO categories VALUES (?, ?)',
+                    (category.name, cposition)
+                )
+
+                position, = resource.execute(
+                    'SELECT COALESCE(MAX(position), -1) FROM parameters '
+                    'WHERE category = ?', (category.name,)
+                ).fetchone()
+
+                rows = []
+
+                for param in category.values():
+
+                    position += 1
+
+                    pname, regex = param.name, 0
+
+                    if not isinstance(pname, string_types):  # regex name
+                        pname, regex = pname.pattern, 1
+
+                    rows.append(
+                        (category.name, pname, position, regex, param.svalue)
+                    )
+
+                # keep positions of existing parameters
+                resource.executemany(
+                    'INSERT OR IGNORE INTO parameters VALUES (?, ?, ?, ?, ?)',
+                    rows
+                )
+                resource.executemany(
+                    'UPDATE parameters SET svalue = ? '
+                    'WHERE category = ? AND name = ?',
+                    [(row[4], row[0], row[1]) for row in rows]
+                )
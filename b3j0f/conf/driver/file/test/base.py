@@ -29,14 +29,22 @@
 
 from unittest import main
 
-from ..base import FileConfDriver, CONF_DIRS
+from ..base import (
+    FileConfDriver, CONF_DIRS, JOURNAL_SUFFIX, COMPRESSIONS, atomicopen, rscopen
+)
 from ...test.base import ConfDriverTest
+from ....model.conf import configuration
+from ....model.cat import category
 from ....model.param import Parameter
 
 from pickle import load, dump
 
-from os import remove
-from os.path import exists, join
+from os import remove, listdir, chmod, stat
+from os.path import (
+    exists, join, dirname, basename, getmtime, abspath, isdir
+)
+from stat import S_IMODE
+from time import sleep
 
 
 class TestFileConfDriver(FileConfDriver):
@@ -63,7 +71,7 @@ class TestFileConfDriver(FileConfDriver):
 
         result = None
 
-        with open(rscpath, 'rb') as handle:
+        with rscopen(rscpath, 'rb') as handle:
 
             result = load(handle)
 
@@ -75,7 +83,7 @@ class TestFileConfDriver(FileConfDriver):
             for param in cat.values():
                 resource.setdefault(cat.name, {})[param.name] = param.svalue
 
-        with open(rscpath, 'wb') as handle:
+        with atomicopen(rscpath, 'wb') as handle:
 
             dump(resource, handle)
 
@@ -104,8 +112,377 @@ class FileConfDriverTest(ConfDriverTest):
 
             for rscpath in self.driver.rscpaths(path):
 
-                if exists(rscpath):
-                    remove(rscpath)
+                for filepath in (rscpath, rscpath + JOURNAL_SUFFIX):
+                    if exists(filepath):
+                        remove(filepath)
+
+            rscpath = join(CONF_DIRS[-1], path)
+
+            for suffix in COMPRESSIONS:
+                if exists(rscpath + suffix):
+                    remove(rscpath + suffix)
+
+    def _dirtyscenario(self):
+        """Write a conf, change a parameter and write dirty parameters.
+
+        :return: resource path."""
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        conf = configuration(
+            category('a', Parameter('b', svalue='1'), Parameter('c')),
+            category('d', Parameter('e', svalue='2'))
+        )
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        self.assertFalse(conf['a']['b'].dirty)
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertFalse(conf['a']['b'].dirty)
+
+        conf['d']['e'].svalue = '3'
+
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.assertFalse(conf['d']['e'].dirty)
+
+        return rscpath
+
+    def test_dirty(self):
+
+        rscpath = self._dirtyscenario()
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['a']['b'].svalue, '1')
+        self.assertEqual(conf['d']['e'].svalue, '3')
+        self.assertFalse(exists(rscpath + JOURNAL_SUFFIX))
+
+    def test_journal(self):
+
+        self.driver.journal = True
+        self.driver.compaction = 3
+
+        rscpath = self._dirtyscenario()
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        self.assertTrue(exists(journalpath))
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['a']['b'].svalue, '1')
+        self.assertEqual(conf['d']['e'].svalue, '3')
+
+        conf['a']['b'].svalue = '4'
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        with open(journalpath, 'a') as handle:  # truncated entry
+            handle.write('{"a": ')
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['a']['b'].svalue, '4')
+
+        conf['d']['f'] = Parameter('f', svalue='5')
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.assertFalse(exists(journalpath))  # compacted
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['a']['b'].svalue, '4')
+        self.assertEqual(conf['d']['e'].svalue, '3')
+        self.assertEqual(conf['d']['f'].svalue, '5')
+
+    def test_journal_count(self):
+        """Test to count journal entries without reading the journal."""
+
+        self.driver.journal = True
+        self.driver.compaction = 3
+
+        rscpath = self._dirtyscenario()  # first entry
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        with open(journalpath, 'a') as handle:  # entries of another driver
+            handle.write('{"a": {"b": "5"}}\n' * 10)
+
+        conf = self.driver.getconf(path=rscpath)
+        self.assertEqual(conf['a']['b'].svalue, '5')
+
+        conf['d']['e'].svalue = '4'
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.assertTrue(exists(journalpath))  # second entry
+
+        conf['d']['e'].svalue = '6'
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.assertFalse(exists(journalpath))  # compacted
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['a']['b'].svalue, '5')
+        self.assertEqual(conf['d']['e'].svalue, '6')
+
+    def test_journal_compaction_error(self):
+
+        self.driver.journal = True
+        self.driver.compaction = 100
+
+        rscpath = self._dirtyscenario()
+        journalpath = rscpath + JOURNAL_SUFFIX
+
+        def _setconf(*args, **kwargs):
+            raise IOError('disk full')
+
+        self.driver._setconf = _setconf
+
+        try:
+            self.assertRaises(
+                FileConfDriver.Error, self.driver.compact, rscpath=rscpath
+            )
+
+        finally:
+            del self.driver._setconf
+
+        self.assertTrue(exists(journalpath))  # journaled changes are kept
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['d']['e'].svalue, '3')
+
+        self.driver.compact(rscpath=rscpath)
+
+        self.assertFalse(exists(journalpath))
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['d']['e'].svalue, '3')
+
+    def test_rscpaths_absolute(self):
+
+        rscpath = abspath(self.driver.rscpaths(self.paths[0])[0])
+
+        self.assertEqual(self.driver.rscpaths(rscpath), [rscpath])
+
+    def test_compressed(self):
+
+        path = self.paths[0]
+        rscpath = join(CONF_DIRS[-1], path)
+
+        magics = {'.gz': b'\x1f\x8b', '.bz2': b'BZh', '.xz': b'\xfd7zXZ'}
+
+        for suffix in COMPRESSIONS:
+
+            crscpath = rscpath + suffix
+
+            conf = configuration(
+                category('a', Parameter('b', svalue=suffix)),
+                category('c', Parameter('d', svalue='e'))
+            )
+
+            self.driver.setconf(conf=conf, rscpath=crscpath)
+
+            with open(crscpath, 'rb') as handle:
+                self.assertEqual(
+                    handle.read(len(magics[suffix])), magics[suffix]
+                )
+
+        # plain resources have precedence over compressed resources
+        self.assertIn(rscpath, self.driver.rscpaths(path))
+
+        remove(rscpath)
+
+        for suffix in COMPRESSIONS:
+
+            crscpath = rscpath + suffix
+
+            rscpaths = self.driver.rscpaths(path)
+            self.assertIn(crscpath, rscpaths)
+
+            conf = self.driver.getconf(path=crscpath)
+
+            self.assertEqual(conf['a']['b'].svalue, suffix)
+            self.assertEqual(conf['c']['d'].svalue, 'e')
+
+            remove(crscpath)
+
+    def test_atomicopen(self):
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        with open(rscpath, 'w') as handle:
+            handle.write('old')
+
+        chmod(rscpath, 0o640)
+
+        try:
+            with atomicopen(rscpath) as handle:
+                handle.write('new')
+                raise ValueError()
+
+        except ValueError:
+            pass
+
+        with open(rscpath) as handle:
+            self.assertEqual(handle.read(), 'old')
+
+        with atomicopen(rscpath) as handle:
+            handle.write('new')
+
+        with open(rscpath) as handle:
+            self.assertEqual(handle.read(), 'new')
+
+        self.assertEqual(S_IMODE(stat(rscpath).st_mode), 0o640)
+
+        tmpfiles = [  # temporary files are removed or renamed
+            filename for filename in listdir(dirname(rscpath))
+            if filename.startswith('.{0}.'.format(basename(rscpath)))
+        ]
+        self.assertFalse(tmpfiles)
+
+    def test_atomicopen_new(self):
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+        newpath = '{0}.new'.format(rscpath)
+
+        try:
+            with atomicopen(newpath) as handle:
+                handle.write('new')
+
+            # permissions of a new file created with the process umask
+            self.assertEqual(
+                S_IMODE(stat(newpath).st_mode), S_IMODE(stat(rscpath).st_mode)
+            )
+
+        finally:
+            if exists(newpath):
+                remove(newpath)
+
+    def test_atomicopen_error(self):
+        """Test to release the temporary file if it can not be opened."""
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        def fdcount():
+            return len(listdir('/proc/self/fd')) if isdir('/proc') else 0
+
+        count = fdcount()
+
+        def openwrong():
+            with atomicopen(rscpath, mode='q'):
+                pass
+
+        self.assertRaises(ValueError, openwrong)
+
+        self.assertEqual(fdcount(), count)
+        self.assertFalse(
+            [
+                filename for filename in listdir(dirname(rscpath))
+                if filename.startswith('.{0}.'.format(basename(rscpath)))
+            ]
+        )
+
+    def test_writebehind(self):
+
+        self.driver.delay = 60
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+        mtime = getmtime(rscpath)
+
+        conf = configuration(
+            category('a', Parameter('b', svalue='1')),
+            category('d', Parameter('e', svalue='2'))
+        )
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        conf['a']['b'].svalue = '3'
+        conf['d']['e'].svalue = '4'
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.assertTrue(conf['a']['b'].dirty)  # not yet written
+        self.assertEqual(getmtime(rscpath), mtime)
+
+        rconf = self.driver.getconf(path=rscpath)  # flush before reading
+
+        self.assertEqual(rconf['a']['b'].svalue, '3')
+        self.assertEqual(rconf['d']['e'].svalue, '4')
+        self.assertFalse(conf['a']['b'].dirty)
+
+        conf['a']['b'].svalue = '5'
+        self.driver.setconf(conf=conf, rscpath=rscpath, dirty=True)
+
+        self.driver.close()
+
+        self.driver.delay = None
+
+        rconf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(rconf['a']['b'].svalue, '5')
+
+    def test_writebehind_error(self):
+
+        self.driver.delay = 60
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        conf = configuration(category('a', Parameter('b', svalue='1')))
+
+        def _setconf(*args, **kwargs):
+            raise IOError('disk full')
+
+        self.driver._setconf = _setconf
+
+        try:
+            self.driver.setconf(conf=conf, rscpath=rscpath)
+
+            self.assertRaises(FileConfDriver.Error, self.driver.flush)
+
+            self.assertIn(rscpath, self.driver._pending)  # kept pending
+            self.assertTrue(conf['a']['b'].dirty)
+
+            self.driver._flushdelayed(rscpath)  # timer failure is kept too
+
+            self.assertIn(rscpath, self.driver._pending)
+
+            conf2 = configuration(category('c', Parameter('d', svalue='2')))
+            self.driver.setconf(conf=conf2, rscpath=rscpath)
+
+        finally:
+            del self.driver._setconf
+
+        self.driver.close()
+
+        self.assertFalse(self.driver._pending)
+        self.assertFalse(conf['a']['b'].dirty)
+
+        self.driver.delay = None
+
+        rconf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(rconf['a']['b'].svalue, '1')
+        self.assertEqual(rconf['c']['d'].svalue, '2')
+
+    def test_writebehind_timer(self):
+
+        self.driver.delay = 0
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        conf = configuration(category('a', Parameter('b', svalue='1')))
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        for _ in range(100):  # wait for the background write
+            if not conf['a']['b'].dirty:
+                break
+            sleep(0.05)
+
+        self.assertFalse(self.driver._pending)
+        self.assertFalse(conf['a']['b'].dirty)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""BIN ConfDriver UTs."""
+
+from unittest import main
+
+from .base import FileConfDriverTest
+
+from ..bin import BINFileConfDriver
+from ....model.conf import configuration
+from ....model.cat import category
+from ....model.param import Parameter
+
+
+class BINConfDriverTest(FileConfDriverTest):
+    """Test BINConfDriver."""
+
+    __driverclass__ = BINFileConfDriver
+
+    def test_mapping(self):
+        """Test to release mappings which are not used by lazy categories."""
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        self.driver.setconf(
+            conf=configuration(category('A', Parameter('a', svalue='1'))),
+            rscpath=rscpath
+        )
+
+        resources = []
+
+        pathresource = self.driver._pathresource
+
+        def _pathresource(rscpath):
+            result = pathresource(rscpath)
+            resources.append(result)
+            return result
+
+        self.driver._pathresource = _pathresource
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertRaises(ValueError, len, resources[-1].buffer)  # closed
+
+        conf = self.driver.getconf(path=rscpath, lazy=True)
+
+        self.assertTrue(len(resources[-1].buffer))  # used by conf
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Bundle ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..bundle import BundleConfDriver
+from ..base import atomicopen
+from ...json import JSONConfDriver
+from ....model.conf import configuration
+from ....model.cat import category
+from ....model.param import Parameter
+
+from os import remove, close
+from os.path import exists
+
+from tempfile import mkstemp
+
+from zipfile import ZipFile
+
+
+class BundleConfDriverTest(UTCase):
+    """Test the BundleConfDriver."""
+
+    def setUp(self):
+
+        fd, self.archive = mkstemp(suffix='.zip')
+        close(fd)
+
+        with atomicopen(self.archive, 'wb') as handle:
+
+            with ZipFile(handle, 'w') as zipfile:
+                zipfile.writestr('a.json', '{"A": {"a": "1"}}')
+                zipfile.writestr('sub/b.conf', '[B]\nb = 2\n')
+                zipfile.writestr(
+                    'c.xml',
+                    '<configuration><category name="C">'
+                    '<parameter name="c" svalue="3"/>'
+                    '</category></configuration>'
+                )
+                zipfile.writestr('d', '{"D": {"d": "4"}}')
+
+        self.driver = BundleConfDriver(archive=self.archive)
+
+    def tearDown(self):
+
+        self.driver.close()
+
+        if exists(self.archive):
+            remove(self.archive)
+
+    def test_rscpaths(self):
+
+        self.assertEqual(
+            self.driver.rscpaths('sub/b.conf'),
+            ['{0}/sub/b.conf'.format(self.archive)]
+        )
+        self.assertEqual(self.driver.rscpaths('e.json'), [])
+
+    def test_missing_archive(self):
+
+        remove(self.archive)
+
+        self.assertEqual(self.driver.rscpaths('a.json'), [])
+        self.assertEqual(self.driver.names(), [])
+
+    def test_getconf(self):
+
+        for path, cname, pname, svalue in [
+                ('a.json', 'A', 'a', '1'),
+                ('sub/b.conf', 'B', 'b', '2'),
+                ('c.xml', 'C', 'c', '3'),
+                ('d', 'D', 'd', '4')  # unknown suffix
+        ]:
+            conf = self.driver.getconf(path=path)
+
+            self.assertEqual(conf[cname][pname].svalue, svalue)
+
+    def test_drivers(self):
+
+        driver = BundleConfDriver(
+            archive=self.archive, drivers={'': JSONConfDriver()}
+        )
+
+        conf = driver.getconf(path='d')
+
+        self.assertEqual(conf['D']['d'].svalue, '4')
+
+        driver.close()
+
+    def test_setconf(self):
+
+        conf = configuration(category('A', Parameter('e', svalue='5')))
+
+        self.driver.setconf(
+            conf=conf, rscpath=self.driver.rscpaths('a.json')[0]
+        )
+        self.driver.setconf(
+            conf=conf, rscpath='{0}/e.json'.format(self.archive)
+        )
+
+        self.assertEqual(
+            sorted(self.driver.names()),
+            ['a.json', 'c.xml', 'd', 'e.json', 'sub/b.conf']
+        )
+
+        conf = self.driver.getconf(path='a.json')
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertEqual(conf['A']['e'].svalue, '5')
+
+        conf = self.driver.getconf(path='e.json')
+
+        self.assertEqual(conf['A']['e'].svalue, '5')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Configuration directory driver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..directory import DirFileConfDriver
+from ..json import JSONFileConfDriver
+from .. import json
+from ..ini import INIFileConfDriver
+from ...projection import Projection
+from ....model.conf import configuration
+from ....model.cat import category, LazyCategory
+from ....model.param import Parameter
+
+from os import mkdir, utime
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from b3j0f.utils.version import OrderedDict
+
+
+class CountJSONFileConfDriver(JSONFileConfDriver):
+    """JSON file driver which counts parsed files."""
+
+    def __init__(self, *args, **kwargs):
+
+        super(CountJSONFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.parsed = []
+
+    def _pathresource(self, rscpath):
+
+        self.parsed.append(rscpath)
+
+        return super(CountJSONFileConfDriver, self)._pathresource(rscpath)
+
+
+class DirFileConfDriverTest(UTCase):
+    """Test the DirFileConfDriver."""
+
+    def setUp(self):
+
+        self.tmpdir = mkdtemp()
+        self.path = join(self.tmpdir, 'test.conf.d')
+
+        mkdir(self.path)
+        mkdir(join(self.path, 'sub.json'))  # ignored directory
+
+        self._write('20-b.conf', '[A]\nb = 2\nc = 2\n[B]\nd = 2\n')
+        self._write('10-a.json', '{"A": {"a": "1", "b": "1"}}')
+        self._write('30-c.json', '{"B": {"d": "3"}}')
+        self._write('.40-hidden.json', '{"A": {"a": "4"}}')
+        self._write('README', 'not a fragment')
+
+        self.json = CountJSONFileConfDriver()
+        self.driver = DirFileConfDriver(
+            workers=4, drivers=OrderedDict(
+                [('.json', self.json), ('.conf', INIFileConfDriver())]
+            )
+        )
+
+    def tearDown(self):
+
+        rmtree(self.tmpdir)
+
+    def _write(self, filename, content):
+
+        with open(join(self.path, filename), 'w') as handle:
+            handle.write(content)
+
+    def test_rscpaths(self):
+
+        self.assertIn(self.path, self.driver.rscpaths(self.path))
+        self.assertFalse(
+            self.driver.rscpaths(join(self.path, '10-a.json'))
+        )
+
+    def test_getconf(self):
+
+        conf = self.driver.getconf(path=self.path)
+
+        self.assertEqual(list(conf), ['A', 'B'])
+        self.assertEqual(list(conf['A']), ['a', 'b', 'c'])
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertEqual(conf['A']['b'].svalue, '2')
+        self.assertEqual(conf['A']['c'].svalue, '2')
+        self.assertEqual(conf['B']['d'].svalue, '3')
+
+    def test_cache(self):
+
+        self.driver.getconf(path=self.path)
+
+        self.assertEqual(len(self.json.parsed), 2)
+
+        self.driver.getconf(path=self.path)
+
+        self.assertEqual(len(self.json.parsed), 2)
+
+        self._write('30-c.json', '{"B": {"d": "33"}}')
+        utime(join(self.path, '30-c.json'), (0, 0))  # change the signature
+
+        conf = self.driver.getconf(path=self.path)
+
+        self.assertEqual(
+            self.json.parsed[2:], [join(self.path, '30-c.json')]
+        )
+        self.assertEqual(conf['B']['d'].svalue, '33')
+
+    def test_lazy_projection(self):
+
+        projection = Projection()
+        projection.add('A', 'b')
+
+        conf = self.driver.getconf(
+            path=self.path, projection=projection, lazy=True
+        )
+
+        self.assertEqual(list(conf), ['A'])
+        self.assertIsInstance(conf['A'], LazyCategory)
+        self.assertEqual(list(conf['A']), ['b'])
+        self.assertEqual(conf['A']['b'].svalue, '2')
+
+    def test_setconf(self):
+
+        conf = configuration(category('B', Parameter('e', svalue='5')))
+
+        self.driver.setconf(conf=conf, rscpath=self.path)
+
+        conf = JSONFileConfDriver().getconf(join(self.path, '30-c.json'))
+
+        self.assertEqual(conf['B']['e'].svalue, '5')
+
+        conf = self.driver.getconf(path=self.path)
+
+        self.assertEqual(conf['B']['d'].svalue, '3')
+        self.assertEqual(conf['B']['e'].svalue, '5')
+
+    def test_setconf_error(self):
+        """Test to keep cached fragments when a write fails."""
+
+        self.driver.getconf(path=self.path)
+
+        def dump(*args, **kwargs):
+            raise IOError('test')
+
+        json.dump, _dump = dump, json.dump
+
+        try:
+            conf = configuration(category('B', Parameter('e', svalue='5')))
+
+            self.assertRaises(
+                DirFileConfDriver.Error, self.driver._write,
+                conf=conf, rscpath=self.path
+            )
+
+        finally:
+            json.dump = _dump
+
+        conf = self.driver.getconf(path=self.path)
+
+        self.assertNotIn('e', conf['B'])  # the cached fragment is unchanged
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Streaming JSON ConfDriver UTs."""
+
+from __future__ import absolute_import
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from json import dumps
+
+from .base import FileConfDriverTest
+
+from ..jsonstream import JSONStreamFileConfDriver, JSONIndex
+from ...projection import Projection
+
+
+class JSONStreamConfDriverTest(FileConfDriverTest):
+    """Test JSONStreamFileConfDriver."""
+
+    __driverclass__ = JSONStreamFileConfDriver
+
+    def _write(self, content):
+        """Write a test file and get its resource path."""
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        with open(rscpath, 'wb') as handle:
+            handle.write(content)
+
+        return rscpath
+
+    def test_unparsed(self):
+
+        rscpath = self._write(b'{"a": {"b": 1}, "c": {"d": wrong}}')
+
+        conf = self.driver.getconf(
+            path=rscpath, projection=Projection(categories={'a': None})
+        )
+
+        self.assertEqual(list(conf), ['a'])  # c is not parsed
+        self.assertEqual(conf['a']['b'].value, 1)
+
+    def test_close(self):
+
+        rscpath = self._write(b'{"a": {"b": 1}}')
+
+        indexes = []
+
+        pathresource = self.driver._pathresource
+
+        def _pathresource(rscpath):
+            indexes.append(pathresource(rscpath))
+            return indexes[-1]
+
+        self.driver._pathresource = _pathresource
+
+        for lazy in (False, True):
+
+            conf = self.driver.getconf(path=rscpath, lazy=lazy)
+
+            self.assertEqual(conf['a']['b'].value, 1)
+            # mappings are released after reading
+            self.assertRaises(
+                ValueError, indexes[-1].buffer.__getitem__, slice(0, 1)
+            )
+
+
+class JSONIndexTest(UTCase):
+    """Test the JSONIndex."""
+
+    def test_empty(self):
+
+        index = JSONIndex(b' { } ')
+
+        self.assertEqual(index.keys(), [])
+
+    def test_index(self):
+
+        content = {
+            'a': {'b': '{"[\\"', 'c': [1, {'d': None}], 'e': True},
+            'f': {},
+            'g\\"h': {'i': -1.5e3}
+        }
+
+        index = JSONIndex(dumps(content, indent=2).encode('utf-8'))
+
+        self.assertEqual(set(index.keys()), set(content))
+
+        for cname in content:
+            self.assertEqual(index[cname], content[cname])
+
+        self.assertEqual(index.todict(), content)
+
+    def test_duplicate(self):
+
+        index = JSONIndex(b'{"a": {"b": 1}, "c": {}, "a": {"b": 2}}')
+
+        self.assertEqual(index.keys(), ['a', 'c'])
+        self.assertEqual(index['a'], {'b': 2})
+
+    def test_lazy(self):
+        """Test that only got categories are parsed."""
+
+        index = JSONIndex(b'{"a": {"b": 1}, "c": {"d": wrong}}')
+
+        self.assertEqual(index['a'], {'b': 1})
+        self.assertRaises(ValueError, index.__getitem__, 'c')
+
+    def test_wrong(self):
+
+        for buffer in [
+                b'[]', b'{"a" {}}', b'{"a": {}', b'{"a": {} "b": {}}',
+                b'{"a": "b}', b'{"a": {}} {}', b'{a: {}}'
+        ]:
+            self.assertRaises(ValueError, JSONIndex, buffer)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Snapshot ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from os import fork, waitpid, _exit, WEXITSTATUS
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from .base import FileConfDriverTest
+from ..snapshot import SnapshotFileConfDriver
+from ....model.conf import configuration
+from ....model.cat import category, LazyCategory
+from ....model.param import Parameter
+
+
+class SnapshotConfDriverTest(FileConfDriverTest):
+    """Test the SnapshotFileConfDriver such as a file driver."""
+
+    __driverclass__ = SnapshotFileConfDriver
+
+
+class SnapshotTest(UTCase):
+    """Test snapshot publication and views."""
+
+    def setUp(self):
+
+        self.directory = mkdtemp()
+        self.driver = SnapshotFileConfDriver(directory=self.directory)
+
+    def tearDown(self):
+
+        rmtree(self.directory)
+
+    def _conf(self, value):
+
+        return configuration(
+            category('A', Parameter('a', svalue=value)),
+            category('B', Parameter('b', svalue='2'))
+        )
+
+    def test_view(self):
+
+        self.driver.publish(self._conf('1'), 'test.b3cf')
+
+        view = self.driver.view('test.b3cf')
+
+        self.assertIsInstance(view['A'], LazyCategory)
+        self.assertEqual(view['A']['a'].svalue, '1')
+        self.assertEqual(view['B']['b'].svalue, '2')
+
+    def test_generations(self):
+
+        rscpath = self.driver.publish(self._conf('1'), 'test.b3cf')
+
+        resource = self.driver._pathresource(rscpath)
+
+        self.assertIs(self.driver._pathresource(rscpath), resource)  # mapped
+
+        view = self.driver.view('test.b3cf')
+
+        self.driver.publish(self._conf('3'), 'test.b3cf')
+
+        newview = self.driver.view('test.b3cf')
+
+        self.assertIsNot(self.driver._pathresource(rscpath), resource)
+        self.assertEqual(newview['A']['a'].svalue, '3')
+        self.assertEqual(view['A']['a'].svalue, '1')  # previous generation
+
+        # setconf does not close mapped generations
+        self.driver.setconf(
+            conf=configuration(category('C', Parameter('c', svalue='4'))),
+            rscpath=rscpath
+        )
+
+        self.assertEqual(newview['B']['b'].svalue, '2')
+        self.assertEqual(
+            self.driver.view('test.b3cf')['C']['c'].svalue, '4'
+        )
+
+    def test_processes(self):
+
+        self.driver.publish(self._conf('1'), 'test.b3cf')
+
+        pid = fork()
+
+        if pid == 0:  # worker process
+            view = SnapshotFileConfDriver(directory=self.directory).view(
+                'test.b3cf'
+            )
+            _exit(0 if view['A']['a'].svalue == '1' else 1)
+
+        _, status = waitpid(pid, 0)
+
+        self.assertEqual(WEXITSTATUS(status), 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""SQLite ConfDriver UTs."""
+
+from unittest import main, skip
+
+from re import compile as re_compile
+
+from threading import Thread
+
+from .base import FileConfDriverTest
+
+from ..sqlite import SQLiteFileConfDriver
+from ...projection import Projection
+from ....model.conf import configuration
+from ....model.cat import category, LazyCategory
+from ....model.param import Parameter
+
+
+class SQLiteConfDriverTest(FileConfDriverTest):
+    """Test the SQLiteFileConfDriver."""
+
+    __driverclass__ = SQLiteFileConfDriver
+
+    def tearDown(self):
+
+        self.driver.close()
+
+        super(SQLiteConfDriverTest, self).tearDown()
+
+    @skip('databases are not compressed')
+    def test_compressed(self):
+        pass
+
+    def _setconf(self):
+        """Write a test conf and get its resource path."""
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        conf = configuration(
+            category(
+                'A', Parameter('a', svalue='1'), Parameter('b', svalue='2'),
+                Parameter('c.*', svalue='3')
+            ),
+            category('B', Parameter('d', svalue='4'))
+        )
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        return rscpath
+
+    def test_wal(self):
+
+        rscpath = self._setconf()
+
+        mode, = self.driver.connection(rscpath).execute(
+            'PRAGMA journal_mode'
+        ).fetchone()
+
+        self.assertEqual(mode, 'wal')
+
+    def test_order(self):
+
+        rscpath = self._setconf()
+
+        conf = configuration(
+            category('C', Parameter('e', svalue='5')),
+            category('A', Parameter('f', svalue='6'), Parameter('a'))
+        )
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        conf = self.driver.getconf(path=rscpath)
+
+        self.assertEqual(list(conf), ['A', 'B', 'C'])
+        self.assertEqual(
+            [getattr(pname, 'pattern', pname) for pname in conf['A']],
+            ['a', 'b', 'c.*', 'f']
+        )
+        self.assertIsNone(conf['A']['a'].svalue)
+
+    def test_projection(self):
+
+        rscpath = self._setconf()
+
+        projection = Projection()
+        projection.add('A', ['b', 'cd'])
+
+        conf = self.driver.getconf(path=rscpath, projection=projection)
+
+        self.assertEqual(list(conf), ['A'])
+        self.assertEqual(
+            [getattr(pname, 'pattern', pname) for pname in conf['A']],
+            ['b', 'c.*']
+        )
+
+    def test_lazy(self):
+
+        rscpath = self._setconf()
+
+        conf = self.driver.getconf(path=rscpath, lazy=True)
+
+        category = conf['A']
+
+        self.assertIsInstance(category, LazyCategory)
+        self.assertEqual(category['b'].svalue, '2')
+        self.assertEqual(len(category), 3)
+
+    def test_threads(self):
+
+        rscpath = self._setconf()
+
+        connections = []
+
+        def getconnection():
+            connections.append(self.driver.connection(rscpath))
+            conf = self.driver.getconf(path=rscpath)
+            connections.append(conf['B']['d'].svalue)
+            self.driver.close()
+
+        thread = Thread(target=getconnection)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(connections[0], self.driver.connection(rscpath))
+        self.assertEqual(connections[1], '4')
+
+    def test_regex(self):
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        conf = configuration(
+            category('A', Parameter(re_compile('abc'), svalue='1'))
+        )
+
+        self.driver.setconf(conf=conf, rscpath=rscpath)
+
+        for lazy in (False, True):
+
+            conf = self.driver.getconf(path=rscpath, lazy=lazy)
+
+            pname, = list(conf['A'])  # regex names are not simple names
+            self.assertEqual(pname.pattern, 'abc')
+
+        projection = Projection()
+        projection.add('A', ['abc'])
+
+        conf = self.driver.getconf(path=rscpath, projection=projection)
+
+        self.assertEqual(list(conf['A'])[0].pattern, 'abc')
+
+    def test_empty(self):
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        self.assertIsNone(self.driver.getconf(path=rscpath))
+
+        with open(rscpath, 'rb') as handle:  # not changed into a database
+            self.assertEqual(handle.read(), b'')
+
+    def test_notdatabase(self):
+
+        rscpath = self.driver.rscpaths(self.paths[0])[0]
+
+        with open(rscpath, 'wb') as handle:
+            handle.write(b'[A]\na = 1\n')
+
+        self.assertIsNone(self.driver.getconf(path=rscpath))
+        self.assertRaises(
+            SQLiteFileConfDriver.Error, self.driver.connection, rscpath
+        )
+
+        self.driver.setconf(conf=self.conf, rscpath=rscpath)
+
+        with open(rscpath, 'rb') as handle:
+            self.assertEqual(handle.read(), b'[A]\na = 1\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -40,5 +40,21 @@ class XMLConfDriverTest(FileConfDriverTest):
     __driverclass__ = XMLFileConfDriver
 
 
+class XMLStreamFileConfDriver(XMLFileConfDriver):
+    """XMLFileConfDriver in stream mode."""
+
+    def __init__(self, *args, **kwargs):
+
+        super(XMLStreamFileConfDriver, self).__init__(
+            stream=True, *args, **kwargs
+        )
+
+
+class XMLStreamConfDriverTest(FileConfDriverTest):
+    """Test XMLConfDriver in stream mode."""
+
+    __driverclass__ = XMLStreamFileConfDriver
+
+
 if __name__ == '__main__':
     main()
@@ -30,27 +30,51 @@ from __future__ import absolute_import
 
 __all__ = ['XMLFileConfDriver']
 
-from xml.etree.ElementTree import parse
+from xml.etree.ElementTree import parse, ElementTree
 
-from .base import FileConfDriver
-from ..xml import XMLConfDriver
+from .base import FileConfDriver, atomicopen, rscopen
+from ..xml import XMLConfDriver, XMLResource
 
 
 class XMLFileConfDriver(FileConfDriver, XMLConfDriver):
-    """Manage xml resource configuration from file."""
+    """Manage xml resource configuration from file.
+
+    In stream mode, files are read with iterparse and only parameter
+    attributes are kept in memory."""
+
+    def __init__(self, stream=False, *args, **kwargs):
+        """
+        :param bool stream: if True (False by default), read files in
+            streaming.
+        """
+
+        super(XMLFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.stream = stream
 
     def _pathresource(self, rscpath):
 
-        result = parse(rscpath)
+        with rscopen(rscpath, 'rb') as fpr:
+
+            if self.stream:
+                result = XMLResource.iterparse(fpr)
+
+            else:
+                result = XMLResource(parse(fpr).getroot())
 
         return result
 
     def _setconf(self, conf, resource, rscpath):
 
-        super(XMLFileConfDriver, self)._setconf(
+        if resource.root is None:  # streamed resource without element tree
+            with rscopen(rscpath, 'rb') as fpr:
+                resource = XMLResource(parse(fpr).getroot())
+
+        result = super(XMLFileConfDriver, self)._setconf(
             conf=conf, resource=resource, rscpath=rscpath
         )
 
-        resource.write(rscpath)
+        with atomicopen(rscpath, 'wb') as handle:
+            ElementTree(resource.root).write(handle)
 
-        return resource.getroot().text
+        return result
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""HTTP configuration driver.
+
+Resources are URLs of configuration documents (json, ini, xml, etc.) parsed by
+the driver associated to their content type or to their suffix.
+
+Connections are kept alive and pooled by host. Resources are requested with
+the conditional headers ``If-None-Match`` and ``If-Modified-Since``, therefore
+unchanged resources are not transferred and not parsed again. The last good
+copy of a resource is used when the server is not reachable, and it can be
+stored in a cache directory in order to survive restarts.
+
+.. code-block:: python
+
+    driver = HTTPConfDriver(baseurl='http://conf.local/myapp/')
+    driver.prefetch(['db.json', 'cache.json'])  # concurrent requests
+    conf = driver.getconf('db.json')
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['HTTPConfDriver']
+
+try:
+    from json import loads, dumps
+
+except ImportError:
+    from simplejson import loads, dumps
+
+from hashlib import sha1
+from os.path import join, splitext, exists
+from socket import error as socket_error
+from threading import Lock
+from time import time
+from multiprocessing.pool import ThreadPool
+
+from six.moves.http_client import (
+    HTTPConnection, HTTPSConnection, HTTPException
+)
+from six.moves.urllib.parse import urlsplit, urljoin
+
+from b3j0f.utils.version import OrderedDict
+
+from .base import DelegateConfDriver
+from .json import JSONConfDriver
+from .ini import INIConfDriver
+from .file.base import atomicopen
+
+CONTENT_TYPES = {
+    'application/json': '.json', 'text/json': '.json',
+    'application/xml': '.xml', 'text/xml': '.xml'
+}  #: resource suffixes by content type.
+
+_SCHEMES = ('http://', 'https://')  #: supported url schemes.
+
+_TEXTDRIVERS = (JSONConfDriver, INIConfDriver)  #: drivers parsing text.
+
+
+def _charset(ctype):
+    """Get the charset of a content type.
+
+    :param str ctype: content type header value.
+    :return: content type charset or 'utf-8'.
+    :rtype: str"""
+
+    result = 'utf-8'
+
+    if ctype is not None:
+
+        for option in ctype.split(';')[1:]:
+
+            key, _, value = option.partition('=')
+
+            if key.strip().lower() == 'charset' and value.strip():
+                result = value.strip().strip('"\'')
+                break
+
+    return result
+
+
+class _Entry(object):
+    """Last good copy of a resource."""
+
+    __slots__ = ('etag', 'modified', 'ctype', 'body', 'time', 'resource')
+
+    def __init__(self, etag=None, modified=None, ctype=None, body=b''):
+
+        super(_Entry, self).__init__()
+
+        self.etag = etag
+        self.modified = modified
+        self.ctype = ctype
+        self.body = body
+        self.time = time()  # last validation time
+        self.resource = None  # parsed (driver, resource)
+
+
+class HTTPConfDriver(DelegateConfDriver):
+    """Manage configuration resources from HTTP(S) urls.
+
+    Resources are read-only."""
+
+    DEFAULT_TIMEOUT = 10  #: default request timeout in seconds.
+    DEFAULT_WORKERS = 4  #: default number of prefetching threads.
+
+    def __init__(
+            self, baseurl=None, drivers=None, headers=None,
+            timeout=DEFAULT_TIMEOUT, maxage=0, cachedir=None,
+            workers=DEFAULT_WORKERS, *args, **kwargs
+    ):
+        """
+        :param str baseurl: url used to resolve relative configuration paths.
+            Default None, only urls are resolved.
+        :param OrderedDict drivers: drivers by resource suffix. Resources
+            with an unknown content type and suffix are parsed by the first
+            driver which succeeds. Default json, ini (.ini and .conf), xml and
+            bin drivers.
+        :param dict headers: additional request headers.
+        :param float timeout: request timeout in seconds.
+        :param float maxage: number of seconds during which a resource is
+            used without being validated by the server. Default 0.
+        :param str cachedir: directory where last good copies are stored.
+            Default None, copies are kept only in memory.
+        :param int workers: maximal number of prefetching threads.
+        """
+
+        super(HTTPConfDriver, self).__init__(*args, **kwargs)
+
+        self.baseurl = baseurl
+        self.drivers = self.defaultdrivers() if drivers is None else drivers
+        self.headers = {} if headers is None else headers
+        self.timeout = timeout
+        self.maxage = maxage
+        self.cachedir = cachedir
+        self.workers = workers
+
+        self._connections = {}  # idle connections by (scheme, netloc)
+        self._entries = {}  # last good copies by url
+        self._lock = Lock()
+
+    def rscpaths(self, path):
+
+        result = []
+
+        if path.startswith(_SCHEMES):
+            result.append(path)
+
+        elif self.baseurl is not None:
+            result.append(urljoin(self.baseurl, path))
+
+        return result
+
+    def prefetch(self, paths, logger=None):
+        """Get resources of configuration paths concurrently in order to
+        validate and parse them before calling getconf.
+
+        :param list paths: configuration paths.
+        :param Logger logger: logger to use."""
+
+        urls = list(
+            OrderedDict.fromkeys(
+                url for path in paths for url in self.rscpaths(path)
+            )
+        )
+
+        if urls:
+
+            pool = ThreadPool(max(1, min(self.workers, len(urls))))
+
+            try:
+                pool.map(
+                    lambda url: self.pathresource(rscpath=url, logger=logger),
+                    urls
+                )
+
+            finally:
+                pool.close()
+                pool.join()
+
+    def close(self):
+        """Close idle connections."""
+
+        with self._lock:
+            connections, self._connections = self._connections, {}
+
+        for idles in connections.values():
+            for connection in idles:
+                connection.close()
+
+    def _connection(self, scheme, netloc):
+        """Get an idle connection or a new connection.
+
+        :return: connection and True iif it is new.
+        :rtype: tuple"""
+
+        with self._lock:
+
+            idles = self._connections.get((scheme, netloc))
+
+            if idles:
+                return idles.pop(), False
+
+        cls = HTTPSConnection if scheme == 'https' else HTTPConnection
+
+        return cls(netloc, timeout=self.timeout), True
+
+    def _release(self, scheme, netloc, connection):
+        """Put back a connection in the idle connections."""
+
+        with self._lock:
+            self._connections.setdefault((scheme, netloc), []).append(
+                connection
+            )
+
+    def _request(self, url, headers):
+        """Get an url.
+
+        :return: response status, response headers and body.
+        :rtype: tuple"""
+
+        scheme, netloc, path, query, _ = urlsplit(url)
+
+        if query:
+            path = '{0}?{1}'.format(path, query)
+
+        connection, new = self._connection(scheme, netloc)
+
+        while True:
+
+            try:
+                connection.request('GET', path or '/', headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+
+            except (HTTPException, socket_error):
+                connection.close()
+
+                if new:
+                    raise
+
+                # an idle connection has been closed by the server
+                connection, new = self._connection(scheme, netloc)
+
+            else:
+                break
+
+        if response.will_close:
+            connection.close()
+
+        else:
+            self._release(scheme, netloc, connection)
+
+        rheaders = dict(
+            (name.lower(), value) for name, value in response.getheaders()
+        )
+
+        return response.status, rheaders, body
+
+    def _cachepaths(self, url):
+        """Get cache file paths (meta data, body) of an url."""
+
+        name = sha1(url.encode('utf-8')).hexdigest()
+        path = join(self.cachedir, name)
+
+        return '{0}.json'.format(path), '{0}.body'.format(path)
+
+    def _entry(self, url):
+        """Get the last good copy of an url from the memory or from the cache
+        directory.
+
+        :rtype: _Entry"""
+
+        with self._lock:
+            result = self._entries.get(url)
+
+        if result is None and self.cachedir is not None:
+
+            metapath, bodypath = self._cachepaths(url)
+
+            if exists(metapath) and exists(bodypath):
+
+                with open(metapath, 'rb') as handle:
+                    meta = loads(handle.read().decode('utf-8'))
+
+                with open(bodypath, 'rb') as handle:
+                    body = handle.read()
+
+                result = _Entry(body=body, **meta)
+                result.time = 0  # needs a validation
+
+                with self._lock:  # keep a copy stored by another thread
+                    result = self._entries.setdefault(url, result)
+
+        return result
+
+    def _store(self, url, entry):
+        """Store the last good copy of an url."""
+
+        with self._lock:
+            self._entries[url] = entry
+
+        if self.cachedir is not None:
+
+            metapath, bodypath = self._cachepaths(url)
+
+            with atomicopen(bodypath, 'wb') as handle:
+                handle.write(entry.body)
+
+            meta = {
+                'etag': entry.etag, 'modified': entry.modified,
+                'ctype': entry.ctype
+            }
+
+            with atomicopen(metapath) as handle:
+                handle.write(dumps(meta))
+
+    def _fetch(self, url):
+        """Get the validated copy of an url, or its last good copy if the
+        server is not reachable.
+
+        :return: entry or None if the resource does not exist.
+        :rtype: _Entry
+        :raises: ConfDriver.Error if the resource can not be fetched."""
+
+        entry = self._entry(url)
+
+        if entry is not None and time() - entry.time < self.maxage:
+            return entry
+
+        headers = dict(self.headers)
+
+        if entry is not None:
+
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+
+            if entry.modified is not None:
+                headers['If-Modified-Since'] = entry.modified
+
+        try:
+            status, rheaders, body = self._request(url, headers)
+
+        except (HTTPException, socket_error) as ex:
+            if entry is None:
+                raise self.Error('Error while getting {0}: {1}'.format(url, ex))
+
+            return entry  # offline
+
+        if status == 304 and entry is not None:
+            entry.time = time()
+
+        elif status == 200:
+            entry = _Entry(
+                etag=rheaders.get('etag'),
+                modified=rheaders.get('last-modified'),
+                ctype=rheaders.get('content-type'), body=body
+            )
+            self._store(url, entry)
+
+        elif status == 404:
+            entry = None
+
+        elif entry is None:
+            raise self.Error(
+                'Error while getting {0}: status {1}.'.format(url, status)
+            )
+
+        return entry
+
+    def _drivers(self, url, ctype):
+        """Get drivers able to parse a resource.
+
+        :rtype: list"""
+
+        suffix = None
+
+        if ctype is not None:
+            suffix = CONTENT_TYPES.get(ctype.split(';')[0].strip().lower())
+
+        if suffix is None:
+            suffix = splitext(urlsplit(url)[2])[1]
+
+        return self._suffixdrivers(suffix)
+
+    def resource(self):
+
+        return None
+
+    def _pathresource(self, rscpath):
+
+        entry = self._fetch(rscpath)
+
+        if entry is None:
+            return None
+
+        if entry.resource is None:  # parse once per copy
+
+            error = None
+
+            for driver in self._drivers(rscpath, entry.ctype):
+
+                body = entry.body
+
+                try:
+                    if isinstance(driver, _TEXTDRIVERS):
+                        body = body.decode(_charset(entry.ctype))
+
+                    resource = driver._pathresource(body)
+
+                except Exception as ex:
+                    error = ex
+
+                else:
+                    if resource is not None:
+                        entry.resource = (driver, resource)
+                        break
+
+            else:
+                if error is not None:
+                    raise error
+
+        return entry.resource
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2014 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""INI configuration driver."""
+
+__all__ = ['INIConfDriver']
+
+from six import PY3, binary_type
+from six.moves import StringIO
+from six.moves.configparser import RawConfigParser
+
+from .base import ConfDriver
+from ..model.param import Parameter
+
+
+class INIConfDriver(ConfDriver):
+    """Manage ini resource configuration."""
+
+    def rscpaths(self, path):
+
+        return [path]
+
+    def resource(self):
+
+        return RawConfigParser()
+
+    def _pathresource(self, rscpath):
+
+        if PY3 and isinstance(rscpath, binary_type):
+            rscpath = rscpath.decode('utf-8')
+
+        result = self._read(StringIO(rscpath))
+
+        return result
+
+    @staticmethod
+    def _read(handle, rscpath=None):
+        """Read a RawConfigParser from a file object.
+
+        :param handle: file object to read.
+        :param str rscpath: resource path used in error messages.
+        :return: RawConfigParser or None if it does not contain categories.
+        """
+
+        result = RawConfigParser()
+
+        if PY3:
+            result.read_file(handle, rscpath)
+
+        else:
+            result.readfp(handle, rscpath)
+
+        if not result.sections():
+            result = None
+
+        return result
+
+    def _cnames(self, resource):
+
+        return resource.sections()
+
+    def _pitems(self, resource, cname):
+
+        return [(item[0], item) for item in resource.items(cname)]
+
+    def _param(self, resource, cname, item):
+
+        return Parameter(item[0], svalue=item[1])
+
+    def _params(self, resource, cname):
+
+        return list(
+            Parameter(item[0], svalue=item[1]) for item in resource.items(cname)
+        )
+
+    def _setconf(self, conf, resource, rscpath):
+
+        for category in conf.values():
+
+            if not resource.has_section(category.name):
+                resource.add_section(category.name)
+
+            for param in category.values():
+                resource.set(category.name, param.name, param.svalue)
+
+        result = StringIO()
+
+        resource.write(result)
+
+        return result.getvalue()
@@ -36,7 +36,7 @@ try:
 except ImportError:
     from simplejson import loads, dumps
 
-from six import string_types
+from six import string_types, binary_type, PY3
 
 from .base import ConfDriver
 from ..model.param import Parameter
@@ -55,6 +55,9 @@ class JSONConfDriver(ConfDriver):
 
     def _pathresource(self, rscpath):
 
+        if PY3 and isinstance(rscpath, binary_type):  # json needs text < 3.6
+            rscpath = rscpath.decode('utf-8')
+
         result = loads(rscpath)
 
         return result
@@ -63,19 +66,29 @@ class JSONConfDriver(ConfDriver):
 
         return resource.keys()
 
-    def _params(self, resource, cname):
+    def _pitems(self, resource, cname):
 
-        params = resource[cname]
+        return [(item[0], item) for item in resource[cname].items()]
 
-        result = [
-            Parameter(name=key, svalue=params[key])
-                if isinstance(params[key], string_types) else
-                    Parameter(name=key, value=params[key])
-            for key in params
-        ]
+    def _param(self, resource, cname, item):
+
+        key, value = item
+
+        if isinstance(value, string_types):
+            result = Parameter(name=key, svalue=value)
+
+        else:
+            result = Parameter(name=key, value=value)
 
         return result
 
+    def _params(self, resource, cname):
+
+        return [
+            self._param(resource, cname, item)
+            for _, item in self._pitems(resource, cname)
+        ]
+
     def _setconf(self, conf, resource, rscpath):
 
         for category in conf.values():
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Configuration projection module.
+
+A projection gives the categories and parameters a caller needs. Drivers skip
+other categories and parameters of their resources, before materializing
+them into model elements.
+
+.. code-block:: python
+
+    projection = Projection.fromconf(configurable.conf)
+    conf = driver.getconf(path, projection=projection)
+"""
+
+__all__ = ['Projection']
+
+from six import string_types
+
+
+class Projection(object):
+    """Names or patterns of categories and parameters to keep."""
+
+    __slots__ = ('categories', 'prefixes')
+
+    def __init__(self, categories=None, prefixes=()):
+        """
+        :param dict categories: parameter names or regexes by category name.
+            A None value keeps all parameters of the category.
+        :param tuple prefixes: prefixes of category names to keep with all
+            their parameters.
+        """
+
+        super(Projection, self).__init__()
+
+        self.categories = {}  # (names, regexes) by category name
+        self.prefixes = tuple(prefixes)
+
+        if categories is not None:
+            for cname, pnames in categories.items():
+                self.add(cname, pnames)
+
+    def add(self, cname, pnames=None):
+        """Add a category with parameter names to keep.
+
+        :param str cname: category name.
+        :param list pnames: parameter names or regexes. Default all.
+        """
+
+        if pnames is None:
+            self.categories[cname] = None
+
+        else:
+            projected = self.categories.setdefault(cname, (set(), {}))
+
+            if projected is not None:
+
+                names, regexes = projected
+
+                for pname in pnames:
+
+                    if isinstance(pname, string_types):
+                        names.add(pname)
+
+                    else:  # regexes are indexed by pattern
+                        regexes[pname.pattern] = pname
+
+    def category(self, cname):
+        """True iif input category has to be kept.
+
+        :param str cname: category name.
+        :rtype: bool"""
+
+        return cname in self.categories or cname.startswith(self.prefixes)
+
+    def param(self, cname, pname):
+        """True iif input parameter has to be kept.
+
+        :param str cname: category name.
+        :param pname: parameter name or regex.
+        :rtype: bool"""
+
+        if cname in self.categories:
+
+            projected = self.categories[cname]
+
+            if projected is None:
+                result = True
+
+            else:
+                names, regexes = projected
+
+                if isinstance(pname, string_types):
+                    result = pname in names or pname in regexes or any(
+                        regex.match(pname) for regex in regexes.values()
+                    )
+
+                else:
+                    result = pname.pattern in regexes or any(
+                        pname.match(name) for name in names
+                    )
+
+        else:
+            result = cname.startswith(self.prefixes)
+
+        return result
+
+    @staticmethod
+    def fromconf(conf, prefixes=()):
+        """Get the projection of the categories and parameters of a conf.
+
+        :param Configuration conf: configuration to project.
+        :param tuple prefixes: prefixes of category names to keep with all
+            their parameters.
+        :rtype: Projection"""
+
+        result = Projection(prefixes=prefixes)
+
+        for category in conf.values():
+            result.add(
+                category.name, [param.name for param in category.values()]
+            )
+
+        return result
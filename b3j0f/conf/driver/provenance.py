@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Configuration provenance module.
+
+A provenance records which resources supplied the parameters of a merged
+configuration. Each resource configuration is kept such as a layer, in the
+merge order, and parameters are indexed by (category name, parameter name)
+with the stack of resources which supplied them (the last one wins).
+
+When a resource changes, its layer can be reloaded alone and spliced back
+into the merged configuration without reading other resources:
+
+.. code-block:: python
+
+    provenance = Provenance()
+    conf = configurable.getconf(provenance=provenance)
+    # ... the resource '/etc/myapp/db.json' changed.
+    conf = provenance.reload('/etc/myapp/db.json')
+"""
+
+__all__ = ['Provenance']
+
+from ..model.conf import Configuration
+
+
+class Provenance(object):
+    """Resource layers and parameter sources of a merged configuration."""
+
+    def __init__(self, base=None, projection=None):
+        """
+        :param Configuration base: configuration updated by layers.
+        :param Projection projection: projection used to read resources.
+        """
+
+        super(Provenance, self).__init__()
+
+        self.base = base
+        self.projection = projection
+        self.layers = []  # list of (rscpath, driver, conf)
+        self.index = {}  # list of (rscpath, driver) by (cname, pname)
+
+    def add(self, rscpath, driver, conf):
+        """Add a resource layer.
+
+        :param str rscpath: resource path.
+        :param ConfDriver driver: driver which read the resource.
+        :param Configuration conf: resource configuration. It must not be
+            modified afterwards.
+        """
+
+        self.layers.append((rscpath, driver, conf))
+        self._indexlayer(rscpath, driver, conf)
+
+    def _indexlayer(self, rscpath, driver, conf):
+        """Index parameters of a resource layer."""
+
+        source = rscpath, driver
+
+        for category in conf.values():
+
+            cname = category.name
+
+            for pname in category:
+                self.index.setdefault((cname, pname), []).append(source)
+
+    def rscpaths(self):
+        """Get resource paths in the merge order.
+
+        :rtype: list"""
+
+        return [layer[0] for layer in self.layers]
+
+    def sources(self, cname, pname):
+        """Get resources which supplied a parameter, in the merge order.
+
+        :param str cname: category name.
+        :param str pname: parameter name.
+        :return: list of (rscpath, driver).
+        :rtype: list"""
+
+        return list(self.index.get((cname, pname), ()))
+
+    def source(self, cname, pname):
+        """Get the resource which supplied the final value of a parameter.
+
+        :param str cname: category name.
+        :param str pname: parameter name.
+        :return: (rscpath, driver) or None if the parameter does not come from
+            a resource.
+        :rtype: tuple"""
+
+        sources = self.index.get((cname, pname))
+
+        return sources[-1] if sources else None
+
+    def merge(self):
+        """Merge the base configuration with all layers.
+
+        :rtype: Configuration"""
+
+        result = Configuration() if self.base is None else self.base.copy()
+
+        for _, _, conf in self.layers:
+            result.update(conf)
+
+        return result
+
+    def reload(self, rscpath, logger=None):
+        """Reload layers of one resource and merge again all layers.
+
+        Other resources are not read again.
+
+        :param str rscpath: resource path to reload.
+        :param Logger logger: logger to use.
+        :return: new merged configuration.
+        :rtype: Configuration
+        :raises: KeyError if rscpath is not a layer resource path."""
+
+        positions = [
+            position for position, layer in enumerate(self.layers)
+            if layer[0] == rscpath
+        ]
+
+        if not positions:
+            raise KeyError('No layer for {0}.'.format(rscpath))
+
+        driver = self.layers[positions[0]][1]
+
+        conf = driver._getconf(
+            rscpath=rscpath, logger=logger, conf=self.base,
+            projection=self.projection
+        )
+
+        if conf is None:  # the resource does not exist anymore
+            self.layers = [
+                layer for layer in self.layers if layer[0] != rscpath
+            ]
+
+        else:
+            for position in positions:
+                self.layers[position] = rscpath, driver, conf
+
+        self.index = {}
+
+        for layer in self.layers:
+            self._indexlayer(*layer)
+
+        return self.merge()
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Python module configuration driver and compiler.
+
+The function ``compileconf`` compiles a configuration into the source code of
+a python module where parameter values are resolved at compilation time and
+written such as python literals. References and expressions are resolved by
+the compilation, therefore compiled values do not depend on each other.
+
+Classes, routines and modules are written with their lookup path. Values
+which can not be written such as python code are compiled with their
+serialized value, which is resolved at runtime.
+
+The ``PYConfDriver`` loads such modules by import (resource paths are module
+names), and benefits from python bytecode caching. When a module source
+changes (a new compilation for example), the module is loaded again from its
+source.
+
+.. code-block:: python
+
+    with open('myconf.py', 'w') as handle:
+        handle.write(compileconf(configurable.getconf(), configurable))
+
+    Configurable(drivers=[PYConfDriver()], paths=['myconf'])
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['PYConfDriver', 'compileconf']
+
+from importlib import import_module
+
+from os import stat
+from os.path import exists
+
+from sys import modules
+
+from inspect import isclass, isroutine
+
+from math import isinf, isnan
+
+from types import ModuleType
+
+from b3j0f.utils.path import lookup
+
+from six import (
+    string_types, integer_types, binary_type, text_type, exec_
+)
+
+from .base import ConfDriver
+from ..model.param import Parameter
+from ..version import __version__
+
+CONFIGURATION = 'CONFIGURATION'  #: compiled configuration variable name.
+
+_LITERALS = (bool, type(None), binary_type, text_type) + integer_types
+
+
+def _literal(value):
+    """Get a python literal source of input value.
+
+    :raises: ValueError if value can not be written such as a literal."""
+
+    vtype = type(value)
+
+    if vtype in _LITERALS:
+        result = repr(value)
+
+    elif vtype is float:
+
+        if isinf(value) or isnan(value):
+            raise ValueError('Unsupported float {0}.'.format(value))
+
+        result = repr(value)
+
+    elif vtype in (list, tuple, set, frozenset):
+
+        items = ', '.join(_literal(item) for item in value)
+
+        if vtype is list:
+            result = '[{0}]'.format(items)
+
+        elif vtype is tuple:
+            result = '({0}{1})'.format(items, ',' if len(value) == 1 else '')
+
+        else:
+            result = '{0}([{1}])'.format(vtype.__name__, items)
+
+    elif vtype is dict:
+        result = '{{{0}}}'.format(
+            ', '.join(
+                '{0}: {1}'.format(_literal(key), _literal(value[key]))
+                for key in value
+            )
+        )
+
+    elif isclass(value) or isroutine(value) or isinstance(value, ModuleType):
+
+        path = _path(value)
+
+        result = '_lookup({0})'.format(repr(path))
+
+    else:
+        raise ValueError('Unsupported value {0}.'.format(value))
+
+    return result
+
+
+def _path(value):
+    """Get the lookup path of a class, routine or module.
+
+    :raises: ValueError if value can not be found with its path."""
+
+    if isinstance(value, ModuleType):
+        path = value.__name__
+
+    else:
+        name = getattr(value, '__qualname__', value.__name__)
+        path = '{0}.{1}'.format(value.__module__, name)
+
+    try:
+        found = lookup(path)
+
+    except ImportError:
+        found = None
+
+    if found is not value:
+        raise ValueError('{0} can not be found with its path.'.format(value))
+
+    return path
+
+
+def compileconf(
+        conf, configurable=None, scope=None, safe=None, besteffort=None
+):
+    """Compile a configuration into a python module source code.
+
+    :param Configuration conf: configuration to compile. It is not modified.
+    :param Configurable configurable: configurable used for resolution.
+    :param dict scope: resolution scope.
+    :param bool safe: resolution safe flag.
+    :param bool besteffort: resolution best effort flag.
+    :return: python module source code.
+    :rtype: str"""
+
+    conf = conf.copy()
+
+    lines = [
+        '# -*- coding: utf-8 -*-',
+        '"""Configuration compiled by b3j0f.conf {0}."""'.format(__version__),
+        '',
+        'from re import compile as _compile',
+        '',
+        'from b3j0f.utils.path import lookup as _lookup',
+        '',
+        '#: [(category name, local, [(name, local, svalue, value)])]',
+        '{0} = ['.format(CONFIGURATION)
+    ]
+
+    for category in conf.values():
+
+        lines.append(
+            '    ({0}, {1}, ['.format(
+                _literal(category.name), _literal(category.local)
+            )
+        )
+
+        for param in category.values():
+
+            name = param.name
+
+            if isinstance(name, string_types):
+                name = _literal(name)
+
+            else:
+                name = '_compile({0})'.format(_literal(name.pattern))
+
+            svalue, value = param._svalue, None
+
+            try:
+                value = param.resolve(
+                    configurable=configurable, conf=conf, scope=scope,
+                    safe=safe, besteffort=besteffort
+                )
+
+            except Parameter.Error:  # resolve at runtime
+                pass
+
+            else:
+                if value is not None:
+
+                    try:
+                        value = _literal(value)
+
+                    except ValueError:  # resolve at runtime
+                        if svalue is None:
+                            svalue = param.serializer(param._value)
+                        value = None
+
+                    else:
+                        svalue = None
+
+            lines.append(
+                '        ({0}, {1}, {2}, {3}),'.format(
+                    name, _literal(param.local), _literal(svalue),
+                    'None' if value is None else value
+                )
+            )
+
+        lines.append('    ]),')
+
+    lines.append(']')
+    lines.append('')
+
+    return '\n'.join(lines)
+
+
+def _source(module):
+    """Get the source file path of input module, or None."""
+
+    result = getattr(module, '__file__', None)
+
+    if result is not None:
+
+        if result[-4:] in ('.pyc', '.pyo'):
+            result = result[:-1]
+
+        if not exists(result):
+            result = None
+
+    return result
+
+
+def _signature(path):
+    """Get a signature of a file which changes when the file is written."""
+
+    stats = stat(path)
+
+    return stats.st_mtime, stats.st_size, stats.st_ino
+
+
+class PYConfDriver(ConfDriver):
+    """Manage configurations compiled into python modules.
+
+    Resource paths are module names."""
+
+    def __init__(self, *args, **kwargs):
+
+        super(PYConfDriver, self).__init__(*args, **kwargs)
+
+        # (source signature, configuration) by module name
+        self._loaded = {}
+
+    def rscpaths(self, path):
+
+        return [path]
+
+    def _pathresource(self, rscpath):
+
+        imported = rscpath in modules  # possibly before a source change
+
+        module = import_module(rscpath)
+
+        result = getattr(module, CONFIGURATION)
+
+        source = _source(module)
+
+        if source is not None:
+
+            signature = _signature(source)
+
+            loaded = self._loaded.get(rscpath)
+
+            if loaded is not None and loaded[0] == signature:
+                result = loaded[1]
+
+            else:
+                if imported:  # the imported module can be out of date
+                    result = self._loadsource(source, rscpath)
+
+                self._loaded[rscpath] = signature, result
+
+        return result
+
+    @staticmethod
+    def _loadsource(source, name):
+        """Load a configuration from a module source file.
+
+        :param str source: module source file path.
+        :param str name: module name.
+        :rtype: list"""
+
+        with open(source) as handle:
+            code = compile(handle.read(), source, 'exec')
+
+        namespace = {'__name__': name, '__file__': source}
+
+        exec_(code, namespace)
+
+        return namespace[CONFIGURATION]
+
+    def _cnames(self, resource):
+
+        return [category[0] for category in resource]
+
+    def _pitems(self, resource, cname):
+
+        result = []
+
+        for name, _, params in resource:
+
+            if name == cname:
+                result = [
+                    (getattr(param[0], 'pattern', param[0]), param)
+                    for param in params
+                ]  # regex names are projected by pattern
+                break
+
+        return result
+
+    def _param(self, resource, cname, item):
+
+        pname, local, svalue, value = item
+
+        if value is None:
+            result = Parameter(name=pname, local=local, svalue=svalue)
+
+        else:
+            result = Parameter(name=pname, local=local, value=value)
+
+        return result
+
+    def _params(self, resource, cname):
+
+        return [
+            self._param(resource, cname, item)
+            for _, item in self._pitems(resource, cname)
+        ]
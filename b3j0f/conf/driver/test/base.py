@@ -31,11 +31,14 @@ from b3j0f.utils.ut import UTCase
 
 from unittest import main
 
-from ...model.conf import Configuration
-from ...model.cat import Category
+from ...model.conf import Configuration, configuration
+from ...model.cat import Category, category
 from ...model.param import Parameter
 
-from ..base import ConfDriver
+from ..base import ConfDriver, DelegateConfDriver
+from ..json import JSONConfDriver
+from ..ini import INIConfDriver
+from ..projection import Projection
 
 
 class TestConfDriver(ConfDriver):
@@ -139,6 +142,80 @@ class ConfDriverTest(UTCase):
             self.assertIn('test', conf)
             self.assertIn('test', conf['test'])
 
+    def test_lazy(self):
+        """Test to get a lazy configuration."""
+
+        conf = configuration(
+            category('A', Parameter('a', svalue='0'), Parameter('b')),
+            category('B', Parameter('b', svalue='1'))
+        )
+
+        model = configuration(category('A', Parameter('a', ptype=int)))
+
+        for path in self.paths:
+
+            for rscpath in self.driver.rscpaths(path=path):
+                self.driver.setconf(rscpath=rscpath, conf=conf)
+
+            lazyconf = self.driver.getconf(path=path, conf=model, lazy=True)
+
+            self.assertEqual(lazyconf['A']['a'].value, 0)
+            self.assertIn('b', lazyconf['A'])
+            self.assertEqual(lazyconf['B']['b'].svalue, '1')
+
+    def test_projection(self):
+        """Test to get a projected configuration."""
+
+        projection = Projection({'A': ['a'], 'test': None})
+
+        conf = configuration(
+            category('A', Parameter('a', svalue='0'), Parameter('b')),
+            category('B', Parameter('b', svalue='1')),
+            category('test', Parameter('test', svalue='test'))
+        )
+
+        for path in self.paths:
+
+            for rscpath in self.driver.rscpaths(path=path):
+                self.driver.setconf(rscpath=rscpath, conf=conf)
+
+            conf = self.driver.getconf(path=path, projection=projection)
+
+            self.assertEqual(sorted(conf), ['A', 'test'])
+            self.assertEqual(list(conf['A']), ['a'])
+            self.assertIn('test', conf['test'])
+
+
+class DelegateConfDriverTest(UTCase):
+    """Test the DelegateConfDriver class."""
+
+    def test_defaultdrivers(self):
+
+        drivers = DelegateConfDriver.defaultdrivers()
+
+        self.assertEqual(
+            list(drivers), ['.json', '.ini', '.conf', '.xml', '.bin']
+        )
+        self.assertIsInstance(drivers['.json'], JSONConfDriver)
+        self.assertIsInstance(drivers['.ini'], INIConfDriver)
+        self.assertIs(drivers['.ini'], drivers['.conf'])  # shared driver
+
+    def test_delegate(self):
+
+        driver = DelegateConfDriver()
+        driver.drivers = driver.defaultdrivers()
+
+        self.assertEqual(
+            driver._suffixdrivers('.conf'), [driver.drivers['.ini']]
+        )
+        self.assertEqual(len(driver._suffixdrivers('.txt')), 4)
+
+        json = driver.drivers['.json']
+        resource = (json, json._pathresource('{"A": {"a": "1"}}'))
+
+        self.assertEqual(list(driver._cnames(resource)), ['A'])
+        self.assertEqual(driver._params(resource, 'A')[0].svalue, '1')
+
 
 if __name__ == '__main__':
     main()
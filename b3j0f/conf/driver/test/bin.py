@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Binary ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..bin import BINConfDriver, BINResource, export, _marshalable
+from ..json import JSONConfDriver
+from ..xml import XMLConfDriver
+from ..file.ini import INIFileConfDriver
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+
+from os import remove
+
+from tempfile import NamedTemporaryFile
+
+
+class BINConfDriverTest(UTCase):
+    """Test the BINConfDriver."""
+
+    def setUp(self):
+
+        self.driver = BINConfDriver()
+
+    def assertConfEqual(self, conf, other):
+        """Assert two configurations have same names and values."""
+
+        self.assertEqual(list(conf), list(other))
+
+        for cname, category in conf.items():
+
+            params, oparams = category.values(), other[cname].values()
+
+            self.assertEqual(len(params), len(oparams))
+
+            for param, oparam in zip(params, oparams):
+
+                # True if the value has been exported such as a svalue
+                serialized = param._svalue != oparam._svalue
+
+                self.assertEqual(
+                    getattr(param.name, 'pattern', param.name),
+                    getattr(oparam.name, 'pattern', oparam.name)
+                )
+                self.assertEqual(param.svalue, oparam.svalue)
+                self.assertEqual(param.local, oparam.local)
+
+                if not serialized:
+                    self.assertEqual(param._value, oparam._value)
+
+    def _roundtrip(self, conf):
+        """Export a conf and read it with a binary driver."""
+
+        result = self.driver.getconf(export(conf))
+
+        self.assertConfEqual(conf, result)
+
+        return result
+
+    def test_conf(self):
+        """Test to export and read a configuration."""
+
+        conf = configuration(
+            category(
+                'A',
+                Parameter('a', svalue='a'),
+                Parameter('b', svalue='=1'),
+                Parameter('c', svalue='@A.a'),
+                Parameter('d', value=[1, 2.5, 'e', None, {'f': True}]),
+                Parameter('e.*', svalue=u'é', local=False),
+                Parameter('f')
+            ),
+            category('B'),
+            category('', Parameter('a', value=object))
+        )
+
+        result = self._roundtrip(conf)
+
+        self.assertEqual(result['A']['a'].svalue, 'a')
+        self.assertEqual(result['']['a'].svalue, conf['']['a'].svalue)
+
+    def test_json(self):
+        """Test fidelity with the json driver."""
+
+        conf = JSONConfDriver().getconf(
+            '{"A": {"a": "a", "b": 1, "c": [1, 2]}, "B": {"d": "=2"}}'
+        )
+
+        self._roundtrip(conf)
+
+    def test_xml(self):
+        """Test fidelity with the xml driver."""
+
+        conf = XMLConfDriver().getconf(
+            '<configuration>'
+            '<category name="A">'
+            '<parameter name="a" svalue="a"/>'
+            '<parameter name="b" svalue="=1"/>'
+            '</category>'
+            '<category name="B"><parameter name="c" svalue="c"/></category>'
+            '</configuration>'
+        )
+
+        self._roundtrip(conf)
+
+    def test_ini(self):
+        """Test fidelity with the ini driver."""
+
+        with NamedTemporaryFile(mode='w', delete=False) as handle:
+            handle.write('[A]\na = a\nb = =1\n[B]\nc = @A.a\n')
+
+        try:
+            conf = INIFileConfDriver().getconf(handle.name)
+
+        finally:
+            remove(handle.name)
+
+        self._roundtrip(conf)
+
+    def test_lazy(self):
+        """Test to decode only used categories."""
+
+        conf = configuration(
+            category('A', Parameter('a', svalue='a')),
+            category('B', Parameter('b', svalue='b'))
+        )
+
+        resource = BINResource(export(conf))
+
+        self.assertEqual(resource.cnames(), ['A', 'B'])
+
+        params = resource.params('B')
+
+        self.assertEqual(params[0].svalue, 'b')
+
+        decoded = [value for value in resource._strings.values()]
+
+        self.assertNotIn('a', decoded)
+
+    def test_setconf(self):
+        """Test to update a binary content."""
+
+        content = export(
+            configuration(category('A', Parameter('a', svalue='a')))
+        )
+
+        resource = BINResource(content)
+
+        content = self.driver._setconf(
+            conf=configuration(category('B', Parameter('b', svalue='b'))),
+            resource=resource, rscpath=content
+        )
+
+        conf = self.driver.getconf(content)
+
+        self.assertEqual(list(conf), ['A', 'B'])
+
+    def test_wrong(self):
+        """Test to read wrong contents."""
+
+        self.assertRaises(ValueError, BINResource, b'')
+        self.assertRaises(ValueError, BINResource, b'B3CX' + b'\0' * 16)
+
+    def test_marshalable(self):
+        """Test values marshaled in the same types by python 2 and 3."""
+
+        self.assertTrue(_marshalable([1, 1.5, u'a', {u'b': (None, True)}]))
+        self.assertFalse(_marshalable(b'a'))
+        self.assertFalse(_marshalable([u'a', b'a']))
+        self.assertFalse(_marshalable(object()))
+
+    def test_values(self):
+        """Test to read marshaled and serialized values."""
+
+        value = [1, 1.5, u'a', {u'b': (None, True)}]
+
+        content = export(
+            configuration(
+                category(
+                    'A', Parameter('a', value=value),
+                    Parameter('b', value=b'b'), Parameter('c', svalue='=1')
+                )
+            )
+        )
+
+        conf = self.driver.getconf(content)
+
+        self.assertEqual(conf['A']['a'].value, value)
+        self.assertIsNone(conf['A']['a']._svalue)  # marshaled value
+        self.assertEqual(conf['A']['b'].value, b'b')
+        self.assertIsNotNone(conf['A']['b']._svalue)  # serialized value
+        self.assertEqual(conf['A']['c'].value, 1)
+
+if __name__ == '__main__':
+    main()
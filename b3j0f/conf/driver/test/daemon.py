@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Configuration daemon UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main, skipUnless
+
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from time import sleep
+from threading import Thread
+from struct import pack
+
+import socket
+
+from ..file.json import JSONFileConfDriver
+from ...model.cat import LazyCategory
+
+if hasattr(socket, 'AF_UNIX'):
+    from ..daemon import ConfDaemon, DaemonConfDriver, MAX_REQUEST
+
+
+class CountJSONFileConfDriver(JSONFileConfDriver):
+    """JSON file driver which counts parsed files."""
+
+    def __init__(self, *args, **kwargs):
+
+        super(CountJSONFileConfDriver, self).__init__(*args, **kwargs)
+
+        self.parsed = 0
+
+    def _pathresource(self, rscpath):
+
+        self.parsed += 1
+
+        return super(CountJSONFileConfDriver, self)._pathresource(rscpath)
+
+
+@skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix domain sockets are missing')
+class ConfDaemonTest(UTCase):
+    """Test the ConfDaemon and the DaemonConfDriver."""
+
+    def setUp(self):
+
+        self.tmpdir = mkdtemp()
+        self.path = join(self.tmpdir, 'test.json')
+
+        self._write('{"A": {"a": "1"}, "B": {"b": "2"}}')
+
+        self.json = CountJSONFileConfDriver()
+        self.daemon = ConfDaemon(
+            socketpath=join(self.tmpdir, 'conf.sock'), drivers=[self.json],
+            paths=[self.path, join(self.tmpdir, 'missing.json')], interval=60
+        ).start()
+
+        self.drivers = [
+            DaemonConfDriver(socketpath=self.daemon.socketpath)
+            for _ in range(2)
+        ]
+
+    def tearDown(self):
+
+        for driver in self.drivers:
+            driver.close()
+
+        self.daemon.stop()
+
+        rmtree(self.tmpdir)
+
+    def _write(self, content):
+
+        with open(self.path, 'w') as handle:
+            handle.write(content)
+
+    def _wait(self, driver):
+        """Wait for a change notice."""
+
+        for _ in range(200):
+            if driver._changed or not driver._cache:
+                break
+            sleep(0.01)
+
+    def test_getconf(self):
+
+        for driver in self.drivers:
+
+            conf = driver.getconf(path=self.path)
+
+            self.assertEqual(conf['A']['a'].svalue, '1')
+            self.assertEqual(conf['B']['b'].svalue, '2')
+
+        self.assertEqual(self.json.parsed, 1)  # parsed once per host
+
+        self.assertIsNone(
+            self.drivers[0].getconf(path=join(self.tmpdir, 'missing.json'))
+        )
+
+    def test_paths(self):
+        """Test to serve only allowed paths."""
+
+        driver = self.drivers[0]
+
+        self.assertIsNone(driver.getconf(path='/etc/passwd'))
+        self.assertRaises(DaemonConfDriver.Error, driver._request, 'other')
+        self.assertEqual(self.json.parsed, 0)
+
+        conf = driver.getconf(path=self.path)  # connection still usable
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+    def test_frame_length(self):
+        """Test to close connections which send too long frames."""
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(self.daemon.socketpath)
+
+        try:
+            sock.sendall(pack('<I', MAX_REQUEST + 1))
+
+            self.assertEqual(sock.recv(1), b'')  # closed by the daemon
+
+        finally:
+            sock.close()
+
+    def test_slow_watcher(self):
+        """Test to disconnect watchers which do not receive notices."""
+
+        class SlowSocket(object):
+
+            def sendall(self, data):
+                raise socket.timeout()
+
+            def settimeout(self, timeout):
+                pass
+
+            def shutdown(self, how):
+                pass
+
+        slow = SlowSocket()
+
+        self.daemon._watch(slow)
+        self.daemon.snapshot(self.path)
+
+        self._write('{"A": {"a": "3"}}')
+
+        self.assertEqual(list(self.daemon.refresh()), [self.path])
+        self.assertNotIn(slow, self.daemon._watchers)
+
+    def test_one_watcher(self):
+        """Test to start only one watcher with concurrent loads."""
+
+        driver = self.drivers[0]
+
+        started = []
+        startwatch = driver._startwatch
+
+        def _startwatch():
+            started.append(True)
+            sleep(0.05)
+            startwatch()
+
+        driver._startwatch = _startwatch
+
+        threads = [
+            Thread(target=driver._pathresource, args=(self.path,))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(started), 1)
+
+    def test_lazy(self):
+
+        conf = self.drivers[0].getconf(path=self.path, lazy=True)
+
+        self.assertIsInstance(conf['A'], LazyCategory)
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+    def test_notices(self):
+
+        driver = self.drivers[0]
+
+        resource = driver._pathresource(self.path)
+
+        self.assertIs(driver._pathresource(self.path), resource)  # cached
+
+        self._write('{"A": {"a": "3"}, "B": {"b": "2"}, "C": {"c": "4"}}')
+
+        changed = self.daemon.refresh()
+
+        self.assertEqual(sorted(changed[self.path]), ['A', 'C'])
+
+        self._wait(driver)
+
+        requests = []
+        request = driver._request
+
+        def _request(path, cnames=None):
+            requests.append(cnames)
+            return request(path, cnames)
+
+        driver._request = _request
+
+        newresource = driver._pathresource(self.path)
+
+        self.assertEqual(requests, [['A', 'C']])  # only changed categories
+        self.assertIs(newresource['B'], resource['B'])
+
+        conf = driver.getconf(path=self.path)
+
+        self.assertEqual(sorted(conf), ['A', 'B', 'C'])
+        self.assertEqual(conf['A']['a'].svalue, '3')
+        self.assertEqual(conf['C']['c'].svalue, '4')
+
+        self._write('{"B": {"b": "2"}}')
+        self.daemon.refresh()
+
+        for _ in range(200):  # wait for the removal of A and C
+            if 'A' not in driver._cache.get(self.path, {}):
+                break
+            sleep(0.01)
+
+        self.assertEqual(list(driver.getconf(path=self.path)), ['B'])
+
+    def test_restart(self):
+
+        driver = self.drivers[0]
+
+        driver.getconf(path=self.path)
+
+        self.daemon.stop()
+        self._wait(driver)
+
+        self.assertFalse(driver._cache)  # notices are lost
+
+        self.daemon.start()
+
+        conf = driver.getconf(path=self.path)
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+
+if __name__ == '__main__':
+    main()
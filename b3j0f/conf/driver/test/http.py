@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""HTTP ConfDriver UTs."""
+
+from __future__ import absolute_import
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Thread
+
+from six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from six.moves.socketserver import ThreadingMixIn
+
+from ..http import HTTPConfDriver
+
+RESOURCES = {
+    '/a.json': (b'{"A": {"a": "1"}}', None),
+    '/b': (
+        b'<configuration><category name="B">'
+        b'<parameter name="b" svalue="2"/></category></configuration>',
+        'application/xml; charset=utf-8'
+    ),
+    '/c.conf': (b'[C]\nc = 3\n', 'text/plain'),
+    '/e': (b'{"E": {"e": "\xe9"}}', 'application/json; charset=iso-8859-1')
+}  #: (body, content type) by path.
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve RESOURCES with etags and keep-alive connections."""
+
+    protocol_version = 'HTTP/1.1'
+    wbufsize = -1  # send headers in one segment
+
+    def setup(self):
+
+        BaseHTTPRequestHandler.setup(self)
+
+        self.server.connections += 1
+
+    def do_GET(self):
+
+        resource = RESOURCES.get(self.path)
+
+        if resource is None:
+            status, body, headers = 404, b'', {}
+
+        else:
+            body, ctype = resource
+            etag = '"{0}"'.format(hash(body))
+            headers = {'ETag': etag}
+
+            if ctype is not None:
+                headers['Content-Type'] = ctype
+
+            if self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+
+            else:
+                status = 200
+
+        self.server.statuses.append(status)
+
+        self.send_response(status)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs):
+
+        pass
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    """Local configuration server."""
+
+    daemon_threads = True
+
+    def __init__(self):
+
+        HTTPServer.__init__(self, ('127.0.0.1', 0), _Handler)
+
+        self.connections = 0
+        self.statuses = []
+
+
+class HTTPConfDriverTest(UTCase):
+    """Test the HTTPConfDriver."""
+
+    def setUp(self):
+
+        self.server = _Server()
+        self.thread = Thread(
+            target=self.server.serve_forever, kwargs={'poll_interval': 0.01}
+        )
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.baseurl = 'http://127.0.0.1:{0}/'.format(self.server.server_port)
+
+        self.cachedir = mkdtemp()
+
+        self.driver = HTTPConfDriver(
+            baseurl=self.baseurl, cachedir=self.cachedir
+        )
+
+    def tearDown(self):
+
+        self.driver.close()
+        self._shutdown()
+
+        rmtree(self.cachedir)
+
+    def _shutdown(self):
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def test_rscpaths(self):
+
+        self.assertEqual(
+            self.driver.rscpaths('a.json'), [self.baseurl + 'a.json']
+        )
+        self.assertEqual(
+            self.driver.rscpaths('https://host/a.json'),
+            ['https://host/a.json']
+        )
+        self.assertEqual(HTTPConfDriver().rscpaths('a.json'), [])
+
+    def test_getconf(self):
+
+        conf = self.driver.getconf('a.json')
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+        conf = self.driver.getconf('b')  # parsed from the content type
+        self.assertEqual(conf['B']['b'].svalue, '2')
+
+        conf = self.driver.getconf('c.conf')  # parsed from the suffix
+        self.assertEqual(conf['C']['c'].svalue, '3')
+
+        self.assertIsNone(self.driver.getconf('d.json'))
+
+        self.assertEqual(self.server.statuses, [200, 200, 200, 404])
+        self.assertEqual(self.server.connections, 1)  # keep-alive
+
+    def test_charset(self):
+
+        conf = self.driver.getconf('e')  # decoded with the response charset
+        self.assertEqual(conf['E']['e'].svalue, u'\xe9')
+
+    def test_conditional(self):
+
+        url = self.baseurl + 'a.json'
+
+        self.driver.getconf('a.json')
+        resource = self.driver._entries[url].resource
+
+        conf = self.driver.getconf('a.json')
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertEqual(self.server.statuses, [200, 304])
+        # not parsed again
+        self.assertIs(self.driver._entries[url].resource, resource)
+
+    def test_maxage(self):
+
+        self.driver.maxage = 60
+
+        self.driver.prefetch(['a.json', 'b', 'c.conf'])
+
+        self.assertEqual(sorted(self.server.statuses), [200, 200, 200])
+
+        conf = self.driver.getconf('a.json')
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertEqual(len(self.server.statuses), 3)
+
+    def test_offline(self):
+
+        self.driver.getconf('a.json')
+
+        self._shutdown()
+        self.driver.close()
+
+        conf = self.driver.getconf('a.json')
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+        # last good copies are stored in the cache directory
+        driver = HTTPConfDriver(baseurl=self.baseurl, cachedir=self.cachedir)
+
+        conf = driver.getconf('a.json')
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+        self.assertIsNone(driver.getconf('b'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""INI ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..ini import INIConfDriver
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+
+
+class INIConfDriverTest(UTCase):
+    """Test the INIConfDriver."""
+
+    def setUp(self):
+
+        self.driver = INIConfDriver()
+
+    def test_empty(self):
+
+        self.assertIsNone(self.driver.getconf(path=''))
+
+    def test_setconf(self):
+
+        conf = configuration(
+            category('A', Parameter('a', svalue='1'), Parameter('b')),
+            category('B', Parameter('c', svalue='2'))
+        )
+
+        content = self.driver._setconf(
+            conf=conf, resource=self.driver.resource(), rscpath=None
+        )
+
+        self.assertIn('[A]', content)
+
+        rconf = self.driver.getconf(path=content)
+
+        self.assertEqual(list(rconf), ['A', 'B'])
+        self.assertEqual(rconf['A']['a'].svalue, '1')
+        self.assertEqual(rconf['B']['c'].svalue, '2')
+
+    def test_bytes(self):
+
+        conf = self.driver.getconf(path=b'[A]\na = 1\n')
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""JSON ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..json import JSONConfDriver
+
+
+class JSONConfDriverTest(UTCase):
+    """Test the JSONConfDriver."""
+
+    def setUp(self):
+
+        self.driver = JSONConfDriver()
+
+    def test_text(self):
+
+        conf = self.driver.getconf(path=u'{"A": {"a": "1"}}')
+
+        self.assertEqual(conf['A']['a'].svalue, '1')
+
+    def test_bytes(self):
+
+        conf = self.driver.getconf(path=u'{"A": {"a": "é"}}'.encode('utf-8'))
+
+        self.assertEqual(conf['A']['a'].svalue, u'é')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Projection UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from re import compile as re_compile
+
+from ..projection import Projection
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+
+
+class ProjectionTest(UTCase):
+    """Test the Projection class."""
+
+    def setUp(self):
+
+        self.projection = Projection(
+            {'a': ['b', re_compile('c.*')], 'd': None}, prefixes=(':',)
+        )
+
+    def test_category(self):
+
+        self.assertTrue(self.projection.category('a'))
+        self.assertTrue(self.projection.category('d'))
+        self.assertTrue(self.projection.category(':e'))
+        self.assertFalse(self.projection.category('e'))
+
+    def test_param(self):
+
+        projection = self.projection
+
+        self.assertTrue(projection.param('a', 'b'))
+        self.assertTrue(projection.param('a', 'cd'))
+        self.assertTrue(projection.param('a', 'c.*'))
+        self.assertTrue(projection.param('a', re_compile('c.*')))
+        self.assertTrue(projection.param('a', re_compile('b|e')))
+        self.assertFalse(projection.param('a', 'e'))
+        self.assertFalse(projection.param('a', re_compile('e')))
+        self.assertTrue(projection.param('d', 'e'))
+        self.assertTrue(projection.param(':e', 'e'))
+        self.assertFalse(projection.param('e', 'b'))
+
+    def test_fromconf(self):
+
+        conf = configuration(
+            category('a', Parameter('b'), Parameter('^c.*')),
+            category('d')
+        )
+
+        projection = Projection.fromconf(conf)
+
+        self.assertTrue(projection.param('a', 'b'))
+        self.assertTrue(projection.param('a', 'cd'))
+        self.assertFalse(projection.param('a', 'e'))
+        self.assertTrue(projection.category('d'))
+        self.assertFalse(projection.param('d', 'e'))
+        self.assertFalse(projection.category(':e'))
+
+
+if __name__ == '__main__':
+    main()
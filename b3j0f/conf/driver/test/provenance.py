@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Provenance UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from .base import TestConfDriver
+
+from ..provenance import Provenance
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+from ...configurable.core import Configurable
+
+
+class ProvenanceTest(UTCase):
+    """Test the Provenance class."""
+
+    def setUp(self):
+
+        self.driver = TestConfDriver()
+        self.driver.confbypath = {
+            'a': configuration(
+                category(
+                    'A', Parameter('a', svalue='a'), Parameter('b', svalue='a')
+                )
+            ),
+            'b': configuration(
+                category('A', Parameter('b', svalue='b')),
+                category('B', Parameter('c', svalue='b'))
+            )
+        }
+        self.configurable = Configurable(
+            drivers=[self.driver], paths=['a', 'b'], autoconf=False
+        )
+
+        self.provenance = Provenance()
+        self.conf = self.configurable.getconf(provenance=self.provenance)
+
+    def test_layers(self):
+        """Test provenance layers and sources."""
+
+        self.assertEqual(self.provenance.rscpaths(), ['a', 'b'])
+
+        self.assertEqual(self.provenance.source('A', 'a'), ('a', self.driver))
+        self.assertEqual(self.provenance.source('A', 'b'), ('b', self.driver))
+        self.assertEqual(
+            self.provenance.sources('A', 'b'),
+            [('a', self.driver), ('b', self.driver)]
+        )
+        self.assertIsNone(self.provenance.source('A', 'c'))
+
+    def test_merge(self):
+        """Test to merge layers."""
+
+        conf = self.provenance.merge()
+
+        self.assertEqual(conf['A']['a'].svalue, 'a')
+        self.assertEqual(conf['A']['b'].svalue, 'b')
+        self.assertEqual(conf['B']['c'].svalue, 'b')
+
+        self.assertEqual(conf.fingerprint(), self.conf.fingerprint())
+
+    def test_reload(self):
+        """Test to reload one resource."""
+
+        self.driver.confbypath['a'] = configuration(
+            category('A', Parameter('a', svalue='c'))
+        )
+
+        reads = []
+        pathresource = self.driver._pathresource
+
+        def _pathresource(rscpath):
+            reads.append(rscpath)
+            return pathresource(rscpath)
+
+        self.driver._pathresource = _pathresource
+
+        conf = self.provenance.reload('a')
+
+        self.assertEqual(reads, ['a'])
+
+        self.assertEqual(conf['A']['a'].svalue, 'c')
+        self.assertEqual(conf['A']['b'].svalue, 'b')
+        self.assertEqual(self.provenance.sources('A', 'b'), [('b', self.driver)])
+
+    def test_reload_removed(self):
+        """Test to reload a resource which does not exist anymore."""
+
+        self.driver.confbypath['b'] = None
+
+        conf = self.provenance.reload('b')
+
+        self.assertEqual(self.provenance.rscpaths(), ['a'])
+        self.assertEqual(conf['A']['b'].svalue, 'a')
+        self.assertNotIn('B', conf)
+
+    def test_reload_unknown(self):
+        """Test to reload an unknown resource."""
+
+        self.assertRaises(KeyError, self.provenance.reload, 'c')
+
+
+if __name__ == '__main__':
+    main()
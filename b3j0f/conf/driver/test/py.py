@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""Python ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from ..py import PYConfDriver, compileconf, _literal
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+
+from os.path import join
+
+from shutil import rmtree
+
+from sys import path, modules
+
+from tempfile import mkdtemp
+
+
+class LiteralTest(UTCase):
+    """Test the function _literal."""
+
+    def test_literals(self):
+
+        for value in [
+                None, True, 1, 1.5, 'a', [1, 'a'], (1,), (), {'a': [1]},
+                set([1]), frozenset([2])
+        ]:
+            self.assertEqual(eval(_literal(value)), value)
+
+    def test_nonfinite(self):
+
+        self.assertRaises(ValueError, _literal, float('inf'))
+
+    def test_object(self):
+
+        self.assertRaises(ValueError, _literal, object())
+
+    def test_unreachable(self):
+
+        def unreachable():
+            pass
+
+        self.assertRaises(ValueError, _literal, unreachable)
+
+    def test_class(self):
+
+        self.assertEqual(_literal(UTCase), "_lookup('b3j0f.utils.ut.UTCase')")
+
+
+class PYConfDriverTest(UTCase):
+    """Test the PYConfDriver."""
+
+    def setUp(self):
+
+        self.dirpath = mkdtemp()
+        path.insert(0, self.dirpath)
+
+        self.driver = PYConfDriver()
+
+        self.conf = configuration(
+            category(
+                'test',
+                Parameter('a', svalue='1', ptype=int),
+                Parameter('b', svalue='=@a + 1'),
+                Parameter('c', svalue='=UTCase'),
+                Parameter('d', value=[1, 2]),
+                Parameter('e', svalue='@unknown'),
+                Parameter('f', value=object())
+            ),
+            category('regex', Parameter('^t.*', svalue='t'))
+        )
+
+    def tearDown(self):
+
+        path.remove(self.dirpath)
+        rmtree(self.dirpath)
+        modules.pop('compiledconf', None)
+
+    def _getconf(self, conf=None, lazy=False):
+        """Compile self conf and get it with the driver."""
+
+        source = compileconf(
+            self.conf, scope={'UTCase': UTCase}, besteffort=True
+        )
+
+        with open(join(self.dirpath, 'compiledconf.py'), 'w') as handle:
+            handle.write(source)
+
+        return self.driver.getconf('compiledconf', conf=conf, lazy=lazy)
+
+    def test_getconf(self):
+
+        conf = self._getconf()
+
+        self.assertEqual(list(conf), ['test', 'regex'])
+
+        params = conf['test']
+
+        self.assertEqual(params['a'].value, 1)
+        self.assertIsNone(params['a']._svalue)  # folded value
+        self.assertEqual(params['b'].value, 2)
+        self.assertIs(params['c'].value, UTCase)
+        self.assertEqual(params['d'].value, [1, 2])
+        self.assertEqual(params['e']._svalue, '@unknown')
+        self.assertIsNotNone(params['f']._svalue)  # serialized value
+
+        self.assertEqual(list(conf['regex'].values())[0].name.pattern, '^t.*')
+
+    def test_lazy(self):
+        """Test to get a lazy configuration with a regex parameter."""
+
+        conf = self._getconf(lazy=True)
+
+        self.assertEqual(conf['test']['a'].value, 1)
+        self.assertEqual(list(conf['regex'].values())[0].name.pattern, '^t.*')
+
+    def test_conf(self):
+        """Test to convert values with the conf parameter types."""
+
+        model = configuration(
+            category('test', Parameter('a', ptype=float))
+        )
+
+        conf = self._getconf(conf=model)
+
+        self.assertEqual(conf['test']['a'].value, 1.)
+        self.assertIsInstance(conf['test']['a'].value, float)
+        self.assertIsNone(conf['test']['a']._svalue)
+
+    def test_unchanged(self):
+        """Test compiled conf is not modified."""
+
+        compileconf(self.conf)
+
+        self.assertIsNone(self.conf['test']['a']._value)
+
+    def test_recompile(self):
+        """Test to get a configuration after a new compilation."""
+
+        conf = self._getconf()
+
+        self.assertEqual(conf['test']['a'].value, 1)
+
+        self.conf['test']['a'].svalue = '2'
+
+        conf = self._getconf()
+
+        self.assertEqual(conf['test']['a'].value, 2)
+        self.assertEqual(conf['test']['b'].value, 3)
+
+        conf = self.driver.getconf('compiledconf')  # unchanged source
+
+        self.assertEqual(conf['test']['a'].value, 2)
+
+    def test_wrong(self):
+
+        self.assertIsNone(self.driver.getconf('wrongcompiledconf'))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+"""XML ConfDriver UTs."""
+
+from b3j0f.utils.ut import UTCase
+
+from unittest import main
+
+from io import BytesIO
+
+from ..xml import XMLConfDriver, XMLResource
+from ...model.conf import configuration
+from ...model.cat import category
+from ...model.param import Parameter
+
+XML = (
+    '<configuration>'
+    '<category name="A">'
+    '<parameter name="a" svalue="a"/>'
+    '<parameter name="b" svalue="b"/>'
+    '</category>'
+    '<category name="B"><parameter name="c" svalue="c"/></category>'
+    '<category name="A"><parameter name="a" svalue="d"/></category>'
+    '</configuration>'
+)
+
+
+class XMLResourceTest(UTCase):
+    """Test the XMLResource."""
+
+    def _assertindex(self, resource):
+
+        self.assertEqual(resource.cnames, ['A', 'B'])
+        self.assertEqual(
+            [
+                (pname, attrib['svalue'])
+                for pname, attrib in resource.items('A')
+            ],
+            [('a', 'd'), ('b', 'b')]
+        )
+        self.assertEqual(resource.items('C'), [])
+
+    def test_index(self):
+
+        resource = XMLConfDriver()._pathresource(XML)
+
+        self._assertindex(resource)
+
+    def test_iterparse(self):
+
+        resource = XMLResource.iterparse(BytesIO(XML.encode('utf-8')))
+
+        self.assertIsNone(resource.root)
+        self._assertindex(resource)
+
+    def test_set(self):
+
+        resource = XMLConfDriver()._pathresource(XML)
+
+        resource.set('A', 'a', 'e')
+        resource.set('A', 'f', None)
+        resource.set('C', 'g', 'g')
+
+        resource = XMLConfDriver()._pathresource(resource.tostring())
+
+        self.assertEqual(resource.cnames, ['A', 'B', 'C'])
+        self.assertEqual(
+            [
+                (pname, attrib.get('svalue'))
+                for pname, attrib in resource.items('A')
+            ],
+            [('a', 'e'), ('b', 'b'), ('f', None)]
+        )
+
+
+class XMLConfDriverTest(UTCase):
+    """Test the XMLConfDriver."""
+
+    def test_setconf(self):
+
+        driver = XMLConfDriver()
+
+        conf = configuration(
+            category('A', Parameter('a', svalue='1'), Parameter('^r.*')),
+            category('B', Parameter('b', svalue='2'))
+        )
+
+        result = driver._setconf(conf, driver._pathresource(XML), XML)
+
+        conf = driver.getconf(result)
+
+        self.assertEqual(list(conf), ['A', 'B'])
+        self.assertEqual(conf['A']['a'].svalue, '1')
+        self.assertEqual(conf['A']['b'].svalue, 'b')
+        self.assertEqual(conf['B']['b'].svalue, '2')
+        self.assertEqual(conf['B']['c'].svalue, 'c')
+        self.assertEqual(len(conf['A']), 3)
+
+
+if __name__ == '__main__':
+    main()
@@ -24,133 +24,218 @@
 # SOFTWARE.
 # --------------------------------------------------------------------
 
-"""XML configuration driver."""
+"""XML configuration driver.
+
+XML resources are indexed by category and parameter names in one traversal
+(see XMLResource), therefore reading and writing are linear.
+"""
 
 from __future__ import absolute_import
 
-__all__ = ['XMLConfDriver']
+__all__ = ['XMLConfDriver', 'XMLResource']
+
+from b3j0f.utils.version import OrderedDict
 
-from b3j0f.utils.version import PY2
+from xml.etree.ElementTree import fromstring, tostring, iterparse, Element
 
-from xml.etree.ElementTree import fromstring, Element, ElementTree
+from six import string_types
 
 from .base import ConfDriver
 from ..model.param import Parameter
 
+CONFIGURATION = 'configuration'  #: configuration tag.
+CATEGORY = 'category'  #: category tag.
+PARAMETER = 'parameter'  #: parameter tag.
 
-class XMLConfDriver(ConfDriver):
-    """Manage xml resource configuration."""
 
-    CONFIGURATION = 'configuration'
-    PARAMETER = 'parameter'
-    CATEGORY = 'category'
+class XMLResource(object):
+    """XML resource indexed by category and parameter names.
 
-    def rscpaths(self, path):
+    Parameters are indexed such as attribute dictionaries by name and by
+    category name. Categories with the same name are merged and the last
+    parameter with a name wins.
 
-        return [path]
+    A streamed resource has no element tree and keeps only parameter
+    attributes."""
 
-    def resource(self):
+    __slots__ = ('root', 'cnames', 'categories', 'params')
 
-        return ElementTree(Element(XMLConfDriver.CONFIGURATION))
+    def __init__(self, root=None):
+        """
+        :param Element root: configuration element to index. Default a new
+            configuration element.
+        """
 
-    def _pathresource(self, rscpath):
+        super(XMLResource, self).__init__()
 
-        result = fromstring(rscpath)
+        if root is None:
+            root = Element(CONFIGURATION)
 
-        return result
+        self.root = root
+        self.cnames = []  # category names in order
+        self.categories = {}  # first category element by name
+        self.params = {}  # parameter elements by name by category name
 
-    def _cnames(self, resource):
+        for ecat in root.findall(CATEGORY):
+
+            cname = ecat.get('name')
+            params = self._addcategory(cname, ecat)
+
+            for eparam in ecat.findall(PARAMETER):
+                params[eparam.get('name')] = eparam
+
+    def _addcategory(self, cname, ecat=None):
+        """Index a category.
+
+        :return: category parameters by name.
+        :rtype: dict"""
+
+        result = self.params.get(cname)
 
-        result = list(
-            cat.get('name') for cat in resource.findall(XMLConfDriver.CATEGORY)
-        )
+        if result is None:
+            self.cnames.append(cname)
+            self.categories[cname] = ecat
+            result = self.params[cname] = OrderedDict()
 
         return result
 
-    def _params(self, resource, cname):
+    @staticmethod
+    def iterparse(source):
+        """Index an XML source in streaming such as parameter attributes,
+        without keeping the element tree.
+
+        :param source: file name or file object.
+        :rtype: XMLResource"""
+
+        result = XMLResource.__new__(XMLResource)
+        result.root = None
+        result.cnames = []
+        result.categories = {}
+        result.params = {}
+
+        params = None
+        depth = 0
+        root = None
 
-        result = []
+        for event, element in iterparse(source, events=('start', 'end')):
 
-        if PY2:
-            ecats = resource.findall(XMLConfDriver.CATEGORY)
+            if event == 'start':
 
-            ecat = None
+                depth += 1
 
-            for ecat in ecats:
-                if ecat.get('name') == cname:
-                    break
+                if depth == 1:
+                    root = element
+
+                elif depth == 2 and element.tag == CATEGORY:
+                    params = result._addcategory(element.get('name'))
 
             else:
-                ecat = None
 
-            if ecat is not None:
-                eparams = ecat.findall(XMLConfDriver.PARAMETER)
+                depth -= 1
+
+                if depth == 2 and element.tag == PARAMETER and params is not None:
+                    params[element.get('name')] = dict(element.attrib)
+
+                elif depth == 1:
+                    params = None
+                    root.clear()  # release processed categories
+
+        return result
+
+    def items(self, cname):
+        """Get (name, attributes) of category parameters.
+
+        :rtype: list"""
+
+        return [
+            (pname, getattr(eparam, 'attrib', eparam))
+            for pname, eparam in self.params.get(cname, {}).items()
+        ]
+
+    def set(self, cname, pname, svalue):
+        """Set a parameter serialized value.
+
+        :param str cname: category name.
+        :param str pname: parameter name.
+        :param str svalue: serialized value. None for no value."""
 
-                result = list(Parameter(**eparam.attrib) for eparam in eparams)
+        params = self.params.get(cname)
 
-        else:
-            query = '{0}[@name=\'{1}\']/{2}'.format(
-                XMLConfDriver.CATEGORY,
-                cname,
-                XMLConfDriver.PARAMETER
-            )
+        if params is None:
+            ecat = Element(CATEGORY, name=cname)
+            self.root.append(ecat)
+            params = self._addcategory(cname, ecat)
 
-            result = list(
-                Parameter(**param.attrib) for param in resource.findall(query)
-            )
+        eparam = params.get(pname)
+
+        if eparam is None:
+            eparam = params[pname] = Element(PARAMETER, name=pname)
+            self.categories[cname].append(eparam)
+
+        if svalue is not None:
+            eparam.set('svalue', svalue)
+
+    def tostring(self):
+        """Serialize this resource.
+
+        :rtype: str"""
+
+        result = tostring(self.root)
+
+        if not isinstance(result, string_types):
+            result = result.decode('utf-8')
 
         return result
 
-    def _setconf(self, conf, resource, rscpath):
 
-        for cat in conf.values():
+class XMLConfDriver(ConfDriver):
+    """Manage xml resource configuration."""
 
-            cquery = XMLConfDriver.CATEGORY
+    CONFIGURATION = CONFIGURATION
+    PARAMETER = PARAMETER
+    CATEGORY = CATEGORY
 
-            ecat = None
+    def rscpaths(self, path):
 
-            if PY2:
-                ecats = resource.findall(cquery)
-                for ecat in ecats:
-                    if ecat.get('name') == 'cat.name':
-                        break
+        return [path]
 
-                else:
-                    ecat = None
+    def resource(self):
 
-            else:
-                cquery += '[@name=\'{0}\']'.format(cat.name)
-                ecat = resource.find(cquery)
+        return XMLResource()
 
-            if ecat is None:
-                ecat = Element(XMLConfDriver.CATEGORY, name=cat.name)
-                resource.getroot().append(ecat)
+    def _pathresource(self, rscpath):
 
-            for param in cat.values():
+        result = XMLResource(fromstring(rscpath))
+
+        return result
+
+    def _cnames(self, resource):
+
+        return list(resource.cnames)
+
+    def _pitems(self, resource, cname):
 
-                pquery = XMLConfDriver.PARAMETER
+        return resource.items(cname)
 
-                eparam = None
+    def _param(self, resource, cname, item):
 
-                if PY2:
-                    eparams = ecat.findall(pquery)
-                    for eparam in eparams:
-                        if eparam.get('name') == param.name:
-                            break
+        return Parameter(**item)
 
-                    else:
-                        eparam = None
+    def _params(self, resource, cname):
+
+        return [Parameter(**attrib) for _, attrib in resource.items(cname)]
+
+    def _setconf(self, conf, resource, rscpath):
 
-                else:
-                    cquery += '[@name=\'{0}\']'.format(param.name)
+        for cat in conf.values():
+
+            for param in cat.values():
 
-                    eparam = ecat.find(pquery)
+                pname = param.name
 
-                if eparam is None:
-                    eparam = Element(XMLConfDriver.PARAMETER, name=param.name)
-                    ecat.append(eparam)
+                if not isinstance(pname, string_types):  # regex name
+                    pname = pname.pattern
 
-                if param.svalue is not None:
-                    eparam.set('svalue', param.svalue)
+                resource.set(cat.name, pname, param.svalue)
 
-        return resource.getroot().text
+        return resource.tostring()
@@ -2,10 +2,10 @@
 
 __all__ = [
     'Configuration', 'configuration',
-    'Category', 'category',
-    'Parameter', 'Array', 'BOOL', 'ARRAY', 'PType'
+    'Category', 'category', 'LazyCategory',
+    'Parameter', 'Array', 'BOOL', 'ARRAY', 'PType', 'NumArray'
 ]
 
 from .conf import Configuration, configuration
-from .cat import Category, category
-from .param import Parameter, BOOL, ARRAY, Array, PType
+from .cat import Category, category, LazyCategory
+from .param import Parameter, BOOL, ARRAY, Array, PType, NumArray
@@ -31,6 +31,95 @@ __all__ = ['ModelElement', 'CompositeModelElement']
 from b3j0f.utils.version import OrderedDict
 
 
+_SLOTS = {}  #: (slot names, slot values copier) by class.
+_NOTSLOTS = ('__dict__', '__weakref__')  #: special slot names.
+
+
+def _allslots(cls):
+    """Get all slot names of input class and its base classes, and a function
+    which copies slot values from an instance to another.
+
+    The copier is compiled once per class in order to avoid the cost of
+    generic attribute accesses.
+
+    :param type cls: class from where get slot names.
+    :return: slot names and slot values copier which takes in parameters the
+        source and target instances.
+    :rtype: tuple"""
+
+    try:
+        result = _SLOTS[cls]
+
+    except KeyError:
+
+        slots = []
+
+        for mro in reversed(cls.__mro__):
+
+            mroslots = mro.__dict__.get('__slots__', ())
+
+            if isinstance(mroslots, str):
+                mroslots = (mroslots, )
+
+            for slot in mroslots:
+
+                if slot[:2] == '__' and slot[-2:] != '__':  # private slot
+                    slot = '_{0}{1}'.format(mro.__name__.lstrip('_'), slot)
+
+                if slot not in slots and slot not in _NOTSLOTS:
+                    slots.append(slot)
+
+        slots = tuple(slots)
+
+        source = 'def copier(source, target):\n    pass\n{0}'.format(
+            ''.join(
+                '    target.{0} = source.{0}\n'.format(slot) for slot in slots
+            )
+        )
+        namespace = {}
+        exec(source, namespace)
+
+        result = _SLOTS[cls] = slots, namespace['copier']
+
+    return result
+
+
+def _hash(value):
+    """Get a hash of input value, even if it is not hashable.
+
+    :rtype: int"""
+
+    try:
+        result = hash(value)
+
+    except TypeError:  # not hashable value
+        result = hash(repr(value))
+
+    return result
+
+
+def _composite(cls, slots, items):
+    """Rebuild a pickled composite model element (see the method
+    CompositeModelElement.__reduce__).
+
+    :param type cls: composite model element class.
+    :param list slots: (slot name, slot value).
+    :param list items: (key, model element) in the content order.
+    :rtype: CompositeModelElement"""
+
+    result = cls.__new__(cls)
+
+    OrderedDict.__init__(result)
+
+    for slot, value in slots:
+        setattr(result, slot, value)
+
+    for key, melt in items:
+        OrderedDict.__setitem__(result, key, melt)
+
+    return result
+
+
 class ModelElement(object):
     """Base configuration elementParameter.
 
@@ -45,10 +134,28 @@ class ModelElement(object):
 
     __slots__ = ()
 
+    #: if True (default), copies are cloned without calling the constructor
+    #: (see the method _clone). Set it to False if the constructor of a sub
+    #: class does more than setting slot values.
+    __clone__ = True
+
+    __fingerprint__ = ()  #: slot names used to compute the fingerprint.
+
+    #: slot names which are not part of the element state. They are ignored by
+    #: the copy with the constructor, the representation and the update.
+    __transient__ = ()
+
     def copy(self, *args, **kwargs):
         """Copy this model element and contained elements if they exist."""
 
+        if (self.__clone__ and not (args or kwargs)) or self._clonable(
+                *args, **kwargs
+        ):
+            return self._clone(**kwargs)
+
         for slot in self.__slots__:
+            if slot in self.__transient__:
+                continue
             attr = getattr(self, slot)
             if slot[0] == '_':  # convert protected attribute name to public
                 slot = slot[1:]
@@ -59,6 +166,73 @@ class ModelElement(object):
 
         return result
 
+    def _clonable(self, *args, **kwargs):
+        """True iif a copy with input parameters can be cloned.
+
+        A copy is cloned if it is enabled by the class attribute ``__clone__``
+        and if there are only keyword parameters which are public slot names.
+        """
+
+        result = self.__clone__ and not args
+
+        if result and kwargs:
+            slots = _allslots(type(self))[0]
+            result = all(
+                kwarg[0] != '_' and kwarg in slots for kwarg in kwargs
+            )
+
+        return result
+
+    def _new(self):
+        """Allocate a new instance of this type without initializing it."""
+
+        cls = type(self)
+
+        return cls.__new__(cls)
+
+    def _clone(self, **kwargs):
+        """Clone this model element.
+
+        Contrary to the copy with the constructor, slot values are directly
+        copied into a new instance.
+
+        :param dict kwargs: slot values to use instead of this slot values.
+        :return: this clone."""
+
+        result = self._new()
+
+        slots, copier = _allslots(type(self))
+
+        try:
+            copier(self, result)
+
+        except AttributeError:  # copy only set slots
+            for slot in slots:
+                if hasattr(self, slot):
+                    setattr(result, slot, getattr(self, slot))
+
+        for slot in kwargs:
+            setattr(result, slot, kwargs[slot])
+
+        return result
+
+    def fingerprint(self):
+        """Get a fingerprint of this content.
+
+        Two elements with the same content have the same fingerprint, which
+        is cheaper to compare than elements. Fingerprints are built from
+        python hashes, therefore they can change from a python process to
+        another.
+
+        :rtype: int"""
+
+        return hash(
+            tuple(
+                _hash(getattr(self, slot, None))
+                for slot in self.__fingerprint__
+            )
+        )
+
     def __eq__(self, other):
 
         result = isinstance(other, self.__class__)
@@ -88,6 +262,9 @@ class ModelElement(object):
 
         for __slot__ in self.__slots__:
 
+            if __slot__ in self.__transient__:
+                continue
+
             if __slot__.startswith('_'):
                 if hasattr(self, __slot__):
                     __slot__ = __slot__[1:]
@@ -122,6 +299,8 @@ class ModelElement(object):
                     other = other.copy(*args, **kwargs)
 
                 for slot in other.__slots__:
+                    if slot in self.__transient__:
+                        continue
                     attr = getattr(other, slot)
                     if attr is not None:
                         setattr(self, slot, attr)
@@ -152,10 +331,71 @@ class CompositeModelElement(ModelElement, OrderedDict):
             for melt in melts:
                 self[melt.name] = melt
 
+    def _oncontentchange(self):
+        """Called when this content changes.
+
+        Override this method in order to invalidate content caches."""
+
+    def __setitem__(self, key, value, *args, **kwargs):
+
+        super(CompositeModelElement, self).__setitem__(
+            key, value, *args, **kwargs
+        )
+
+        self._oncontentchange()
+
+    def __delitem__(self, key, *args, **kwargs):
+
+        super(CompositeModelElement, self).__delitem__(key, *args, **kwargs)
+
+        self._oncontentchange()
+
+    def pop(self, *args, **kwargs):
+
+        result = super(CompositeModelElement, self).pop(*args, **kwargs)
+
+        self._oncontentchange()
+
+        return result
+
+    def popitem(self, *args, **kwargs):
+
+        result = super(CompositeModelElement, self).popitem(*args, **kwargs)
+
+        self._oncontentchange()
+
+        return result
+
+    def setdefault(self, *args, **kwargs):
+
+        result = super(CompositeModelElement, self).setdefault(*args, **kwargs)
+
+        self._oncontentchange()
+
+        return result
+
+    def clear(self):
+
+        super(CompositeModelElement, self).clear()
+
+        self._oncontentchange()
+
     def __deepcopy__(self, _):
 
         return self.copy()
 
+    def __reduce__(self):
+        """Pickle slot values and contained elements without content caches.
+        """
+
+        slots = _allslots(type(self))[0]
+
+        return _composite, (
+            type(self),
+            [(slot, getattr(self, slot)) for slot in slots],
+            list(OrderedDict.items(self))
+        )
+
     def __getattr__(self, key):
         """Try to delegate key attribute to content name."""
         result = None
@@ -240,8 +480,43 @@ class CompositeModelElement(ModelElement, OrderedDict):
 
         return result
 
+    def fingerprint(self):
+        """Get a fingerprint of this attributes and the fingerprints of this
+        content (such as a Merkle tree), in order to skip identical sub
+        elements in comparing fingerprints.
+
+        :rtype: int"""
+
+        return hash(
+            (
+                super(CompositeModelElement, self).fingerprint(),
+                tuple(melt.fingerprint() for melt in self.values())
+            )
+        )
+
+    def _new(self):
+
+        result = super(CompositeModelElement, self)._new()
+
+        OrderedDict.__init__(result)
+
+        return result
+
+    def _clone(self, **kwargs):
+
+        result = super(CompositeModelElement, self)._clone(**kwargs)
+
+        for melt in self.values():
+            melt = melt.copy()
+            OrderedDict.__setitem__(result, melt.name, melt)
+
+        return result
+
     def copy(self, *args, **kwargs):
 
+        if self._clonable(*args, **kwargs):
+            return super(CompositeModelElement, self).copy(**kwargs)
+
         melts = [melt.copy() for melt in self.values()]
 
         result = super(CompositeModelElement, self).copy(
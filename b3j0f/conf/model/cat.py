@@ -26,12 +26,134 @@
 
 """model.cat module."""
 
-__all__ = ['Category']
+__all__ = ['Category', 'ParamMatcher', 'LazyCategory']
 
-from .base import CompositeModelElement
+from re import compile as re_compile, error as re_error
+
+from six import string_types
+
+from b3j0f.utils.version import OrderedDict
+
+from .base import ModelElement, CompositeModelElement, _allslots, _composite
 from .param import Parameter
 
 
+class ParamMatcher(object):
+    """Index of parameters dedicated to find parameters which match with a
+    parameter name.
+
+    Parameters with a string name are indexed by name (hash lookup) and
+    parameters with a regex name are matched with combined regexes, one
+    alternation per group of regexes where the matched alternative gives the
+    first matching parameter.
+
+    Results respect the order of indexed parameters."""
+
+    __slots__ = ('names', 'patterns', 'combined', 'singles')
+
+    MAX_GROUPS = 99  #: maximal number of alternatives in a combined regex.
+
+    _DEFAULT_FLAGS = re_compile('').flags  #: default regex flags.
+
+    def __init__(self, params):
+        """
+        :param list params: parameters to index."""
+
+        super(ParamMatcher, self).__init__()
+
+        self.names = {}  # parameters by string name
+        self.patterns = {}  # parameters by regex pattern
+        self.combined = []  # (combined regex, entries)
+        self.singles = []  # entries which can not be combined
+
+        combinables = []
+
+        for position, param in enumerate(params):
+
+            name = param.name
+
+            if isinstance(name, string_types):
+                self.names.setdefault(name, []).append((position, param))
+
+            else:
+                entry = (position, param)
+                self.patterns.setdefault(name.pattern, []).append(entry)
+
+                if self._combinable(name):
+                    combinables.append(entry)
+
+                else:
+                    self.singles.append(entry)
+
+        for index in range(0, len(combinables), self.MAX_GROUPS):
+
+            entries = combinables[index: index + self.MAX_GROUPS]
+
+            pattern = '|'.join(
+                '({0})'.format(entry[1].name.pattern) for entry in entries
+            )
+
+            try:
+                regex = re_compile(pattern)
+
+            except re_error:
+                self.singles += entries
+
+            else:
+                self.combined.append((regex, entries))
+
+        self.singles.sort(key=lambda entry: entry[0])
+
+    @staticmethod
+    def _combinable(regex):
+        """True iif input regex can be part of a combined regex."""
+
+        pattern = regex.pattern
+
+        return (
+            isinstance(pattern, string_types) and regex.groups == 0 and
+            '(?' not in pattern and regex.flags == ParamMatcher._DEFAULT_FLAGS
+        )
+
+    def match(self, param):
+        """Get indexed parameters which match with input param.
+
+        :param Parameter param: parameter to match.
+        :rtype: list"""
+
+        name = param.name
+
+        if isinstance(name, string_types):
+            entries = list(self.names.get(name, ()))
+
+            for regex, combinedentries in self.combined:
+
+                match = regex.match(name)
+
+                if match is not None:
+                    index = match.lastindex - 1
+                    entries.append(combinedentries[index])
+
+                    for entry in combinedentries[index + 1:]:
+                        if entry[1].name.match(name):
+                            entries.append(entry)
+
+            for entry in self.singles:
+                if entry[1].name.match(name):
+                    entries.append(entry)
+
+        else:
+            entries = list(self.patterns.get(name.pattern, ()))
+
+            for pname in self.names:
+                if name.match(pname):
+                    entries += self.names[pname]
+
+        entries.sort(key=lambda entry: entry[0])
+
+        return [entry[1] for entry in entries]
+
+
 class Category(CompositeModelElement):
     """Parameter category which contains a dictionary of params."""
 
@@ -39,6 +161,8 @@ class Category(CompositeModelElement):
 
     __slots__ = ('name', 'local') + CompositeModelElement.__slots__
 
+    __fingerprint__ = ('name', 'local')
+
     def __init__(self, name, local=True, *args, **kwargs):
         """
         :param str name: category name to use.
@@ -49,6 +173,25 @@ class Category(CompositeModelElement):
         self.name = name
         self.local = local
 
+    def _oncontentchange(self):
+
+        self.__dict__.pop('_matcher', None)
+
+    def _getmatcher(self):
+        """Get the index of this parameters by name.
+
+        The index is built at the first call and reset when this content
+        changes.
+
+        :rtype: ParamMatcher"""
+
+        result = self.__dict__.get('_matcher')
+
+        if result is None:
+            result = self.__dict__['_matcher'] = ParamMatcher(self.values())
+
+        return result
+
     def getparams(self, param):
         """Get parameters which match with input param.
 
@@ -56,7 +199,15 @@ class Category(CompositeModelElement):
         :rtype: list
         """
 
-        return list(cparam for cparam in self.values() if cparam == param)
+        return self._getmatcher().match(param)
+
+    def dirtyparams(self):
+        """Get parameters which changed since they have been read from or
+        written to a configuration resource.
+
+        :rtype: list"""
+
+        return [param for param in self.values() if param.dirty]
 
     def copy(self, cleaned=False, name=None, *args, **kwargs):
 
@@ -66,6 +217,227 @@ class Category(CompositeModelElement):
         return super(Category, self).copy(name=name, *args, **kwargs)
 
 
+def _loaded(method):
+    """Decorate a LazyCategory method which needs all parameters."""
+
+    def _method(self, *args, **kwargs):
+
+        if self._pending:
+            self._loadall()
+
+        return method(self, *args, **kwargs)
+
+    _method.__doc__ = method.__doc__
+
+    return _method
+
+
+class LazyCategory(Category):
+    """Category which materializes parameters from raw parameters when they
+    are accessed.
+
+    Parameters are loaded one by one when they are accessed by name, and all
+    parameters are loaded when the category is iterated or measured. Raw
+    parameters with a regex name are loaded at the construction."""
+
+    def __init__(self, name, items=(), loader=None, *args, **kwargs):
+        """
+        :param str name: category name.
+        :param list items: raw parameters such as (name, raw parameter).
+        :param callable loader: function which takes in parameter a raw
+            parameter and returns a Parameter.
+        """
+
+        self._loader = loader
+        self._pending = {}  # raw parameters by name
+        self._names = []  # parameter names in the raw order
+
+        super(LazyCategory, self).__init__(name, *args, **kwargs)
+
+        match = Parameter._PARAM_NAME_COMPILER_MATCHER
+
+        for pname, item in items:
+
+            regex = match(pname)
+
+            if regex is None or regex.group() != pname:  # regex name
+                param = loader(item)
+                pname = param.name
+                Category.__setitem__(self, pname, param)
+
+            else:
+                self._pending[pname] = item
+
+            self._names.append(pname)
+
+    def _load(self, pname):
+        """Load a pending parameter."""
+
+        param = self._loader(self._pending.pop(pname))
+
+        Category.__setitem__(self, param.name, param)
+
+    def _loadall(self):
+        """Load all pending parameters and restore the raw order."""
+
+        for pname in list(self._pending):
+            self._load(pname)
+
+        names = set(self._names)
+
+        params = [
+            dict.__getitem__(self, pname) for pname in self._names
+            if dict.__contains__(self, pname)
+        ]
+        others = [
+            dict.__getitem__(self, pname)
+            for pname in OrderedDict.__iter__(self)
+            if pname not in names
+        ]
+
+        OrderedDict.clear(self)
+
+        for param in params + others:
+            OrderedDict.__setitem__(self, param.name, param)
+
+        self._names = []
+        self._oncontentchange()
+
+    def _new(self):
+
+        cls = type(self)
+
+        result = cls.__new__(cls)
+
+        # set attributes before initializing the content
+        result._loader = self._loader
+        result._pending = dict(self._pending)
+        result._names = list(self._names)
+
+        OrderedDict.__init__(result)
+
+        return result
+
+    def _clone(self, **kwargs):
+
+        result = ModelElement._clone(self, **kwargs)
+
+        for pname in OrderedDict.__iter__(self):  # copy only loaded params
+            param = dict.__getitem__(self, pname).copy()
+            OrderedDict.__setitem__(result, param.name, param)
+
+        return result
+
+    def _getmatcher(self):
+
+        result = self.__dict__.get('_matcher')
+
+        if result is None:
+            params = [
+                dict.__getitem__(self, pname)
+                for pname in OrderedDict.__iter__(self)
+            ]
+            result = self.__dict__['_matcher'] = ParamMatcher(params)
+
+        return result
+
+    def dirtyparams(self):
+
+        return [  # pending parameters are not dirty
+            dict.__getitem__(self, pname)
+            for pname in OrderedDict.__iter__(self)
+            if dict.__getitem__(self, pname).dirty
+        ]
+
+    def getparams(self, param):
+
+        name = param.name
+
+        if not isinstance(name, string_types):
+            self._loadall()
+
+        elif name in self._pending:
+            self._load(name)
+
+        return super(LazyCategory, self).getparams(param)
+
+    def __contains__(self, pname):
+
+        return pname in self._pending or Category.__contains__(self, pname)
+
+    def __getitem__(self, pname):
+
+        if pname in self._pending:
+            self._load(pname)
+
+        return Category.__getitem__(self, pname)
+
+    def get(self, pname, default=None):
+
+        if pname in self._pending:
+            self._load(pname)
+
+        return Category.get(self, pname, default)
+
+    def __setitem__(self, pname, param, *args, **kwargs):
+
+        self._pending.pop(pname, None)
+
+        Category.__setitem__(self, pname, param, *args, **kwargs)
+
+    def __delitem__(self, pname, *args, **kwargs):
+
+        if pname in self._pending:
+            self._load(pname)
+
+        Category.__delitem__(self, pname, *args, **kwargs)
+
+    def pop(self, pname, *args, **kwargs):
+
+        if pname in self._pending:
+            self._load(pname)
+
+        return Category.pop(self, pname, *args, **kwargs)
+
+    def setdefault(self, pname, *args, **kwargs):
+
+        if pname in self._pending:
+            self._load(pname)
+
+        return Category.setdefault(self, pname, *args, **kwargs)
+
+    def clear(self):
+
+        self._pending.clear()
+
+        Category.clear(self)
+
+    def __reduce__(self):
+        """Pickle this category such as a loaded Category without loader."""
+
+        if self._pending:
+            self._loadall()
+
+        slots = _allslots(Category)[0]
+
+        return _composite, (
+            Category,
+            [(slot, getattr(self, slot)) for slot in slots],
+            list(OrderedDict.items(self))
+        )
+
+# methods which need all parameters to be loaded
+for _name in (
+        '__iter__', '__reversed__', '__len__', 'keys', 'values', 'items',
+        'iterkeys', 'itervalues', 'iteritems', 'viewkeys', 'viewvalues',
+        'viewitems', 'popitem', '__repr__', 'fingerprint'
+):
+    if hasattr(Category, _name):
+        setattr(LazyCategory, _name, _loaded(getattr(Category, _name)))
+
+del _name
+
+
 def category(name, *params):
     """Quick instanciation of category with parameteres."""
 
@@ -48,6 +48,10 @@ class Configuration(CompositeModelElement):
         'safe', 'besteffort', 'scope'
     ) + CompositeModelElement.__slots__
 
+    ADDED = 'added'  #: added parameter names diff key.
+    REMOVED = 'removed'  #: removed parameter names diff key.
+    CHANGED = 'changed'  #: changed parameter names diff key.
+
     def __init__(
             self, safe=DEFAULT_SAFE, besteffort=DEFAULT_BESTEFFORT,
             scope=DEFAULT_SCOPE, *args, **kwargs
@@ -134,6 +138,68 @@ class Configuration(CompositeModelElement):
 
         return result
 
+    def diff(self, other):
+        """Get parameter differences from other configuration to this.
+
+        Categories and parameters with the same fingerprints are skipped.
+        Parameters are compared on their serialized values, therefore a
+        parameter with an expression which depends on a changed parameter is
+        not reported.
+
+        :param Configuration other: configuration to compare with this.
+        :return: differences by category name of categories which differ.
+            Differences are dictionaries of lists of parameter names by
+            Configuration.ADDED (parameters in this but not in other),
+            Configuration.REMOVED (parameters in other but not in this) and
+            Configuration.CHANGED (parameters in both with different
+            fingerprints).
+        :rtype: dict"""
+
+        result = {}
+
+        for cname, category in self.items():
+
+            ocategory = other.get(cname)
+
+            if ocategory is None:
+                added, removed, changed = list(category), [], []
+
+            elif category.fingerprint() == ocategory.fingerprint():
+                continue
+
+            else:
+                added, removed, changed = [], [], []
+
+                for pname, param in category.items():
+
+                    oparam = ocategory.get(pname)
+
+                    if oparam is None:
+                        added.append(pname)
+
+                    elif param.fingerprint() != oparam.fingerprint():
+                        changed.append(pname)
+
+                removed = [pname for pname in ocategory if pname not in category]
+
+            if added or removed or changed:
+                result[cname] = {
+                    Configuration.ADDED: added,
+                    Configuration.REMOVED: removed,
+                    Configuration.CHANGED: changed
+                }
+
+        for cname, ocategory in other.items():
+
+            if cname not in self and len(ocategory):
+                result[cname] = {
+                    Configuration.ADDED: [],
+                    Configuration.REMOVED: list(ocategory),
+                    Configuration.CHANGED: []
+                }
+
+        return result
+
 
 def configuration(*cats):
     """Quick instanciaton of Configuration with categories."""
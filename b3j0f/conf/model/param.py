@@ -28,25 +28,39 @@
 
 from __future__ import absolute_import
 
-__all__ = ['Parameter', 'PType', 'BOOL', 'Array', 'ARRAY']
+__all__ = ['Parameter', 'PType', 'BOOL', 'Array', 'ARRAY', 'NumArray']
 
-from .base import ModelElement
+from .base import ModelElement, _hash
 from ..parser.core import parse, serialize
 
 from parser import ParserError
 
-from six import string_types, reraise
+from six import string_types, text_type, reraise
 
 from re import compile as re_compile
 
 from collections import Iterable
 
+from inspect import isclass
+
+from array import array
+
+from itertools import islice
+
+from time import time
+
 from b3j0f.utils.path import lookup
 
 from ..parser.resolver.core import (
     DEFAULT_SAFE, DEFAULT_BESTEFFORT, DEFAULT_SCOPE
 )
 
+try:
+    import numpy
+
+except ImportError:
+    numpy = None
+
 
 class PType(object):
     """Dedicated to embed a specific type such as a parameter type in order to
@@ -58,15 +72,85 @@ class PType(object):
     - dict: it is given such as a kwargs to this ptype.
     - iterable: it is given such as an args to this ptype.
     - object: it is given such as the only one argument to this ptype.
+
+    The conversion of parsed values is done by a converter compiled once per
+    ptype instance (see the method ``__converter__``). Compiled converters are
+    not pickled, and they are compiled again after unpickling.
     """
 
-    __slots__ = ('ptype')
+    __slots__ = ('ptype', '_converter')
 
     def __init__(self, ptype, *args, **kwargs):
 
         super(PType, self).__init__(*args, **kwargs)
 
         self.ptype = ptype
+        self._converter = None
+
+    def __getstate__(self):
+        """Get a picklable state without compiled converters.
+
+        :rtype: dict"""
+
+        result = dict(getattr(self, '__dict__', {}))
+        result['ptype'] = self.ptype
+
+        return result
+
+    def __setstate__(self, state):
+        """Set a state given by the method __getstate__.
+
+        :param dict state: state to set."""
+
+        self._converter = None
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __converter__(self):
+        """Get the converter of parsed values to this ptype.
+
+        The converter is compiled at the first call and memoized.
+
+        :rtype: callable"""
+
+        result = self._converter
+
+        if result is None:
+            result = self._converter = self._compile()
+
+        return result
+
+    def _compile(self):
+        """Compile a converter of parsed values to this ptype.
+
+        Specialize this method in order to optimize the conversion of values.
+
+        :rtype: callable"""
+
+        if type(self).__instancecheck__ is PType.__instancecheck__:
+            ptypes = (PType, self.ptype)
+            instancecheck = lambda value: isinstance(value, ptypes)
+
+        else:
+            instancecheck = self.__instancecheck__
+
+        call = self.__call__
+
+        def converter(value):
+            """Convert input value to this ptype."""
+
+            if not instancecheck(value):
+
+                try:
+                    value = call(value)
+
+                except TypeError:
+                    pass
+
+            return value
+
+        return converter
 
     def __instancecheck__(self, instance):
         """Check instance such as this instance or self ptype instance."""
@@ -117,13 +201,29 @@ class PType(object):
 class _Bool(PType):
     """Parameter type dedicated to boolean values."""
 
+    TRUES = ('true', 'True', '1')  #: serialized true values.
+
     def __init__(self, *args, **kwargs):
 
         super(_Bool, self).__init__(ptype=bool, *args, **kwargs)
 
     def __call__(self, svalue):
 
-        return svalue in ('true', 'True', '1')
+        return svalue in _Bool.TRUES
+
+    def _compile(self):
+
+        ptypes, trues = (PType, bool), _Bool.TRUES
+
+        def converter(value):
+            """Convert input value to a bool."""
+
+            if not isinstance(value, ptypes):
+                value = value in trues
+
+            return value
+
+        return converter
 
 
 BOOL = _Bool()
@@ -133,33 +233,214 @@ class Array(PType):
     """Parameter type dedicated to array value with item type.
 
     For example, in using the Array(int) permits to convert the entry "2,3,4" to
-    [2,3,4] where items are integers."""
+    [2,3,4] where items are integers.
 
-    def __init__(self, ptype=object, *args, **kwargs):
+    Instance checks validate the type of array items. Such validation depends
+    on a validation mode:
+
+    - FULL (default): all items are checked at each validation.
+    - STAMP: like FULL, but immutable arrays (tuple, frozenset, read-only numpy
+        array) are checked once and stamped by identity.
+    - SAMPLE: like STAMP, but only a sample of items of mutable arrays is
+        checked.
+    - DEFERRED: like STAMP, but items of mutable arrays are not checked. The
+        method ``validate`` checks them on demand.
+
+    If instrument is True, validation statistics are available in the
+    attribute ``stats``."""
+
+    FULL = 'full'  #: full validation mode.
+    STAMP = 'stamp'  #: stamp validation mode.
+    SAMPLE = 'sample'  #: sample validation mode.
+    DEFERRED = 'deferred'  #: deferred validation mode.
+
+    DEFAULT_VALIDATION = FULL  #: default validation mode.
+    DEFAULT_SAMPLE = 16  #: default number of checked items in SAMPLE mode.
+    MAX_STAMPS = 256  #: maximal number of stamped arrays.
+
+    IMMUTABLES = (tuple, frozenset)  #: immutable array types.
+
+    def __init__(
+            self, ptype=object, validation=DEFAULT_VALIDATION,
+            sample=DEFAULT_SAMPLE, instrument=False, *args, **kwargs
+    ):
+        """
+        :param type ptype: item type.
+        :param str validation: validation mode (FULL by default).
+        :param int sample: number of checked items in the SAMPLE mode.
+        :param bool instrument: if True (False by default), record validation
+            statistics in the attribute stats."""
 
         super(Array, self).__init__(ptype=ptype, *args, **kwargs)
 
+        self._itemsconverter = None
+        self._stamps = {}
+
+        self.validation = validation
+        self.sample = sample
+        self.stats = None
+
+        if instrument:
+            self.resetstats()
+
+    def __getstate__(self):
+
+        result = super(Array, self).__getstate__()
+
+        del result['_itemsconverter']
+        del result['_stamps']  # identities are not kept by pickling
+
+        return result
+
+    def __setstate__(self, state):
+
+        self._itemsconverter = None
+        self._stamps = {}
+
+        super(Array, self).__setstate__(state)
+
+    def resetstats(self):
+        """Reset validation statistics.
+
+        Statistics are a dict with:
+
+        - count: number of validations.
+        - stamped: number of validations avoided thanks to stamps.
+        - items: number of checked items.
+        - time: total validation time in seconds."""
+
+        self.stats = {'count': 0, 'stamped': 0, 'items': 0, 'time': 0.}
+
     def __instancecheck__(self, instance):
         """Check instance such as this instance or self ptype instance."""
 
+        stats = self.stats
+
+        if stats is None:
+            result = self._instancecheck(instance)
+
+        else:
+            start = time()
+
+            try:
+                result = self._instancecheck(instance)
+
+            finally:
+                stats['count'] += 1
+                stats['time'] += time() - start
+
+        return result
+
+    def _instancecheck(self, instance):
+        """Check instance related to this validation mode."""
+
         result = isinstance(instance, Iterable) and not isinstance(
             instance, string_types
         )
 
         if result:
-            for item in instance:
-                result = isinstance(item, self.ptype)
 
-                if not result:
-                    raise ParserError(
-                        'Wrong item {0} ({1}) in {2}. {3} expected.'.format(
-                            item, type(item), instance, self.ptype
-                        )
-                    )
-                    break
+            if self.validation == Array.FULL:
+                self._checkitems(instance)
+
+            elif self._isimmutable(instance):
+
+                if self._stamps.get(id(instance)) is instance:
+                    if self.stats is not None:
+                        self.stats['stamped'] += 1
+
+                else:
+                    self.validate(instance)
+
+            elif self.validation == Array.SAMPLE:
+                self._checkitems(instance, items=self._sampleitems(instance))
+
+            elif self.validation != Array.DEFERRED:
+                self._checkitems(instance)
 
         return result
 
+    def validate(self, instance):
+        """Check all items of input array, and stamp it if it is immutable.
+
+        :param instance: array to validate.
+        :raises: ParserError if an item is not an instance of this ptype."""
+
+        self._checkitems(instance)
+
+        if self._isimmutable(instance):
+
+            stamps = self._stamps
+
+            if len(stamps) >= self.MAX_STAMPS:
+                stamps.clear()
+
+            stamps[id(instance)] = instance  # keep a reference to its id
+
+    def _isimmutable(self, instance):
+        """True iif input array items can not change."""
+
+        result = isinstance(instance, self.IMMUTABLES)
+
+        if not result and numpy is not None:
+            result = isinstance(instance, numpy.ndarray) and (
+                not instance.flags.writeable
+            )
+
+        return result
+
+    def _sampleitems(self, instance):
+        """Get a sample of array items.
+
+        :rtype: list"""
+
+        sample = self.sample
+
+        try:
+            size = len(instance)
+            instance[0:0]
+
+        except TypeError:  # not a sequence
+            result = list(islice(instance, sample))
+
+        else:
+            if size <= sample:
+                result = instance
+
+            else:
+                step = size // sample
+                result = [instance[index] for index in range(0, size, step)]
+                result.append(instance[-1])
+
+        return result
+
+    def _checkitems(self, instance, items=None):
+        """Check array items.
+
+        :param instance: array to check.
+        :param items: items to check. Default all instance items.
+        :raises: ParserError if an item is not an instance of this ptype."""
+
+        if items is None:
+            items = instance
+
+        ptype = self.ptype
+        count = 0
+
+        for item in items:
+
+            count += 1
+
+            if not isinstance(item, ptype):
+                raise ParserError(
+                    'Wrong item {0} ({1}) in {2}. {3} expected.'.format(
+                        item, type(item), instance, ptype
+                    )
+                )
+
+        if self.stats is not None:
+            self.stats['items'] += count
+
     def __subclasscheck__(self, subclass):
         """Check subclass such as this subclass or self ptype subclass."""
 
@@ -173,38 +454,207 @@ class Array(PType):
 
         if svalue:
 
-            for item in svalue.split(','):
+            items = [item.strip() for item in svalue.split(',')]
 
-                item = item.strip()
+            result = self._convertitems(items)
+
+        return result
 
-                if not isinstance(item, self.ptype):
+    def _convertitems(self, items):
+        """Convert a list of str items to a list of this ptype items.
 
-                    try:
-                        item = self.ptype(item)
+        :param list items: str items to convert.
+        :rtype: list
+        :raises: TypeError if an item can not be converted."""
 
-                    except (TypeError, ValueError):
+        itemsconverter = self._itemsconverter
 
-                        item = lookup(item)
+        if itemsconverter is None:
+            itemsconverter = self._itemsconverter = self._compileitems()
 
-                        if issubclass(item, self.ptype):
+        return itemsconverter(items)
 
-                            item = item()
+    def _compileitems(self):
+        """Compile a function which converts a list of str items to a list of
+        this ptype items.
 
-                if isinstance(item, self.ptype):
+        :rtype: callable"""
 
-                    result.append(item)
+        ptype = self.ptype
+        convertitem = self._convertitem
+
+        # str items are already converted
+        if isinstance('', ptype) and isinstance(text_type(), ptype):
+            result = list
+
+        elif isclass(ptype):
+
+            def result(items):
+                """Convert items in bulk, and one by one in case of error."""
+
+                try:
+                    converteditems = [ptype(item) for item in items]
+
+                except (TypeError, ValueError):
+                    converteditems = [convertitem(item) for item in items]
 
                 else:
-                    raise TypeError(
-                        'Wrong item type, {0} expected'.format(self.ptype)
-                    )
+                    if not all(
+                            isinstance(item, ptype) for item in converteditems
+                    ):
+                        raise TypeError(
+                            'Wrong item type, {0} expected'.format(ptype)
+                        )
+
+                return converteditems
+
+        else:
+
+            def result(items):
+                """Convert items one by one."""
+
+                return [convertitem(item) for item in items]
 
         return result
 
+    def _convertitem(self, item):
+        """Convert a str item to this ptype.
+
+        :param str item: item to convert.
+        :raises: TypeError if item can not be converted."""
+
+        if not isinstance(item, self.ptype):
+
+            try:
+                item = self.ptype(item)
+
+            except (TypeError, ValueError):
+
+                item = lookup(item)
+
+                if issubclass(item, self.ptype):
+
+                    item = item()
+
+        if not isinstance(item, self.ptype):
+            raise TypeError(
+                'Wrong item type, {0} expected'.format(self.ptype)
+            )
+
+        return item
+
 
 ARRAY = Array()  # default array
 
 
+class NumArray(Array):
+    """Parameter type dedicated to numeric array values.
+
+    Items are converted in bulk into a compact array.array, or into a numpy
+    array if numpy is importable and usenumpy is True.
+
+    Compact arrays are checked in O(1) with their typecode/dtype instead of
+    checking the type of all items.
+
+    For example, the NumArray(int) converts the entry "2,3,4" to
+    array('l', [2, 3, 4])."""
+
+    #: default typecodes by item type.
+    TYPECODES = {int: 'l', float: 'd'}
+
+    #: numpy dtype kinds by item type.
+    KINDS = {int: 'iu', float: 'f'}
+
+    def __init__(
+            self, ptype=float, typecode=None, usenumpy=True, *args, **kwargs
+    ):
+        """
+        :param type ptype: item type (int or float).
+        :param str typecode: array typecode. Default is related to the ptype.
+        :param bool usenumpy: if True (default), use a numpy array if numpy is
+            importable."""
+
+        super(NumArray, self).__init__(ptype=ptype, *args, **kwargs)
+
+        if typecode is None:
+
+            if ptype not in NumArray.TYPECODES:
+                raise TypeError(
+                    'Wrong item type {0}. {1} expected.'.format(
+                        ptype, list(NumArray.TYPECODES)
+                    )
+                )
+
+            typecode = NumArray.TYPECODES[ptype]
+
+        self.typecode = typecode
+        self.usenumpy = usenumpy and numpy is not None
+
+    def __instancecheck__(self, instance):
+
+        if isinstance(instance, array):
+            result = instance.typecode == self.typecode
+
+        elif numpy is not None and isinstance(instance, numpy.ndarray):
+            kinds = NumArray.KINDS.get(self.ptype)
+
+            if kinds is None:
+                result = instance.dtype.char == self.typecode
+
+            else:
+                result = instance.dtype.kind in kinds
+
+        else:
+            result = False
+
+        if not result:
+            result = super(NumArray, self).__instancecheck__(instance)
+
+        return result
+
+    def __call__(self, svalue):
+
+        if svalue:
+            result = self._convertitems(svalue.split(','))
+
+        else:
+            result = self._convertitems([])
+
+        return result
+
+    def _compileitems(self):
+
+        ptype, typecode = self.ptype, self.typecode
+
+        if self.usenumpy:
+            dtype = numpy.dtype(typecode)
+            compact = lambda items: numpy.array(items, dtype=dtype)
+
+        else:
+            compact = lambda items: array(typecode, items)
+
+        def result(items):
+            """Convert str items in one pass into a compact array."""
+
+            try:
+                items = list(map(ptype, items))
+
+            except (TypeError, ValueError):
+                raise ParserError(
+                    'Wrong item type in {0}, {1} expected'.format(items, ptype)
+                )
+
+            try:
+                converteditems = compact(items)
+
+            except OverflowError:  # items do not fit in the typecode
+                converteditems = items
+
+            return converteditems
+
+        return result
+
+
 class Parameter(ModelElement):
     """Parameter identified among a category by its name.
 
@@ -226,9 +676,12 @@ class Parameter(ModelElement):
 
     __slots__ = (
         '_name', 'ptype', 'parser', '_svalue', '_value', '_error', 'conf',
-        'local', 'scope', 'configurable', 'serializer', 'besteffort', 'safe'
+        'local', 'scope', 'configurable', 'serializer', 'besteffort', 'safe',
+        '_dirty'
     ) + ModelElement.__slots__
 
+    __transient__ = ('_dirty', )
+
     class Error(Exception):
         """Handle Parameter errors."""
 
@@ -239,6 +692,9 @@ class Parameter(ModelElement):
     _PARAM_NAME_COMPILER_MATCHER = re_compile(PARAM_NAME_REGEX).match
 
     DEFAULT_NAME = re_compile('.*')
+
+    MAX_NAMES = 1024  #: maximal number of cached names.
+    _NAMES = {}  #: cache of names or compiled regex names by string name.
     DEFAULT_PTYPE = None  #: default ptype.
     DEFAULT_LOCAL = True  #: default local value.
     DEFAULT_ERROR = None  #: default error value
@@ -278,6 +734,7 @@ class Parameter(ModelElement):
         super(Parameter, self).__init__(*args, **kwargs)
 
         # init protected attributes
+        self._dirty = True  # not persisted
         self._name = None
         self._value = value
         self._error = error
@@ -324,6 +781,27 @@ class Parameter(ModelElement):
 
         return result
 
+    def fingerprint(self):
+        """Get a fingerprint of this name, ptype, local flag and serialized
+        value, or value and value type if this serialized value is None.
+
+        Value types are fingerprinted because equal values can have the same
+        hash (1, 1.0 and True for example).
+
+        :rtype: int"""
+
+        name = getattr(self._name, 'pattern', self._name)
+
+        svalue = self._svalue
+        value = self._value if svalue is None else None
+
+        return hash(
+            (
+                name, svalue, type(value), _hash(value), _hash(self.ptype),
+                self.local
+            )
+        )
+
     def __hash__(self):
         """Get parameter hash value.
 
@@ -359,12 +837,44 @@ class Parameter(ModelElement):
 
         if isinstance(value, string_types):
 
-            match = Parameter._PARAM_NAME_COMPILER_MATCHER(value)
+            names = Parameter._NAMES
+
+            try:
+                value = names[value]
+
+            except KeyError:
 
-            if match is None or match.group() != value:
-                value = re_compile(value)
+                name = value
+
+                match = Parameter._PARAM_NAME_COMPILER_MATCHER(value)
+
+                if match is None or match.group() != value:
+                    value = re_compile(value)
+
+                if len(names) >= Parameter.MAX_NAMES:
+                    names.clear()
+
+                names[name] = value
 
         self._name = value
+        self._dirty = True
+
+    @property
+    def dirty(self):
+        """True iif this name or values changed since this has been read from
+        or written to a configuration resource.
+
+        :rtype: bool"""
+
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value):
+        """Change of dirty flag.
+
+        :param bool value: new dirty flag."""
+
+        self._dirty = value
 
     @property
     def conf_name(self):
@@ -412,6 +922,7 @@ class Parameter(ModelElement):
             self._error = None
 
         self._svalue = value  # set svalue
+        self._dirty = True
 
     def resolve(
             self,
@@ -464,7 +975,7 @@ class Parameter(ModelElement):
             if scope is None:
                 scope = self.scope
 
-            else:
+            elif self.scope is not None:
                 scope, selfscope = self.scope.copy(), scope
                 scope.update(selfscope)
 
@@ -534,6 +1045,10 @@ class Parameter(ModelElement):
                 self.ptype is None or isinstance(value, self.ptype)
         ):
             self._value = value
+            self._dirty = True
+
+            if value is not None:  # the serialized value is obsolete
+                self._svalue = None
 
         else:
             # raise wrong type error
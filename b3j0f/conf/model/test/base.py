@@ -72,6 +72,60 @@ class ModelElementTest(UTCase):
 
         self.assertTrue(me.cleaned)
 
+    def test_clone(self):
+        """Test to copy a model element without calling its constructor."""
+
+        me = ModelElementTest.TestME(name='test', cleaned=True)
+
+        cme = me.copy()
+
+        self.assertIsNot(cme, me)
+        self.assertEqual(cme.name, 'test')
+        self.assertTrue(cme.cleaned)
+        self.assertFalse(cme.local)
+
+        cme = me.copy(local=True)
+
+        self.assertEqual(cme.name, 'test')
+        self.assertTrue(cme.local)
+        self.assertFalse(me.local)
+
+    def test_noclone(self):
+        """Test to copy a model element with its constructor."""
+
+        class TestME(ModelElementTest.TestME):
+            """ModelElement which counts constructor calls."""
+
+            __slots__ = ModelElementTest.TestME.__slots__
+
+            __clone__ = False
+
+            count = 0
+
+            def __init__(self, *args, **kwargs):
+
+                super(TestME, self).__init__(*args, **kwargs)
+
+                TestME.count += 1
+
+        me = TestME(name='test')
+
+        cme = me.copy()
+
+        self.assertEqual(TestME.count, 2)
+        self.assertEqual(cme.name, 'test')
+
+    def test_clone_unset(self):
+        """Test to clone a model element with unset slots."""
+
+        me = ModelElementTest.TestME.__new__(ModelElementTest.TestME)
+        me.name = 'test'
+
+        cme = me.copy()
+
+        self.assertEqual(cme.name, 'test')
+        self.assertFalse(hasattr(cme, 'local'))
+
     def test_update(self):
         """Test the method update."""
 
@@ -476,5 +530,21 @@ class CompositeModelElementTest(UTCase):
         self.assertEqual(params['test'].local, 'local')
         self.assertEqual(params['test'].cleaned, 'cleaned')
 
+    def test_clone(self):
+        """Test to clone a composite model element."""
+
+        cme = self.cme.copy()
+
+        self.assertIsInstance(cme, CompositeModelElementTest.TestCME)
+        self.assertEqual(list(cme), list(self.cme))
+
+        for name in cme:
+            self.assertIsNot(cme[name], self.cme[name])
+            self.assertEqual(cme[name].name, self.cme[name].name)
+
+        del cme['0']
+
+        self.assertIn('0', self.cme)
+
 if __name__ == '__main__':
     main()
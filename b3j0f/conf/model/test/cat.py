@@ -29,10 +29,15 @@
 
 from unittest import main
 
+from copy import deepcopy
+
+from six.moves.cPickle import dumps, loads, HIGHEST_PROTOCOL
+
 from b3j0f.utils.ut import UTCase
 
-from ..cat import Category
+from ..cat import Category, ParamMatcher, LazyCategory
 from ..param import Parameter
+from ..conf import configuration
 
 
 class CategoryTest(UTCase):
@@ -53,6 +58,19 @@ class CategoryTest(UTCase):
 
         self.assertEqual(self.cat.name, self.name)
 
+    def test_pickle(self):
+
+        self.cat.local = False
+
+        cat = loads(dumps(self.cat, HIGHEST_PROTOCOL))
+
+        self.assertEqual(cat.name, self.name)
+        self.assertFalse(cat.local)
+        self.assertEqual(
+            [getattr(pname, 'pattern', pname) for pname in cat],
+            [getattr(pname, 'pattern', pname) for pname in self.cat]
+        )
+
     def test_getparams(self):
         """Test the method getparams."""
 
@@ -62,6 +80,196 @@ class CategoryTest(UTCase):
 
         self.assertEqual(len(self.name) - 1, len(params))
 
+    def test_getparams_order(self):
+        """Test that getparams respects the order of parameters."""
+
+        param = Parameter(self.name)
+
+        params = self.cat.getparams(param=param)
+
+        expected = [cparam for cparam in self.cat.values() if cparam == param]
+
+        self.assertEqual(params, expected)
+
+    def test_getparams_regex(self):
+        """Test the method getparams with a regex parameter."""
+
+        param = Parameter('^te.*')
+
+        params = self.cat.getparams(param=param)
+
+        expected = [cparam for cparam in self.cat.values() if cparam == param]
+
+        self.assertEqual(params, expected)
+        self.assertEqual(len(params), 3)
+
+    def test_getparams_update(self):
+        """Test that getparams takes care of content changes."""
+
+        param = Parameter(self.name)
+
+        self.assertEqual(len(self.cat.getparams(param)), len(self.name) - 1)
+
+        self.cat += Parameter(self.name)
+
+        self.assertEqual(len(self.cat.getparams(param)), len(self.name))
+
+        del self.cat[self.name]
+        self.cat.pop(Parameter('^t.*').name)
+
+        self.assertEqual(len(self.cat.getparams(param)), len(self.name) - 2)
+
+        self.cat.clear()
+
+        self.assertFalse(self.cat.getparams(param))
+
+
+class ParamMatcherTest(UTCase):
+    """Test the ParamMatcher class."""
+
+    def test_singles(self):
+        """Test regexes which can not be combined."""
+
+        params = [
+            Parameter('(a)b.*'), Parameter('(?i)AB.*'), Parameter('ab.*'),
+            Parameter('abc')
+        ]
+
+        matcher = ParamMatcher(params)
+
+        self.assertEqual(len(matcher.singles), 2)
+        self.assertEqual(matcher.match(Parameter('abc')), params)
+        self.assertEqual(matcher.match(Parameter('abd')), params[:3])
+        self.assertEqual(matcher.match(Parameter('bcd')), [])
+
+    def test_combined(self):
+        """Test several combined regexes."""
+
+        count = ParamMatcher.MAX_GROUPS * 2 + 1
+
+        params = [Parameter('p{0}.*'.format(i)) for i in range(count)]
+
+        matcher = ParamMatcher(params)
+
+        self.assertEqual(len(matcher.combined), 3)
+        self.assertFalse(matcher.singles)
+
+        # p1, p10-19 and p100-199 match with p1 names
+        self.assertEqual(
+            matcher.match(Parameter('p1')), [params[1]]
+        )
+        self.assertEqual(
+            matcher.match(Parameter('p123')),
+            [params[1], params[12], params[123]]
+        )
+
+
+class LazyCategoryTest(UTCase):
+    """Test the LazyCategory."""
+
+    def setUp(self):
+
+        self.loaded = []
+
+        self.cat = LazyCategory(
+            'test',
+            items=[
+                (pname, (pname, str(index)))
+                for index, pname in enumerate(['a', 'b', '^r.*', 'c'])
+            ],
+            loader=self._loader
+        )
+
+    def _loader(self, item):
+
+        self.loaded.append(item[0])
+
+        return Parameter(item[0], svalue=item[1])
+
+    def test_init(self):
+        """Test that only regex names are loaded at the construction."""
+
+        self.assertEqual(self.loaded, ['^r.*'])
+
+    def test_getitem(self):
+
+        self.assertIn('b', self.cat)
+        self.assertNotIn('d', self.cat)
+        self.assertEqual(self.loaded, ['^r.*'])
+
+        self.assertEqual(self.cat['b'].svalue, '1')
+        self.assertIsNone(self.cat.get('d'))
+        self.assertEqual(self.loaded, ['^r.*', 'b'])
+
+        self.assertRaises(KeyError, self.cat.__getitem__, 'd')
+
+    def test_getparams(self):
+
+        params = self.cat.getparams(Parameter('rc'))
+
+        self.assertEqual(len(params), 1)
+        self.assertEqual(self.loaded, ['^r.*'])
+
+        params = self.cat.getparams(Parameter('c'))
+
+        self.assertEqual(len(params), 1)
+        self.assertEqual(self.loaded, ['^r.*', 'c'])
+
+    def test_iter(self):
+        """Test that iteration loads all parameters in the raw order."""
+
+        self.cat['c'], self.cat['a']
+
+        names = [param.svalue for param in self.cat.values()]
+
+        self.assertEqual(names, ['0', '1', '2', '3'])
+        self.assertEqual(len(self.cat), 4)
+
+    def test_setitem(self):
+
+        self.cat['a'] = Parameter('a', svalue='4')
+        self.cat.pop('b')
+        self.cat['d'] = Parameter('d', svalue='5')
+
+        self.assertEqual(self.loaded, ['^r.*', 'b'])
+
+        names = [param.svalue for param in self.cat.values()]
+
+        self.assertEqual(names, ['4', '2', '3', '5'])
+
+    def test_copy(self):
+
+        self.cat['a']
+
+        cat = self.cat.copy()
+
+        self.assertEqual(self.loaded, ['^r.*', 'a'])
+        self.assertIsNot(cat['a'], self.cat['a'])
+        self.assertEqual(cat['b'].svalue, '1')
+        self.assertEqual(self.loaded, ['^r.*', 'a', 'b'])
+        self.assertEqual(len(cat), 4)
+
+    def test_pickle(self):
+        """Test to pickle a loaded category without its loader."""
+
+        conf = configuration(self.cat)
+
+        conf = loads(dumps(conf, HIGHEST_PROTOCOL))
+
+        cat = conf['test']
+
+        self.assertIs(type(cat), Category)
+        self.assertEqual(
+            [param.svalue for param in cat.values()], ['0', '1', '2', '3']
+        )
+
+    def test_deepcopy(self):
+
+        cat = deepcopy(self.cat)
+
+        self.assertEqual(cat['b'].svalue, '1')
+        self.assertEqual(len(cat), 4)
+
 
 if __name__ == '__main__':
     main()
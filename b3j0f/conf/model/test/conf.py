@@ -76,6 +76,69 @@ class ConfigurationTest(UTCase):
             for param in cat.values():
                 self.assertEqual(param.value, 1)
 
+    def test_fingerprint(self):
+        """Test the method fingerprint."""
+
+        conf = self.conf.copy()
+
+        self.assertEqual(conf.fingerprint(), self.conf.fingerprint())
+
+        cat = conf['4']
+
+        self.assertEqual(cat.fingerprint(), self.conf['4'].fingerprint())
+
+        cat['p40'].svalue = '=1'
+
+        self.assertNotEqual(cat.fingerprint(), self.conf['4'].fingerprint())
+        self.assertNotEqual(conf.fingerprint(), self.conf.fingerprint())
+        self.assertEqual(conf['3'].fingerprint(), self.conf['3'].fingerprint())
+
+        del conf['4']
+
+        self.assertNotEqual(conf.fingerprint(), self.conf.fingerprint())
+
+    def test_diff(self):
+        """Test the method diff."""
+
+        conf = self.conf.copy()
+
+        self.assertEqual(conf.diff(self.conf), {})
+
+        conf['4']['p40'].svalue = '=1'
+        conf['4'] += Parameter('new')
+        del conf['3']['p30']
+        del conf['2']
+        conf += Category('new', melts=[Parameter('new')])
+        conf += Category('empty')
+
+        diff = conf.diff(self.conf)
+
+        self.assertEqual(
+            diff,
+            {
+                '4': {
+                    Configuration.ADDED: ['new'],
+                    Configuration.REMOVED: [],
+                    Configuration.CHANGED: ['p40']
+                },
+                '3': {
+                    Configuration.ADDED: [],
+                    Configuration.REMOVED: ['p30'],
+                    Configuration.CHANGED: []
+                },
+                '2': {
+                    Configuration.ADDED: [],
+                    Configuration.REMOVED: ['p20', 'p21'],
+                    Configuration.CHANGED: []
+                },
+                'new': {
+                    Configuration.ADDED: ['new'],
+                    Configuration.REMOVED: [],
+                    Configuration.CHANGED: []
+                }
+            }
+        )
+
     def test_params(self):
         """Test the params property."""
 
@@ -35,7 +35,11 @@ from six import string_types
 
 from b3j0f.utils.ut import UTCase
 
-from ..param import Parameter, PType, BOOL, ARRAY, Array
+from ..param import Parameter, PType, BOOL, ARRAY, Array, NumArray, numpy
+
+from array import array
+
+from unittest import skipIf
 from parser import ParserError
 
 
@@ -191,6 +195,173 @@ class ArrayTest(UTCase):
         )
         self.assertIsInstance(param.value, ptype)
 
+    def test_full(self):
+        """Test the full validation mode."""
+
+        ptype = Array(ptype=int, instrument=True)
+
+        value = (1, 2, 3)
+
+        self.assertIsInstance(value, ptype)
+        self.assertIsInstance(value, ptype)
+        self.assertEqual(ptype.stats['count'], 2)
+        self.assertEqual(ptype.stats['stamped'], 0)
+        self.assertEqual(ptype.stats['items'], 6)
+
+        self.assertRaises(ParserError, isinstance, [1, 'a'], ptype)
+
+    def test_stamp(self):
+        """Test the stamp validation mode."""
+
+        ptype = Array(ptype=int, validation=Array.STAMP, instrument=True)
+
+        value = tuple(range(10))
+
+        self.assertIsInstance(value, ptype)
+        self.assertIsInstance(value, ptype)
+        self.assertEqual(ptype.stats['count'], 2)
+        self.assertEqual(ptype.stats['stamped'], 1)
+        self.assertEqual(ptype.stats['items'], 10)
+        self.assertGreaterEqual(ptype.stats['time'], 0)
+
+        # mutable arrays are fully checked
+        self.assertIsInstance(list(value), ptype)
+        self.assertEqual(ptype.stats['items'], 20)
+
+        self.assertRaises(ParserError, isinstance, (1, 'a'), ptype)
+        self.assertRaises(ParserError, isinstance, (1, 'a'), ptype)
+
+    def test_stamps_limit(self):
+        """Test to clear stamps when they are too numerous."""
+
+        ptype = Array(ptype=int, validation=Array.STAMP)
+        ptype.MAX_STAMPS = 2
+
+        values = [(index,) for index in range(3)]
+
+        for value in values:
+            self.assertIsInstance(value, ptype)
+
+        self.assertEqual(len(ptype._stamps), 1)
+
+    def test_sample(self):
+        """Test the sample validation mode."""
+
+        ptype = Array(
+            ptype=int, validation=Array.SAMPLE, sample=4, instrument=True
+        )
+
+        value = list(range(100))
+
+        self.assertIsInstance(value, ptype)
+        self.assertEqual(ptype.stats['items'], 5)
+
+        value[-1] = 'a'
+        self.assertRaises(ParserError, isinstance, value, ptype)
+
+        self.assertIsInstance(iter(range(100)), ptype)
+
+    def test_deferred(self):
+        """Test the deferred validation mode."""
+
+        ptype = Array(ptype=int, validation=Array.DEFERRED)
+
+        value = [1, 'a']
+
+        self.assertIsInstance(value, ptype)
+        self.assertRaises(ParserError, ptype.validate, value)
+
+        self.assertRaises(ParserError, isinstance, (1, 'a'), ptype)
+
+    def test_parameter(self):
+        """Test to reassign a stamped value to a parameter."""
+
+        ptype = Array(ptype=int, validation=Array.STAMP, instrument=True)
+
+        value = tuple(range(1000))
+
+        param = Parameter(name='test', ptype=ptype, value=value)
+        param.value = value
+
+        self.assertIs(param.value, value)
+        self.assertEqual(ptype.stats['items'], 1000)
+
+
+class NumArrayTest(UTCase):
+    """Test the NumArray class."""
+
+    def test_int(self):
+        """Test to convert a value to a compact array of integers."""
+
+        ptype = NumArray(int, usenumpy=False)
+
+        param = Parameter(svalue='1, 2,3', ptype=ptype)
+
+        self.assertIsInstance(param.value, array)
+        self.assertEqual(param.value.typecode, 'l')
+        self.assertEqual(param.value.tolist(), [1, 2, 3])
+        self.assertIsInstance(param.value, ptype)
+
+    def test_float(self):
+        """Test to convert a value to a compact array of floats."""
+
+        ptype = NumArray(usenumpy=False)
+
+        param = Parameter(svalue='1,2.5', ptype=ptype)
+
+        self.assertEqual(param.value.typecode, 'd')
+        self.assertEqual(param.value.tolist(), [1., 2.5])
+
+    def test_empty(self):
+        """Test to convert an empty value."""
+
+        param = Parameter(svalue='', ptype=NumArray(usenumpy=False))
+
+        self.assertEqual(len(param.value), 0)
+
+    def test_error(self):
+        """Test to convert a wrong value."""
+
+        param = Parameter(svalue='1,a', ptype=NumArray(int))
+
+        self.assertRaises(Parameter.Error, getattr, param, 'value')
+
+    def test_wrong_ptype(self):
+        """Test to instanciate a NumArray with a non numeric type."""
+
+        self.assertRaises(TypeError, NumArray, str)
+
+    def test_isinstance(self):
+        """Test to check instances."""
+
+        ptype = NumArray(int)
+
+        self.assertIsInstance(array('l', [1]), ptype)
+        self.assertIsInstance([1, 2], ptype)
+        self.assertNotIsInstance('1', ptype)
+        self.assertRaises(ParserError, isinstance, array('d', [1.5]), ptype)
+
+    def test_value(self):
+        """Test to set a compact array value."""
+
+        param = Parameter(ptype=NumArray(float))
+
+        param.value = array('d', range(1000))
+
+        self.assertEqual(len(param.value), 1000)
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        """Test to convert a value to a numpy array."""
+
+        ptype = NumArray(int)
+
+        param = Parameter(svalue='1,2', ptype=ptype)
+
+        self.assertIsInstance(param.value, numpy.ndarray)
+        self.assertEqual(param.value.tolist(), [1, 2])
+        self.assertIsInstance(param.value, ptype)
+
 
 class ParameterTest(UTCase):
     """Test a parameter."""
@@ -260,6 +431,46 @@ class ParameterTest(UTCase):
 
         self.assertEqual(cparamrepr, paramrepr)
 
+    def test_name_cache(self):
+        """Test that regex names are compiled once."""
+
+        param = Parameter('te.*')
+        cparam = Parameter('te.*')
+
+        self.assertIs(param.name, cparam.name)
+        self.assertEqual(Parameter('test').name, 'test')
+
+    def test_fingerprint(self):
+        """Test the method fingerprint."""
+
+        param = Parameter('te.*', svalue='1', local=False)
+        cparam = param.copy()
+
+        self.assertEqual(param.fingerprint(), cparam.fingerprint())
+
+        cparam.local = True
+
+        self.assertNotEqual(param.fingerprint(), cparam.fingerprint())
+
+        param = Parameter('test', value=[1])
+        cparam = Parameter('test', value=[1])
+
+        self.assertEqual(param.fingerprint(), cparam.fingerprint())
+
+        cparam.value = [2]
+
+        self.assertNotEqual(param.fingerprint(), cparam.fingerprint())
+
+        param = Parameter('test', value=1)
+
+        for value in (1.0, True):
+            cparam = Parameter('test', value=value)
+            self.assertNotEqual(param.fingerprint(), cparam.fingerprint())
+
+        cparam = Parameter('test', value=1, ptype=float)
+
+        self.assertNotEqual(param.fingerprint(), cparam.fingerprint())
+
     def test_conf_name(self):
         """Test the method conf_name."""
 
@@ -310,6 +521,35 @@ class ParameterTest(UTCase):
         self.assertIsNone(self.param._value)
         self.assertIsNone(self.param._error)
 
+    def test_value_svalue(self):
+        """Test that setting a value makes the serialized value obsolete."""
+
+        self.param.svalue = '1'
+        self.param.value = 2
+
+        self.assertEqual(Parameter('b', svalue=self.param.svalue).value, 2)
+
+    def test_dirty(self):
+        """Test the dirty flag."""
+
+        self.assertTrue(self.param.dirty)
+
+        self.param.dirty = False
+
+        self.param.svalue = '=1'
+        self.assertTrue(self.param.dirty)
+
+        self.param.dirty = False
+
+        self.param.resolve()
+        self.assertFalse(self.param.dirty)
+        self.assertFalse(self.param.copy().dirty)
+
+        self.param.value = 2
+        self.assertTrue(self.param.dirty)
+        self.assertTrue(self.param.copy().dirty)
+        self.assertNotIn('dirty', repr(self.param))
+
     def test_value(self):
         """Test the property value."""
 
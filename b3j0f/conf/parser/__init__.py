@@ -1,8 +1,10 @@
 
 __all__ = [
     'parse', 'serialize',
-    'resolve', 'ExprResolver', 'register', 'names'
+    'resolve', 'ExprResolver', 'register', 'names',
+    'ConverterRegistry', 'getconverter'
 ]
 
 from .core import parse, serialize
 from .resolver import resolve, ExprResolver, names, register
+from .converter import ConverterRegistry, getconverter
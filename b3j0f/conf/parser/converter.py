@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""Parameter value converter module.
+
+A converter is a function which takes in parameter a parsed value and returns
+it casted to a parameter type (ptype):
+
+- the value is returned as is if it is already an instance of ptype.
+- otherwise, it is given to the ptype constructor.
+- if the ptype constructor raises a TypeError, the value is returned as is.
+
+Converters are compiled once per ptype and cached in a registry, in order to
+avoid type introspection at each parameter resolution.
+
+A ptype can provide its own specialized converter in implementing the method
+``__converter__`` (see the class PType). Such converters are not cached by the
+registry because they are memoized by their ptype.
+"""
+
+__all__ = [
+    'ConverterRegistry', 'getconverter', 'register', 'unregister',
+    'compileconverter'
+]
+
+from inspect import isclass
+
+__CONVERTER__ = '__converter__'  #: ptype converter method name.
+
+
+def _identity(value):
+    """Converter of values which do not need to be casted."""
+
+    return value
+
+
+def compileconverter(ptype):
+    """Compile a converter dedicated to input ptype.
+
+    :param ptype: parameter type. A class, a tuple of classes or a callable.
+    :return: function which takes in parameter a value and returns it casted to
+        ptype.
+    :rtype: callable"""
+
+    result = None
+
+    if ptype is None or ptype is object:  # all values are instance of object
+        result = _identity
+
+    elif isinstance(ptype, tuple):  # a tuple of classes is not callable
+        result = _identity
+
+    elif not isclass(ptype) and hasattr(ptype, __CONVERTER__):
+        result = getattr(ptype, __CONVERTER__)()
+
+    else:
+
+        def result(value, _ptype=ptype):
+            """Cast input value to the ptype."""
+
+            if not isinstance(value, _ptype):
+
+                try:
+                    value = _ptype(value)
+
+                except TypeError:
+                    pass
+
+            return value
+
+    return result
+
+
+class ConverterRegistry(dict):
+    """Converter registry by ptype.
+
+    Missing converters are compiled on first use."""
+
+    __slots__ = ()
+
+    def __missing__(self, ptype):
+
+        result = compileconverter(ptype)
+
+        # specialized converters are memoized by their ptype
+        if isclass(ptype) or not hasattr(ptype, __CONVERTER__):
+            self[ptype] = result
+
+        return result
+
+    def convert(self, value, ptype):
+        """Convert input value to input ptype.
+
+        :param value: value to convert.
+        :param ptype: parameter type.
+        :return: converted value."""
+
+        converter = self.getconverter(ptype)
+
+        return converter(value)
+
+    def getconverter(self, ptype):
+        """Get converter related to input ptype.
+
+        :param ptype: parameter type.
+        :rtype: callable"""
+
+        try:
+            result = self[ptype]
+
+        except TypeError:  # unhashable ptype
+            result = compileconverter(ptype)
+
+        return result
+
+_CONVERTER_REGISTRY = ConverterRegistry()  #: default registry
+
+
+def getconverter(ptype, reg=None):
+    """Get converter related to input ptype.
+
+    :param ptype: parameter type.
+    :param ConverterRegistry reg: registry to use. Default is the global
+        registry.
+    :rtype: callable"""
+
+    if reg is None:
+        reg = _CONVERTER_REGISTRY
+
+    return reg.getconverter(ptype)
+
+
+def register(ptype, converter=None, reg=None):
+    """Register a specific converter for input ptype.
+
+    Can be used such as a decorator.
+
+    .. code-block:: python
+
+        @register(MyType)
+        def myconverter(value):
+            return MyType.fromvalue(value)
+
+    :param ptype: parameter type.
+    :param callable converter: function which takes in parameter a value and
+        returns it casted to ptype.
+    :param ConverterRegistry reg: registry to use. Default is the global
+        registry.
+    :return: converter or a decorator if converter is None."""
+
+    if reg is None:
+        reg = _CONVERTER_REGISTRY
+
+    def _register(converter):
+        """Local registration for better use in a decoration context."""
+
+        reg[ptype] = converter
+
+        return converter
+
+    if converter is None:
+        result = _register
+
+    else:
+        result = _register(converter)
+
+    return result
+
+
+def unregister(ptype, reg=None):
+    """Unregister the converter of input ptype.
+
+    :param ptype: parameter type.
+    :param ConverterRegistry reg: registry to use. Default is the global
+        registry.
+    :return: unregistered converter or None if it does not exist."""
+
+    if reg is None:
+        reg = _CONVERTER_REGISTRY
+
+    return reg.pop(ptype, None)
@@ -159,15 +159,13 @@ from re import compile as re_compile
 
 from six import string_types
 
-from collections import Iterable
-
 from .resolver.core import DEFAULT_BESTEFFORT, DEFAULT_SAFE, DEFAULT_SCOPE
 
 from .resolver.registry import resolve
 
-from parser import ParserError
+from .converter import getconverter
 
-from json import loads
+from parser import ParserError
 
 
 #: _ref parameter.
@@ -219,9 +217,6 @@ def parse(
 
     result = None
 
-    if ptype is None:
-        ptype = object
-
     compilation = REGEX_EXPR.match(svalue)
 
     _scope = {} if scope is None else scope.copy()
@@ -242,12 +237,9 @@ def parse(
         )
 
     # try to cast value in ptype
-    if not isinstance(result, ptype):
-        try:
-            result = ptype(result)
+    converter = getconverter(ptype)
 
-        except TypeError:
-            result = result
+    result = converter(result)
 
     return result
 
@@ -282,7 +274,7 @@ def _exprparser(
 
 
 def _strparser(
-        svalue, safe=DEFAULT_SAFE, ptype=None, scope=DEFAULT_SCOPE,
+        svalue, safe=DEFAULT_SAFE, scope=DEFAULT_SCOPE,
         configurable=None, conf=None, besteffort=DEFAULT_BESTEFFORT
 ):
 
@@ -293,24 +285,6 @@ def _strparser(
         ), svalue
     )
 
-    if ptype is None:
-        ptype = str
-
-    if not issubclass(ptype, string_types):
-
-        if issubclass(ptype, bool):
-            result = result in ('1', 'True', 'true')
-
-        elif issubclass(ptype, dict):
-            result = loads(result)
-
-        elif issubclass(ptype, Iterable):
-            if result:
-                result = ptype((item.strip() for item in result.split(',')))
-
-            else:
-                result = ptype()
-
     return result
 
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2015 Jonathan Labéjof <jonathan.labejof@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# --------------------------------------------------------------------
+
+"""converter UTs."""
+
+from unittest import main
+
+from b3j0f.utils.ut import UTCase
+
+from six import string_types
+
+from ...model.param import Array, BOOL
+from ..converter import (
+    ConverterRegistry, getconverter, register, unregister, compileconverter
+)
+
+
+class CompileConverterTest(UTCase):
+    """Test the function compileconverter."""
+
+    def test_object(self):
+        """Test to compile an object converter."""
+
+        converter = compileconverter(object)
+
+        value = []
+
+        self.assertIs(converter(value), value)
+
+    def test_tuple(self):
+        """Test to compile a tuple of types converter."""
+
+        converter = compileconverter(string_types)
+
+        self.assertEqual(converter(1), 1)
+
+    def test_type(self):
+        """Test to compile a type converter."""
+
+        converter = compileconverter(int)
+
+        self.assertEqual(converter('1'), 1)
+        self.assertEqual(converter(None), None)  # TypeError is ignored
+        self.assertRaises(ValueError, converter, 'a')
+
+    def test_ptype(self):
+        """Test to compile a PType converter."""
+
+        converter = compileconverter(BOOL)
+
+        self.assertIs(converter, compileconverter(BOOL))
+        self.assertTrue(converter('true'))
+        self.assertFalse(converter('false'))
+        self.assertFalse(converter(False))
+
+    def test_array(self):
+        """Test to compile an Array converter."""
+
+        ptype = Array(int)
+
+        converter = compileconverter(ptype)
+
+        self.assertEqual(converter('1, 2'), [1, 2])
+        self.assertEqual(converter([3]), [3])
+
+
+class ConverterRegistryTest(UTCase):
+    """Test the ConverterRegistry."""
+
+    def setUp(self):
+
+        self.registry = ConverterRegistry()
+
+    def test_getconverter(self):
+        """Test to get a converter."""
+
+        converter = self.registry.getconverter(int)
+
+        self.assertIn(int, self.registry)
+        self.assertIs(converter, self.registry.getconverter(int))
+
+    def test_getconverter_ptype(self):
+        """Test to get a PType converter which is not registered."""
+
+        ptype = Array(int)
+
+        converter = self.registry.getconverter(ptype)
+
+        self.assertNotIn(ptype, self.registry)
+        self.assertIs(converter, self.registry.getconverter(ptype))
+
+    def test_convert(self):
+        """Test the method convert."""
+
+        self.assertEqual(self.registry.convert('1', float), 1.)
+
+    def test_register(self):
+        """Test to register a specific converter."""
+
+        register(int, lambda value: 0, reg=self.registry)
+
+        self.assertEqual(getconverter(int, reg=self.registry)('1'), 0)
+
+        unregister(int, reg=self.registry)
+
+        self.assertEqual(getconverter(int, reg=self.registry)('1'), 1)
+
+    def test_register_decorator(self):
+        """Test to register a specific converter with a decorator."""
+
+        @register(float, reg=self.registry)
+        def converter(value):
+            return 0.
+
+        self.assertIs(getconverter(float, reg=self.registry), converter)
+
+
+if __name__ == '__main__':
+    main()
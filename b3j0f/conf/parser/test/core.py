@@ -33,7 +33,7 @@ from b3j0f.utils.ut import UTCase
 
 from ...model.conf import Configuration, configuration
 from ...model.cat import category
-from ...model.param import Parameter
+from ...model.param import Parameter, Array, BOOL
 from ..core import (
     REGEX_REF, REGEX_FORMAT, REGEX_STR, REGEX_EXPR,
     parse, serialize, _ref, ParserError, _strparser
@@ -344,33 +344,33 @@ class StrParserTest(UTCase):
 
     def test_bool(self):
 
-        val = _strparser(svalue='0', ptype=bool)
+        val = parse(svalue='0', ptype=BOOL)
 
         self.assertIs(val, False)
 
-        val = _strparser(svalue='1', ptype=bool)
+        val = parse(svalue='1', ptype=BOOL)
 
         self.assertIs(val, True)
 
-        val = _strparser(svalue='true', ptype=bool)
+        val = parse(svalue='true', ptype=BOOL)
 
         self.assertIs(val, True)
 
-        val = _strparser(svalue='True', ptype=bool)
+        val = parse(svalue='True', ptype=BOOL)
 
         self.assertIs(val, True)
 
     def test_list(self):
 
-        val = _strparser(svalue='1', ptype=list)
+        val = parse(svalue='1', ptype=Array(str))
 
         self.assertEqual(val, ['1'])
 
-        val = _strparser(svalue='', ptype=list)
+        val = parse(svalue='', ptype=Array(str))
 
         self.assertFalse(val)
 
-        val = _strparser(svalue='1, 2, 3', ptype=list)
+        val = parse(svalue='1, 2, 3', ptype=Array(str))
 
         self.assertEqual(val, ['1', '2', '3'])
 